@@ -0,0 +1,91 @@
+"""Artifact cleanup cost: full directory scan vs the SQLite artifact index.
+
+Fills a temporary store with ``--incidents`` incidents (keyframe, sidecar
+and clip each, spread over several days and streams) and times:
+
+* ``scan``: the old ``cleanup_old`` approach, globbing every file, calling
+  ``stat()`` on each and sorting the full list, once per cleanup;
+* ``evict``: ``LocalStorage.enforce_quota`` removing the oldest incidents
+  one at a time, as it does after each new incident;
+* ``range`` / ``incident``: index lookups by time range and by incident.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from bushfire_ai.storage.local_store import LocalStorage
+from bushfire_ai.utils.benchmark import measure
+
+START = 1_700_000_000.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare directory-scan cleanup with indexed eviction")
+    parser.add_argument("--incidents", type=int, default=5000, help="Incidents in the store")
+    parser.add_argument("--streams", type=int, default=4, help="Streams the incidents are spread over")
+    parser.add_argument("--evictions", type=int, default=200, help="Incidents evicted one by one")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def fill(storage: LocalStorage, incidents: int, streams: int) -> None:
+    for index in range(incidents):
+        incident = storage.new_incident(START + index * 60.0, f"cam{index % streams}")
+        paths = []
+        for suffix in (".jpg", ".json", ".mp4"):
+            path = incident.stem.with_name(incident.stem.name + suffix)
+            path.write_bytes(b"\0" * 64)
+            paths.append(path)
+        storage.save_paths(*paths, incident=incident)
+
+
+def scan_cleanup(base_dir: Path) -> List[Path]:
+    """The listing ``cleanup_old`` used to build before deleting anything past ``max_items``."""
+
+    files = (path for path in base_dir.rglob("*") if path.is_file())
+    return sorted(files, key=lambda path: path.stat().st_mtime, reverse=True)
+
+
+def main() -> None:
+    args = parse_args()
+    logger.disable("bushfire_ai")
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = LocalStorage(Path(tmp))
+        fill(storage, args.incidents, args.streams)
+
+        results.append(measure("scan", lambda: scan_cleanup(Path(tmp)), calls=5).to_dict())
+        incident_id = storage.incidents_between(START, START + 3600.0)[0].incident_id
+        results.append(
+            measure("range", lambda: storage.incidents_between(START, START + 3600.0), calls=200).to_dict()
+        )
+        results.append(measure("incident", lambda: storage.incident_files(incident_id), calls=200).to_dict())
+
+        storage.max_incidents = storage.incident_count
+        started = time.perf_counter()
+        for _ in range(args.evictions):
+            storage.max_incidents -= 1
+            storage.enforce_quota()
+        seconds = time.perf_counter() - started
+        results.append({"name": "evict", "calls": args.evictions, "mean_ms": seconds / args.evictions * 1000.0})
+        storage.close()
+
+    logger.enable("bushfire_ai")
+    for row in results:
+        milliseconds = row.get("p50_ms", row.get("mean_ms"))
+        logger.info("{:>8}: {:8.3f} ms per call ({} incidents)", row["name"], milliseconds, args.incidents)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
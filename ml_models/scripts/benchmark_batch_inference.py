@@ -0,0 +1,65 @@
+"""Compare per-frame throughput of FireDetectionModel at several batch sizes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from loguru import logger
+
+from bushfire_ai.detector.fire_detector import FireDetectionModel
+from bushfire_ai.utils.benchmark import measure, synthetic_frames
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark batched fire detection inference")
+    parser.add_argument("--weights", default="models/fire_yolov8n.pt", help="Path to YOLO weights")
+    parser.add_argument("--device", default=None, help="Device spec (e.g., 'cpu', 'cuda:0')")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8], help="Batch sizes to compare")
+    parser.add_argument("--frames", type=int, default=32, help="Frames processed per batch size")
+    parser.add_argument("--width", type=int, default=1280, help="Synthetic frame width")
+    parser.add_argument("--height", type=int, default=720, help="Synthetic frame height")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    detector = FireDetectionModel(
+        weights_path=Path(args.weights),
+        confidence_threshold=0.25,
+        iou_threshold=0.5,
+        max_detections=20,
+        device=args.device,
+    )
+    frames = synthetic_frames(args.frames, args.width, args.height)
+
+    results = []
+    for batch_size in args.batch_sizes:
+        batches = [frames[i : i + batch_size] for i in range(0, len(frames) - batch_size + 1, batch_size)]
+
+        def run_all() -> None:
+            for batch in batches:
+                detector.predict_batch(batch)
+
+        stats = measure(f"batch_{batch_size}", run_all, calls=3, items_per_call=len(batches) * batch_size)
+        results.append({"batch_size": batch_size, **stats.to_dict()})
+        logger.info(
+            "batch={:<2d} {:7.2f} ms/frame  {:6.1f} frames/s",
+            batch_size,
+            stats.ms_per_item,
+            stats.items_per_second,
+        )
+
+    baseline = results[0]["ms_per_item"]
+    for row in results:
+        logger.info("batch={:<2d} speedup x{:.2f}", row["batch_size"], baseline / row["ms_per_item"])
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
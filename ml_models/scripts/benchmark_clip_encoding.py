@@ -0,0 +1,110 @@
+"""Encode time and file size of event clips, cv2 mp4v vs ffmpeg H.264/H.265.
+
+Frames come from ``--video`` when given (real footage compresses very
+differently from noise), otherwise from synthetic terrain frames. Each
+configuration encodes the same frames into a temporary file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.pipeline.clip_encoder import ClipEncoder, FfmpegClipEncoder, OpenCvClipEncoder, find_ffmpeg
+from bushfire_ai.utils.benchmark import synthetic_frames
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark clip encoders")
+    parser.add_argument("--video", default=None, help="Read frames from this video instead of synthetic ones")
+    parser.add_argument("--frames", type=int, default=150, help="Frames per clip")
+    parser.add_argument("--width", type=int, default=1280, help="Synthetic frame width")
+    parser.add_argument("--height", type=int, default=720, help="Synthetic frame height")
+    parser.add_argument("--fps", type=float, default=15.0, help="Clip frame rate")
+    parser.add_argument("--codecs", nargs="+", choices=["h264", "h265"], default=["h264", "h265"])
+    parser.add_argument("--presets", nargs="+", default=["ultrafast", "veryfast", "medium"])
+    parser.add_argument("--crf", type=int, nargs="+", default=[23, 28, 32])
+    parser.add_argument("--max-width", type=int, default=None, help="Downscale wider clips (ffmpeg only)")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def load_frames(args: argparse.Namespace) -> List[np.ndarray]:
+    if not args.video:
+        return synthetic_frames(args.frames, args.width, args.height)
+    capture = cv2.VideoCapture(args.video)
+    frames: List[np.ndarray] = []
+    while len(frames) < args.frames:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(frame)
+    capture.release()
+    if not frames:
+        raise SystemExit(f"Could not read frames from {args.video}")
+    return frames
+
+
+def encode(encoder: ClipEncoder, frames: List[np.ndarray], fps: float, path: Path) -> Dict[str, Any]:
+    height, width = frames[0].shape[:2]
+    started = time.perf_counter()
+    writer = encoder.open(path, width, height, fps)
+    for frame in frames:
+        writer.write(frame)
+    writer.close()
+    seconds = time.perf_counter() - started
+    return {
+        "seconds": seconds,
+        "fps": len(frames) / seconds,
+        "size_kb": path.stat().st_size / 1024.0,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    frames = load_frames(args)
+    height, width = frames[0].shape[:2]
+    logger.info("Encoding {} frames of {}x{} at {:g} fps", len(frames), width, height, args.fps)
+
+    configurations: List[Dict[str, Any]] = [{"encoder": OpenCvClipEncoder(), "codec": "mp4v"}]
+    if find_ffmpeg() is None:
+        logger.warning("ffmpeg not found; only measuring cv2.VideoWriter")
+    else:
+        for codec in args.codecs:
+            for preset in args.presets:
+                for crf in args.crf:
+                    encoder = FfmpegClipEncoder(codec, preset, crf, max_width=args.max_width)
+                    configurations.append({"encoder": encoder, "codec": codec, "preset": preset, "crf": crf})
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bushfire_clips_") as tmp:
+        for index, configuration in enumerate(configurations):
+            encoder = configuration.pop("encoder")
+            row = {"backend": encoder.name, **configuration}
+            row.update(encode(encoder, frames, args.fps, Path(tmp) / f"clip_{index}.mp4"))
+            results.append(row)
+            logger.info(
+                "{:<7} {:<5} {:<10} crf {:>4}: {:7.1f} fps, {:8.1f} KiB",
+                row["backend"],
+                row["codec"],
+                row.get("preset", "-"),
+                row.get("crf", "-"),
+                row["fps"],
+                row["size_kb"],
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Decode CPU per hour of footage, decoding every frame vs grab-only skipping.
+
+Reads a video through ``VideoSource`` once per decode rate and reports the
+process CPU time (all decoder threads included) scaled to one hour of
+footage. ``all`` is the old behaviour of retrieving every frame; the other
+rates retrieve only the frames the pipeline needs (the larger of
+``FIRE_INFER_FPS`` and the clip frame rate) and ``grab`` the rest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from bushfire_ai.pipeline.video_source import VideoSource
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure decode CPU with and without grab-only skipping")
+    parser.add_argument("--video", required=True, help="Video file to decode")
+    parser.add_argument(
+        "--decode-fps",
+        nargs="+",
+        default=["all", "15", "5", "2"],
+        help="Decode rates to compare ('all' decodes every frame)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the video per rate")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def decode_pass(video: str, decode_fps: Optional[float]) -> Dict[str, float]:
+    source = VideoSource(video, decode_fps=decode_fps)
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    last_pts = 0.0
+    decoded = 0
+    with source.stream() as frames:
+        for frame in frames:
+            decoded += 1
+            last_pts = frame.media_time
+    return {
+        "cpu_seconds": time.process_time() - cpu_started,
+        "wall_seconds": time.perf_counter() - wall_started,
+        "media_seconds": last_pts,
+        "decoded": decoded,
+        "grabbed": source.grabbed_frames,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    logger.disable("bushfire_ai")
+    results: List[Dict[str, Any]] = []
+    for rate in args.decode_fps:
+        decode_fps = None if rate == "all" else float(rate)
+        passes = [decode_pass(args.video, decode_fps) for _ in range(args.repeat)]
+        cpu = sum(entry["cpu_seconds"] for entry in passes)
+        media = sum(entry["media_seconds"] for entry in passes)
+        row = {
+            "decode_fps": rate,
+            "decoded_frames": passes[0]["decoded"],
+            "grabbed_frames": passes[0]["grabbed"],
+            "cpu_seconds": cpu,
+            "cpu_seconds_per_hour": cpu / media * 3600.0 if media else 0.0,
+            "realtime_factor": media / sum(entry["wall_seconds"] for entry in passes),
+        }
+        results.append(row)
+        logger.info(
+            "decode {:>4}: {:5d} decoded / {:5d} grabbed, {:7.1f} CPU s per hour of footage, {:6.1f}x real time",
+            rate,
+            row["decoded_frames"],
+            row["grabbed_frames"],
+            row["cpu_seconds_per_hour"],
+            row["realtime_factor"],
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Microbenchmarks for the detection pipeline's hot paths at several resolutions.
+
+Runs fully offline on synthetic frames. Without ``--weights`` a small
+randomly initialised YOLOv8n is generated, so inference timings are real
+even though no fires are found. Results are written as JSON; with
+``--baseline`` the run is compared against an earlier results file and the
+script exits non-zero when any component's p50 regressed beyond
+``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.fire_detector import DetectionResult, FireDetectionModel, extract_detections
+from bushfire_ai.pipeline.event_accumulator import EventAccumulator
+from bushfire_ai.pipeline.video_source import Frame, VideoSource
+from bushfire_ai.utils.benchmark import TimingStats, environment_info, find_regressions, measure, synthetic_frames
+
+
+COMPONENTS = [
+    "video_decode",
+    "predict",
+    "result_extraction",
+    "draw_detections",
+    "accumulator_add_frame",
+    "keyframe_write",
+    "clip_encode",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline components on synthetic frames")
+    parser.add_argument(
+        "--resolutions",
+        nargs="+",
+        default=["640x360", "1280x720", "1920x1080"],
+        help="Frame sizes as WIDTHxHEIGHT",
+    )
+    parser.add_argument("--components", nargs="+", choices=COMPONENTS, default=COMPONENTS)
+    parser.add_argument("--frames", type=int, default=30, help="Frames per measurement")
+    parser.add_argument("--calls", type=int, default=5, help="Timed repetitions per component")
+    parser.add_argument("--weights", default=None, help="Model weights; a tiny random YOLOv8n is generated if omitted")
+    parser.add_argument("--backend", default="ultralytics", choices=["ultralytics", "onnxruntime", "openvino"])
+    parser.add_argument("--output", default=None, help="JSON file for the results")
+    parser.add_argument("--baseline", default=None, help="Earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 slowdown vs the baseline")
+    return parser.parse_args()
+
+
+def parse_resolution(value: str) -> Tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def generate_test_model(workdir: Path) -> Path:
+    """Save a randomly initialised YOLOv8n built from the bundled config (no download)."""
+
+    from ultralytics import YOLO  # type: ignore
+
+    path = workdir / "bench_yolov8n.pt"
+    YOLO("yolov8n.yaml").save(str(path))
+    return path
+
+
+def synthetic_detection(width: int, height: int, count: int = 20, seed: int = 0) -> DetectionResult:
+    rng = np.random.default_rng(seed)
+    x1 = rng.uniform(0, width * 0.8, count)
+    y1 = rng.uniform(0, height * 0.8, count)
+    boxes = np.stack([x1, y1, x1 + width * 0.1, y1 + height * 0.1], axis=1)
+    return DetectionResult(
+        boxes=boxes,
+        confidences=rng.uniform(0.3, 0.99, count),
+        class_ids=np.zeros(count, dtype=np.int32),
+        names={0: "fire"},
+    )
+
+
+def write_test_video(path: Path, frames: List[np.ndarray], fps: float = 15.0) -> Path:
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def run_resolution(
+    width: int,
+    height: int,
+    args: argparse.Namespace,
+    detector: Optional[FireDetectionModel],
+    workdir: Path,
+) -> List[TimingStats]:
+    frames = synthetic_frames(args.frames, width, height)
+    wrapped = [
+        Frame(data=frame, timestamp=index / 15.0, index=index, pts=index / 15.0) for index, frame in enumerate(frames)
+    ]
+    detection = synthetic_detection(width, height)
+    suffix = f"@{width}x{height}"
+    selected = set(args.components)
+    results: List[TimingStats] = []
+
+    def bench(name: str, fn, items: int) -> None:
+        if name in selected:
+            results.append(measure(name + suffix, fn, calls=args.calls, items_per_call=items))
+
+    if "video_decode" in selected:
+        video_path = write_test_video(workdir / f"bench_{width}x{height}.avi", frames)
+
+        def decode() -> None:
+            with VideoSource(str(video_path)).stream() as stream:
+                for _ in stream:
+                    pass
+
+        bench("video_decode", decode, len(frames))
+
+    if detector is not None:
+        bench("predict", lambda: [detector.predict(frame) for frame in frames], len(frames))
+
+    rows = np.concatenate(
+        [detection.boxes, detection.confidences[:, None], detection.class_ids[:, None].astype(np.float32)], axis=1
+    )
+    bench("result_extraction", lambda: [extract_detections(rows, {0: "fire"}) for _ in range(100)], 100)
+    bench(
+        "draw_detections",
+        lambda: [FireDetectionModel.draw_detections(frame, detection) for frame in frames],
+        len(frames),
+    )
+
+    accumulator = EventAccumulator(
+        artifact_dir=workdir / f"artifacts_{width}x{height}",
+        pre_event_seconds=2.0,
+        post_event_seconds=2.0,
+        clip_fps=15.0,
+        buffer_max_width=1280,
+    )
+
+    def add_frames() -> None:
+        accumulator.buffer.clear()
+        for frame in wrapped:
+            accumulator.add_frame(frame)
+
+    bench("accumulator_add_frame", add_frames, len(wrapped))
+    add_frames()
+    bench("keyframe_write", lambda: accumulator._write_keyframe(wrapped[-1], 0.0, detection), 1)
+    snapshot = accumulator.snapshot()
+    clip_path = accumulator.artifact_dir / "fire_0.mp4"
+    bench("clip_encode", lambda: accumulator._write_clip(snapshot, clip_path), len(snapshot))
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    results: List[Dict[str, Any]] = []
+    logger.disable("bushfire_ai")  # per-iteration open/close logs would dominate the timings
+    with tempfile.TemporaryDirectory(prefix="bushfire_bench_") as tmp:
+        workdir = Path(tmp)
+        detector: Optional[FireDetectionModel] = None
+        if "predict" in args.components:
+            weights = Path(args.weights) if args.weights else generate_test_model(workdir)
+            detector = FireDetectionModel(
+                weights_path=weights,
+                confidence_threshold=0.25,
+                iou_threshold=0.5,
+                max_detections=20,
+                backend=args.backend,
+            )
+
+        for resolution in args.resolutions:
+            width, height = parse_resolution(resolution)
+            for stats in run_resolution(width, height, args, detector, workdir):
+                results.append(stats.to_dict())
+                logger.info(
+                    "{:<32} p50 {:8.2f} ms  p95 {:8.2f} ms  {:8.3f} ms/item",
+                    stats.name,
+                    stats.p50_ms,
+                    stats.p95_ms,
+                    stats.ms_per_item,
+                )
+
+    report = {"environment": environment_info(), "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for entry in regressions:
+            logger.error(
+                "{} regressed: p50 {:.2f} ms -> {:.2f} ms (x{:.2f})",
+                entry["name"],
+                entry["baseline"],
+                entry["current"],
+                entry["ratio"],
+            )
+        if regressions:
+            sys.exit(1)
+        logger.success("No regressions beyond {:.0%} against {}", args.tolerance, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Preprocessing time and transient memory: per-frame letterbox vs reused buffers.
+
+``per_frame`` is the old path of the exported-model backends: ``letterbox``
+allocates a canvas (and a resized copy) per frame, ``np.stack`` copies the
+canvases into a batch and ``to_blob`` allocates the float blob twice.
+``buffers`` letterboxes into ``LetterboxBuffers``, which resizes each frame
+straight into a preallocated slot and normalizes into a preallocated blob.
+Peak bytes are the largest transient NumPy/OpenCV allocation during one
+batch, as seen by ``tracemalloc``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.postprocess import LetterboxBuffers, letterbox, to_blob
+from bushfire_ai.utils.benchmark import measure, synthetic_frames
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare per-frame letterboxing with preallocated buffers")
+    parser.add_argument("--resolutions", nargs="+", default=["1280x720", "1920x1080"], help="WIDTHxHEIGHT")
+    parser.add_argument("--imgsz", type=int, default=640, help="Model input size")
+    parser.add_argument("--batch", type=int, default=4, help="Frames per batch")
+    parser.add_argument("--stride", type=int, default=32, help="Canvas stride (0 for a square canvas)")
+    parser.add_argument("--calls", type=int, default=20, help="Timed batches per variant")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def peak_bytes(fn: Callable[[], Any]) -> int:
+    fn()  # allocate any persistent buffers before measuring
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    args = parse_args()
+    stride = args.stride or None
+    results: List[Dict[str, Any]] = []
+    for resolution in args.resolutions:
+        width, _, height = resolution.lower().partition("x")
+        frames: Sequence[np.ndarray] = synthetic_frames(args.batch, int(width), int(height))
+        buffers = LetterboxBuffers(args.imgsz, stride)
+
+        def per_frame() -> np.ndarray:
+            return to_blob(np.stack([letterbox(frame, args.imgsz, stride)[0] for frame in frames]))
+
+        def reused() -> np.ndarray:
+            return buffers(frames)[0]
+
+        np.testing.assert_allclose(per_frame(), reused(), atol=1e-6)
+        for name, fn in (("per_frame", per_frame), ("buffers", reused)):
+            stats = measure(f"{name}@{resolution}", fn, calls=args.calls, items_per_call=args.batch)
+            row = {**stats.to_dict(), "peak_bytes_per_batch": peak_bytes(fn)}
+            results.append(row)
+            logger.info(
+                "{:>9} @ {}: {:6.2f} ms/frame, {:8.2f} MB transient per batch of {}",
+                name,
+                resolution,
+                row["ms_per_item"],
+                row["peak_bytes_per_batch"] / 1e6,
+                args.batch,
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Detection throughput against the number of inference worker processes.
+
+``0`` workers runs ``FireDetectionModel`` in this process, one frame at a
+time. ``N`` workers run it in a ``ProcessDetectorPool`` fed the way the
+orchestrator feeds it: ``predict_batch`` on batches of
+``max(--batch-size, N)`` frames (``inference_batch_size``). Only the first
+result from each worker (its warm-up) is excluded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from bushfire_ai.detector.fire_detector import FireDetectionModel
+from bushfire_ai.detector.process_pool import ProcessDetectorPool
+from bushfire_ai.utils.benchmark import synthetic_frames
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark process-pool inference by worker count")
+    parser.add_argument("--weights", default="models/fire_yolov8n.pt", help="Path to model weights or export")
+    parser.add_argument("--backend", default="ultralytics", choices=["ultralytics", "onnxruntime", "openvino"])
+    parser.add_argument("--imgsz", type=int, default=640, help="Model input size")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--batch-size", type=int, default=1, help="FIRE_BATCH_SIZE; raised to the worker count")
+    parser.add_argument("--frames", type=int, default=64, help="Frames per measurement")
+    parser.add_argument("--width", type=int, default=1280, help="Synthetic frame width")
+    parser.add_argument("--height", type=int, default=720, help="Synthetic frame height")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def run_in_process(detector: FireDetectionModel, frames: List[Any]) -> float:
+    detector.predict(frames[0])
+    started = time.perf_counter()
+    for frame in frames:
+        detector.predict(frame)
+    return time.perf_counter() - started
+
+
+def run_pool(pool: ProcessDetectorPool, frames: List[Any], batch_size: int) -> float:
+    pool.predict_batch(frames[: pool.workers])
+    started = time.perf_counter()
+    for start in range(0, len(frames), batch_size):
+        pool.predict_batch(frames[start : start + batch_size])
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    args = parse_args()
+    factory = partial(
+        FireDetectionModel,
+        weights_path=Path(args.weights),
+        confidence_threshold=0.25,
+        iou_threshold=0.5,
+        max_detections=100,
+        backend=args.backend,
+        imgsz=args.imgsz,
+    )
+    frames = synthetic_frames(args.frames, args.width, args.height)
+
+    results: List[Dict[str, Any]] = []
+    for workers in args.workers:
+        if workers == 0:
+            seconds = run_in_process(factory(), frames)
+        else:
+            pool = ProcessDetectorPool(factory, workers=workers)
+            try:
+                seconds = run_pool(pool, frames, max(args.batch_size, workers))
+            finally:
+                pool.close()
+        row = {"workers": workers, "seconds": seconds, "fps": len(frames) / seconds}
+        row["speedup"] = row["fps"] / results[0]["fps"] if results else 1.0
+        results.append(row)
+        logger.info("{} workers: {:7.1f} frames/s ({:.2f}x)", workers, row["fps"], row["speedup"])
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
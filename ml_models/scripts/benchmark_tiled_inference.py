@@ -0,0 +1,78 @@
+"""Compare throughput of full-frame and tiled detection on high-resolution frames."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from bushfire_ai.detector.fire_detector import FireDetectionModel
+from bushfire_ai.detector.tiling import TiledInference
+from bushfire_ai.utils.benchmark import measure, synthetic_frames
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark tiled vs full-frame fire detection")
+    parser.add_argument("--weights", default="models/fire_yolov8n.pt", help="Path to model weights or export")
+    parser.add_argument("--backend", default="ultralytics", choices=["ultralytics", "onnxruntime", "openvino"])
+    parser.add_argument("--device", default=None, help="Device spec (e.g., 'cpu', 'cuda:0')")
+    parser.add_argument("--frames", type=int, default=4, help="Frames per measurement")
+    parser.add_argument("--width", type=int, default=3840, help="Synthetic frame width")
+    parser.add_argument("--height", type=int, default=2160, help="Synthetic frame height")
+    parser.add_argument("--tile-size", type=int, default=640, help="Tile edge in pixels")
+    parser.add_argument("--overlap", type=float, default=0.2, help="Tile overlap fraction")
+    parser.add_argument("--prefilter-confidence", type=float, default=0.05, help="Prefilter threshold for tiles")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    detector = FireDetectionModel(
+        weights_path=Path(args.weights),
+        confidence_threshold=0.25,
+        iou_threshold=0.5,
+        max_detections=100,
+        device=args.device,
+        backend=args.backend,
+    )
+    frames = synthetic_frames(args.frames, args.width, args.height)
+
+    modes: Dict[str, Optional[TiledInference]] = {
+        "full_frame": None,
+        "tiled": TiledInference(args.tile_size, args.overlap, full_frame=True),
+        "tiled_prefilter": TiledInference(
+            args.tile_size, args.overlap, full_frame=True, prefilter_confidence=args.prefilter_confidence
+        ),
+    }
+
+    results = []
+    for name, tiler in modes.items():
+        detector.tiler = tiler
+        stats = measure(name, lambda: detector.predict_batch(frames), calls=3, warmup=1, items_per_call=len(frames))
+        row = {"mode": name, **stats.to_dict()}
+        if tiler is not None:
+            row["tiles_per_frame"] = tiler.tiles_run / ((stats.calls + 1) * len(frames))  # includes the warmup call
+        results.append(row)
+        logger.info(
+            "{:<16} {:8.1f} ms/frame  {:6.2f} frames/s  tiles/frame {}",
+            name,
+            stats.ms_per_item,
+            stats.items_per_second,
+            f"{row['tiles_per_frame']:.1f}" if tiler is not None else "-",
+        )
+
+    baseline = results[0]["ms_per_item"]
+    for row in results[1:]:
+        logger.info("{:<16} cost x{:.2f} vs full frame", row["mode"], row["ms_per_item"] / baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
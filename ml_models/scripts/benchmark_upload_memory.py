@@ -0,0 +1,134 @@
+"""Peak RSS of incident uploads for growing clip sizes, buffered vs streamed.
+
+Each upload runs in a fresh process against a local sink server that
+discards the request body, and reports how much its peak RSS grew during
+the upload. ``buffered`` reproduces the former ``Path.read_bytes()``
+upload; ``streamed`` is ``CamaraClient.upload_incident``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure upload peak RSS against clip size")
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[4, 16, 64], help="Clip sizes to upload")
+    parser.add_argument("--modes", nargs="+", choices=["buffered", "streamed"], default=["buffered", "streamed"])
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    return parser.parse_args()
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+        payload = {"access_token": "sink", "expires_in": 3600} if self.path == "/token" else {"incidentId": "sink"}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0  # KiB on Linux
+
+
+def upload_once(mode: str, server: str, frame: str, clip: str, results: Any) -> None:
+    import httpx
+
+    from bushfire_ai.config.settings import CamaraConfig
+    from bushfire_ai.integrations.camara_client import CamaraClient
+
+    config = CamaraConfig(
+        base_url=server,
+        upload_url=f"{server}/incidents",
+        token_url=f"{server}/token",
+        client_id="bench",
+        client_secret="bench",
+        offline=False,
+        http2=False,
+    )
+
+    async def buffered() -> None:
+        async with httpx.AsyncClient() as http:
+            files = {
+                "metadata": (None, json.dumps({"confidence": 0.9}), "application/json"),
+                "frame": (Path(frame).name, Path(frame).read_bytes(), "image/jpeg"),
+                "clip": (Path(clip).name, Path(clip).read_bytes(), "video/mp4"),
+            }
+            response = await http.post(config.upload_url.unicode_string(), files=files)
+            response.raise_for_status()
+
+    async def streamed() -> None:
+        client = CamaraClient(config)
+        try:
+            await client.upload_incident({"confidence": 0.9}, Path(frame), Path(clip), progress=lambda *_: None)
+        finally:
+            await client.close()
+
+    before = peak_rss_mb()
+    started = time.perf_counter()
+    asyncio.run(buffered() if mode == "buffered" else streamed())
+    results.put({"seconds": time.perf_counter() - started, "rss_growth_mb": peak_rss_mb() - before})
+
+
+def main() -> None:
+    args = parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    context = multiprocessing.get_context("spawn")
+    rows: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(prefix="bushfire_upload_") as tmp:
+        frame = Path(tmp) / "frame.jpg"
+        frame.write_bytes(b"\xff\xd8" + bytes(200_000))
+        for size in args.sizes_mb:
+            clip = Path(tmp) / f"clip_{size}mb.mp4"
+            with clip.open("wb") as handle:
+                for _ in range(size):
+                    handle.write(bytes(1 << 20))
+            for mode in args.modes:
+                results = context.Queue()
+                process = context.Process(target=upload_once, args=(mode, url, str(frame), str(clip), results))
+                process.start()
+                row = {"mode": mode, "clip_mb": size, **results.get(timeout=300)}
+                process.join()
+                rows.append(row)
+                logger.info(
+                    "{:<8} {:>4} MB clip: peak RSS +{:6.1f} MB, {:6.2f} s",
+                    mode,
+                    size,
+                    row["rss_growth_mb"],
+                    row["seconds"],
+                )
+
+    server.shutdown()
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2))
+        logger.success("Wrote results to {}", args.output)
+
+
+if __name__ == "__main__":
+    main()
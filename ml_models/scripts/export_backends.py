@@ -0,0 +1,101 @@
+"""Export fire detector weights for the CPU backends and check they agree with PyTorch.
+
+Exports ``--weights`` to ONNX (dynamic batch) and/or OpenVINO, runs every
+backend on the same frames from a reference video (or synthetic frames when
+no video is given) and reports detection agreement and per-frame latency.
+Exits non-zero when any backend's agreement F1 falls below ``--min-agreement``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.backends import create_backend
+from bushfire_ai.detector.evaluation import agreement
+from bushfire_ai.detector.quantization import load_frames
+from bushfire_ai.utils.benchmark import measure, synthetic_frames
+
+
+EXPORT_BACKENDS = {"onnx": "onnxruntime", "openvino": "openvino"}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export detector weights and verify backend parity")
+    parser.add_argument("--weights", default="models/fire_yolov8n.pt", help="Path to YOLO .pt weights")
+    parser.add_argument("--formats", nargs="+", choices=sorted(EXPORT_BACKENDS), default=["onnx", "openvino"])
+    parser.add_argument("--imgsz", type=int, default=640, help="Export and inference image size")
+    parser.add_argument("--video", default=None, help="Reference video; synthetic frames are used when omitted")
+    parser.add_argument("--frames", type=int, default=60, help="Number of reference frames to compare")
+    parser.add_argument("--conf", type=float, default=0.25, help="Confidence threshold used for the comparison")
+    parser.add_argument("--iou", type=float, default=0.5, help="Box IoU counted as agreement")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="Minimum F1 agreement with PyTorch")
+    parser.add_argument("--skip-export", action="store_true", help="Reuse existing exports next to the weights")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the report")
+    return parser.parse_args()
+
+
+def export_weights(weights: Path, fmt: str, imgsz: int) -> Path:
+    from ultralytics import YOLO  # type: ignore
+
+    logger.info("Exporting {} to {}", weights, fmt)
+    exported = YOLO(str(weights)).export(format=fmt, imgsz=imgsz, dynamic=fmt == "onnx", simplify=fmt == "onnx")
+    return Path(exported)
+
+
+def exported_path(weights: Path, fmt: str) -> Path:
+    if fmt == "onnx":
+        return weights.with_suffix(".onnx")
+    return weights.parent / f"{weights.stem}_openvino_model"
+
+
+def main() -> None:
+    args = parse_args()
+    weights = Path(args.weights)
+    frames = load_frames(Path(args.video), args.frames) if args.video else synthetic_frames(args.frames, 1280, 720)
+
+    targets = {"ultralytics": weights}
+    for fmt in args.formats:
+        targets[EXPORT_BACKENDS[fmt]] = exported_path(weights, fmt) if args.skip_export else export_weights(
+            weights, fmt, args.imgsz
+        )
+
+    report: Dict[str, Dict[str, float]] = {}
+    reference: List[np.ndarray] = []
+    for name, path in targets.items():
+        backend = create_backend(name, path, imgsz=args.imgsz)
+        outputs = [backend.infer([frame], args.conf, 0.5, 20)[0] for frame in frames]
+        stats = measure(name, lambda: [backend.infer([frame], args.conf, 0.5, 20) for frame in frames], calls=3)
+        row: Dict[str, float] = {"ms_per_frame": stats.total_seconds * 1000.0 / (stats.calls * len(frames))}
+        if name == "ultralytics":
+            reference = outputs
+        else:
+            row.update(agreement(reference, outputs, args.iou))
+        report[name] = row
+        logger.info("{:<12} {}", name, json.dumps(row))
+
+    baseline = report["ultralytics"]["ms_per_frame"]
+    failed = []
+    for name, row in report.items():
+        if name == "ultralytics":
+            continue
+        logger.info("{:<12} speedup x{:.2f}  agreement F1 {:.3f}", name, baseline / row["ms_per_frame"], row["f1"])
+        if row["f1"] < args.min_agreement:
+            failed.append(name)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        logger.success("Wrote report to {}", args.output)
+    if failed:
+        logger.error("Backends below agreement threshold {}: {}", args.min_agreement, ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Build the INT8 fast-profile model and report its accuracy/speed trade-off.
+
+Exports ``--weights`` to ONNX (unless an ``.onnx`` file is given), calibrates
+an INT8 model on frames from ``--calibration`` (a video, a directory such as
+``videos/`` or a dataset YAML), then times FP32 and INT8 at every
+``--imgsz`` and compares their detections with FP32 at the first size.
+When ``--eval`` is a dataset YAML with labels, precision/recall against the
+ground truth is reported too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.backends import OnnxRuntimeBackend
+from bushfire_ai.detector.evaluation import agreement
+from bushfire_ai.detector.quantization import dataset_images, int8_weights_path, label_path, load_frames, quantize_onnx
+from bushfire_ai.utils.benchmark import measure
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Quantize the fire detector to INT8 and compare it with FP32")
+    parser.add_argument("--weights", default="models/fire_yolov8n.pt", help="YOLO .pt weights or an FP32 .onnx export")
+    parser.add_argument("--calibration", default="videos", help="Video, directory or dataset YAML for calibration")
+    parser.add_argument("--calibration-frames", type=int, default=200, help="Frames used for calibration")
+    parser.add_argument("--eval", default=None, help="Video, directory or dataset YAML for the report")
+    parser.add_argument("--eval-frames", type=int, default=100, help="Frames used for the report")
+    parser.add_argument("--imgsz", type=int, nargs="+", default=[640, 480, 416, 320], help="Input sizes to compare")
+    parser.add_argument("--conf", type=float, default=0.25, help="Confidence threshold for the comparison")
+    parser.add_argument("--int8-output", default=None, help="INT8 model path (default <weights stem>_int8.onnx)")
+    parser.add_argument("--skip-quantize", action="store_true", help="Reuse an existing INT8 model")
+    parser.add_argument("--report", default=None, help="Optional JSON file for the report")
+    return parser.parse_args()
+
+
+def fp32_onnx(weights: Path, imgsz: int) -> Path:
+    if weights.suffix == ".onnx":
+        return weights
+    from ultralytics import YOLO  # type: ignore
+
+    logger.info("Exporting {} to ONNX", weights)
+    return Path(YOLO(str(weights)).export(format="onnx", imgsz=imgsz, dynamic=True, simplify=True))
+
+
+def load_ground_truth(data_yaml: Path, count: int) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """Evenly sampled dataset images with their YOLO labels as ``x1, y1, x2, y2, 1, cls`` rows."""
+
+    images = dataset_images(data_yaml)
+    step = max(1, len(images) // count)
+    frames: List[np.ndarray] = []
+    truths: List[np.ndarray] = []
+    for image_path in images[::step][:count]:
+        frame = cv2.imread(str(image_path))
+        if frame is None:
+            continue
+        height, width = frame.shape[:2]
+        rows = np.zeros((0, 6), dtype=np.float32)
+        labels = label_path(image_path)
+        if labels.exists() and labels.stat().st_size:
+            raw = np.loadtxt(labels, ndmin=2, dtype=np.float32)
+            rows = np.empty((raw.shape[0], 6), dtype=np.float32)
+            rows[:, 0] = (raw[:, 1] - raw[:, 3] / 2) * width
+            rows[:, 1] = (raw[:, 2] - raw[:, 4] / 2) * height
+            rows[:, 2] = (raw[:, 1] + raw[:, 3] / 2) * width
+            rows[:, 3] = (raw[:, 2] + raw[:, 4] / 2) * height
+            rows[:, 4] = 1.0
+            rows[:, 5] = raw[:, 0]
+        frames.append(frame)
+        truths.append(rows)
+    return frames, truths
+
+
+def main() -> None:
+    args = parse_args()
+    weights = Path(args.weights)
+    reference_size = args.imgsz[0]
+    fp32_path = fp32_onnx(weights, reference_size)
+    int8_path = Path(args.int8_output) if args.int8_output else int8_weights_path(weights)
+
+    if not args.skip_quantize:
+        calibration = load_frames(Path(args.calibration), args.calibration_frames)
+        quantize_onnx(fp32_path, int8_path, calibration, imgsz=reference_size)
+
+    eval_source = Path(args.eval or args.calibration)
+    truths: Optional[List[np.ndarray]] = None
+    if eval_source.suffix.lower() in {".yaml", ".yml"}:
+        frames, truths = load_ground_truth(eval_source, args.eval_frames)
+    else:
+        frames = load_frames(eval_source, args.eval_frames)
+    logger.info("Evaluating on {} frames from {}", len(frames), eval_source)
+
+    rows: List[Dict[str, Any]] = []
+    reference: List[np.ndarray] = []
+    for imgsz in args.imgsz:
+        for precision, path in (("fp32", fp32_path), ("int8", int8_path)):
+            backend = OnnxRuntimeBackend(path, imgsz=imgsz)
+            outputs = [backend.infer([frame], args.conf, 0.5, 20)[0] for frame in frames]
+            stats = measure(
+                f"{precision}_{imgsz}",
+                lambda: [backend.infer([frame], args.conf, 0.5, 20) for frame in frames],
+                calls=3,
+                items_per_call=len(frames),
+            )
+            if not reference:
+                reference = outputs
+            row: Dict[str, Any] = {"precision": precision, "imgsz": imgsz, "ms_per_frame": stats.ms_per_item}
+            row["agreement_f1"] = agreement(reference, outputs)["f1"]
+            if truths is not None:
+                scores = agreement(truths, outputs)
+                row.update(precision_gt=scores["precision"], recall_gt=scores["recall"], f1_gt=scores["f1"])
+            rows.append(row)
+
+    baseline = rows[0]["ms_per_frame"]
+    for row in rows:
+        row["speedup"] = baseline / row["ms_per_frame"]
+        ground_truth = f"  GT F1 {row['f1_gt']:.3f}" if "f1_gt" in row else ""
+        logger.info(
+            "{:<4} {:>4}px {:7.2f} ms/frame  x{:.2f}  agreement F1 {:.3f}{}",
+            row["precision"],
+            row["imgsz"],
+            row["ms_per_frame"],
+            row["speedup"],
+            row["agreement_f1"],
+            ground_truth,
+        )
+
+    if args.report:
+        Path(args.report).write_text(json.dumps({"fp32": str(fp32_path), "int8": str(int8_path), "rows": rows}, indent=2))
+        logger.success("Wrote report to {}", args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """Configuration package."""
 
-from .settings import Settings
+from .settings import Settings, StreamConfig, load_stream_configs
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "StreamConfig", "load_stream_configs"]
 
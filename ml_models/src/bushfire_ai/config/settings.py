@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import re
 from pathlib import Path
 from typing import List, Optional, Literal
 
@@ -36,6 +38,25 @@ class VideoSourceConfig(BaseModel):
     width: Optional[PositiveInt] = Field(None, description="Target frame width for resizing.")
     height: Optional[PositiveInt] = Field(None, description="Target frame height for resizing.")
     fps: Optional[PositiveFloat] = Field(None, description="Override capture fps if known.")
+    capture_mode: Literal["sync", "threaded"] = Field(
+        "sync",
+        description="'sync' decodes on the inference thread, 'threaded' decodes on a background capture thread.",
+    )
+    queue_size: PositiveInt = Field(2, description="Maximum frames buffered between capture and inference.")
+    drop_policy: Literal["latest", "drop_oldest", "block"] = Field(
+        "latest",
+        description="Threaded capture policy when the queue is full: keep only the newest frame, "
+        "evict the oldest, or block the decoder.",
+    )
+
+
+class StreamConfig(BaseModel):
+    name: str = Field(..., description="Short stream identifier used in logs and artifact paths.")
+    source: str = Field(..., description="Camera index, file path, or RTSP URL for this stream.")
+    device_id: Optional[str] = Field(
+        None,
+        description="CAMARA device identifier for this drone; falls back to Settings.device_id.",
+    )
 
 
 class DetectionConfig(BaseModel):
@@ -47,6 +68,36 @@ class DetectionConfig(BaseModel):
     iou_threshold: float = Field(0.5, ge=0.0, le=1.0)
     max_detections: PositiveInt = Field(20, description="Limit for detections per frame.")
     target_classes: List[str] = Field(default_factory=lambda: ["fire"], description="Detection class names to keep")
+    backend: Literal["ultralytics", "onnxruntime", "openvino"] = Field(
+        "ultralytics",
+        description="Inference engine: PyTorch via Ultralytics, or an ONNX Runtime / OpenVINO export on CPU.",
+    )
+    imgsz: PositiveInt = Field(640, description="Model input size; exported models with a fixed shape override it.")
+    profile: Literal["standard", "fast"] = Field(
+        "standard",
+        description="'fast' runs the INT8 ONNX model at fast_imgsz on ONNX Runtime instead of backend/weights_path.",
+    )
+    fast_weights_path: Optional[Path] = Field(
+        None,
+        description="INT8 ONNX model for the fast profile; defaults to <weights stem>_int8.onnx beside weights_path.",
+    )
+    fast_imgsz: PositiveInt = Field(480, description="Model input size for the fast profile (multiple of 32).")
+    infer_fps: Optional[PositiveFloat] = Field(
+        None,
+        description="Run the detector on at most this many frames per second of media time (others reuse the last "
+        "detection); frames needed neither for inference nor the event clip are skipped without decoding.",
+    )
+    inference_workers: int = Field(
+        0,
+        ge=0,
+        description="Run the detector in this many worker processes fed through shared memory; 0 infers in-process. "
+        "Batches are spread over the workers and hold at least this many frames.",
+    )
+    batch_size: PositiveInt = Field(1, description="Frames collected per model call; 1 disables batching.")
+    batch_timeout_ms: PositiveFloat = Field(
+        50.0,
+        description="Maximum time to wait for a batch to fill before running inference on a partial batch.",
+    )
 
 
 class EventConfig(BaseModel):
@@ -54,14 +105,131 @@ class EventConfig(BaseModel):
     post_event_buffer_sec: PositiveFloat = Field(2.0, description="Seconds after trigger to retain frames.")
     clip_frame_rate: PositiveFloat = Field(15.0, description="FPS for generated event clips.")
     artifact_dir: Path = Field(Path("artifacts"))
-    skip_frames_after_detection: PositiveInt = Field(
-        30,
-        description="Number of frames to skip processing after a detection event is recorded.",
-    )
     detection_mode: Literal["store", "view"] = Field(
         "store",
         description="Detection handling mode: 'store' persists artifacts, 'view' displays them only.",
     )
+    buffer_max_mb: PositiveFloat = Field(
+        256.0,
+        description="Memory budget for the pre-event frame ring buffer, in MiB.",
+    )
+    buffer_max_width: Optional[PositiveInt] = Field(
+        1280,
+        description="Frames are downscaled to at most this width when buffered for clips.",
+    )
+    buffer_jpeg_quality: Optional[int] = Field(
+        None,
+        ge=1,
+        le=100,
+        description="Keep buffered frames JPEG-encoded at this quality instead of raw pixels.",
+    )
+    clip_encoder: Literal["ffmpeg", "opencv"] = Field(
+        "ffmpeg",
+        description="Clip encoder: an ffmpeg subprocess (H.264/H.265), or cv2.VideoWriter (mp4v). "
+        "ffmpeg falls back to cv2 when no binary is found.",
+    )
+    clip_codec: Literal["h264", "h265"] = Field("h264", description="Codec for the ffmpeg clip encoder.")
+    clip_preset: str = Field("veryfast", description="x264/x265 preset; slower presets give smaller files.")
+    clip_crf: int = Field(28, ge=0, le=51, description="Constant rate factor; lower is higher quality and larger.")
+    clip_max_width: Optional[PositiveInt] = Field(None, description="Downscale clips wider than this when encoding.")
+    ffmpeg_path: Optional[str] = Field(None, description="ffmpeg executable; defaults to PATH, then imageio-ffmpeg.")
+    artifact_workers: PositiveInt = Field(
+        2,
+        description="Background threads that write evidence and report incidents off the inference loop.",
+    )
+    artifact_backlog: PositiveInt = Field(
+        8,
+        description="Incidents allowed to wait for a free artifact worker before new ones are dropped.",
+    )
+    artifact_max_mb: Optional[PositiveFloat] = Field(
+        None,
+        description="Disk quota for indexed incident artifacts, in MB; the oldest incidents are evicted beyond it.",
+    )
+    artifact_max_incidents: Optional[PositiveInt] = Field(
+        None,
+        description="Most incidents kept on disk; the oldest are evicted beyond it.",
+    )
+    artifact_index_path: Optional[Path] = Field(
+        None,
+        description="Artifact index database; defaults to artifacts.sqlite3 in the artifact dir.",
+    )
+    keyframe_annotation: Literal["upload", "background", "off"] = Field(
+        "upload",
+        description="When the annotated keyframe is drawn: just before upload, on the artifact worker right "
+        "after the raw keyframe is written, or never (uploads then send the raw keyframe).",
+    )
+
+
+class GatingConfig(BaseModel):
+    enabled: bool = Field(False, description="Skip inference on frames that barely differ from the last inferred one.")
+    method: Literal["diff", "histogram"] = Field(
+        "diff",
+        description="'diff' compares thumbnails pixel-wise, 'histogram' compares intensity histograms.",
+    )
+    threshold: PositiveFloat = Field(0.02, description="Change score (0-1) at or above which a frame is inferred.")
+    downscale_width: PositiveInt = Field(64, description="Thumbnail width used for the comparison.")
+    max_stale_frames: PositiveInt = Field(
+        15,
+        description="Maximum consecutive frames that may reuse a previous detection.",
+    )
+
+
+class TrackingConfig(BaseModel):
+    iou_threshold: float = Field(0.3, gt=0.0, le=1.0, description="Minimum IoU to continue a fire track.")
+    max_centroid_distance: float = Field(
+        0.05,
+        ge=0.0,
+        description="Centroid distance (fraction of frame diagonal) that still continues a track without overlap.",
+    )
+    max_missed_sec: PositiveFloat = Field(5.0, description="Seconds a track survives without a matching detection.")
+    confidence_jump: float = Field(
+        0.15,
+        gt=0.0,
+        description="Confidence rise since the last report that re-raises a track as an escalation.",
+    )
+    area_growth: float = Field(2.0, gt=1.0, description="Box area growth factor that re-raises a track.")
+    update_interval_sec: PositiveFloat = Field(
+        30.0,
+        description="Interval at which routine updates to known tracks are written out as one batch.",
+    )
+
+
+class TilingConfig(BaseModel):
+    enabled: bool = Field(False, description="Detect on overlapping tiles so small fires keep their pixel size.")
+    tile_size: PositiveInt = Field(640, description="Square tile edge in frame pixels.")
+    overlap: float = Field(0.2, ge=0.0, lt=1.0, description="Fraction of a tile shared with its neighbour.")
+    full_frame: bool = Field(True, description="Also run the whole frame so large fires spanning tiles are kept.")
+    prefilter_confidence: Optional[float] = Field(
+        None,
+        gt=0.0,
+        le=1.0,
+        description="If set, only tiles overlapping a full-frame candidate at this confidence are run.",
+    )
+
+
+class MetricsConfig(BaseModel):
+    window: PositiveInt = Field(1024, description="Most recent samples per stage used for latency quantiles.")
+    host: str = Field("127.0.0.1", description="Interface the metrics endpoint listens on.")
+    port: Optional[int] = Field(
+        None,
+        ge=0,
+        le=65535,
+        description="Serve Prometheus text on /metrics (and JSON on /metrics.json) at this port; unset disables it.",
+    )
+    snapshot_path: Optional[Path] = Field(
+        None,
+        description="JSON file rewritten with a metrics snapshot every snapshot_interval_sec; unset disables it.",
+    )
+    snapshot_interval_sec: PositiveFloat = Field(30.0, description="Seconds between JSON metrics snapshots.")
+
+
+class OutboxConfig(BaseModel):
+    enabled: bool = Field(True, description="Queue incidents in SQLite and retry failed uploads in the background.")
+    path: Optional[Path] = Field(None, description="Outbox database; defaults to outbox.sqlite3 in the artifact dir.")
+    concurrency: PositiveInt = Field(2, description="Uploads the drainer runs at once.")
+    base_backoff_sec: PositiveFloat = Field(2.0, description="Delay before the first retry; doubles per failure.")
+    max_backoff_sec: PositiveFloat = Field(300.0, description="Upper bound for the retry delay.")
+    poll_interval_sec: PositiveFloat = Field(5.0, description="Longest the drainer sleeps between outbox checks.")
 
 
 class CamaraConfig(BaseModel):
@@ -77,12 +245,31 @@ class CamaraConfig(BaseModel):
     )
     token_url: HttpUrl = Field("https://api.camara.org/oauth/token")
     timeout_seconds: PositiveFloat = Field(10.0)
+    offline: bool = Field(True, description="Answer with canned CAMARA responses instead of calling the APIs.")
+    http2: bool = Field(True, description="Negotiate HTTP/2 when the optional 'h2' package is installed.")
+    max_connections: PositiveInt = Field(10, description="Size of the pooled CAMARA connection set.")
+    token_refresh_margin_sec: float = Field(
+        60.0,
+        ge=0.0,
+        description="Refresh the OAuth token (and re-request QoD) this long before it expires.",
+    )
+    location_ttl_sec: float = Field(
+        30.0,
+        ge=0.0,
+        description="Seconds a device location is reused across incidents; 0 fetches it for every incident.",
+    )
+    qod_reuse: bool = Field(True, description="Reuse a granted QoD session until its validUntil.")
 
 
 class Settings(BaseModel):
     video: VideoSourceConfig = VideoSourceConfig()
     detection: DetectionConfig = DetectionConfig()
     events: EventConfig = EventConfig()
+    gating: GatingConfig = GatingConfig()
+    tiling: TilingConfig = TilingConfig()
+    tracking: TrackingConfig = TrackingConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    outbox: OutboxConfig = OutboxConfig()
     camara: CamaraConfig
     device_id: Optional[str] = Field(
         None,
@@ -102,22 +289,95 @@ class Settings(BaseModel):
             client_secret=_env_required("CAMARA_CLIENT_SECRET"),
             scope=_env_optional("CAMARA_SCOPE", "location.read quality.request"),
             qod_url=_env_optional("CAMARA_QOD_URL"),
+            token_url=_env_optional("CAMARA_TOKEN_URL", "https://api.camara.org/oauth/token"),
+            offline=_env_flag("CAMARA_OFFLINE", True),
+            http2=_env_flag("CAMARA_HTTP2", True),
+            max_connections=int(_env_optional("CAMARA_MAX_CONNECTIONS", "10")),
+            token_refresh_margin_sec=float(_env_optional("CAMARA_TOKEN_REFRESH_MARGIN_SEC", "60")),
+            location_ttl_sec=float(_env_optional("CAMARA_LOCATION_TTL_SEC", "30")),
+            qod_reuse=_env_flag("CAMARA_QOD_REUSE", True),
         )
 
         detection = DetectionConfig(
             confidence_threshold=float(_env_optional("FIRE_CONFIDENCE_THRESHOLD", 0.6)),
             weights_path=Path(_env_optional("FIRE_WEIGHTS_PATH", "models/fire_yolov8n.pt")),
             target_classes=_parse_list(_env_optional("FIRE_TARGET_CLASSES")) or ["fire"],
+            backend=_env_optional("FIRE_BACKEND", "ultralytics").lower(),
+            imgsz=int(_env_optional("FIRE_IMGSZ", "640")),
+            profile=_env_optional("FIRE_PROFILE", "standard").lower(),
+            fast_weights_path=_env_path("FIRE_FAST_WEIGHTS_PATH"),
+            fast_imgsz=int(_env_optional("FIRE_FAST_IMGSZ", "480")),
+            infer_fps=_env_float("FIRE_INFER_FPS"),
+            inference_workers=int(_env_optional("FIRE_INFERENCE_WORKERS", "0")),
+            batch_size=int(_env_optional("FIRE_BATCH_SIZE", "1")),
+            batch_timeout_ms=float(_env_optional("FIRE_BATCH_TIMEOUT_MS", "50")),
         )
 
         events = EventConfig(
+            clip_frame_rate=float(_env_optional("CLIP_FPS", "15")),
             artifact_dir=Path(_env_optional("OUTPUT_DIR", "artifacts")),
-            skip_frames_after_detection=int(_env_optional("SKIP_FRAMES_AFTER_DETECTION", "30")),
             detection_mode=_env_optional("DETECTION_MODE", "store").lower(),
+            buffer_max_mb=float(_env_optional("EVENT_BUFFER_MAX_MB", "256")),
+            buffer_max_width=_env_int("EVENT_BUFFER_MAX_WIDTH", 1280),
+            buffer_jpeg_quality=_env_int("EVENT_BUFFER_JPEG_QUALITY"),
+            clip_encoder=_env_optional("CLIP_ENCODER", "ffmpeg").lower(),
+            clip_codec=_env_optional("CLIP_CODEC", "h264").lower(),
+            clip_preset=_env_optional("CLIP_PRESET", "veryfast"),
+            clip_crf=int(_env_optional("CLIP_CRF", "28")),
+            clip_max_width=_env_int("CLIP_MAX_WIDTH"),
+            ffmpeg_path=_env_optional("FFMPEG_PATH") or None,
+            artifact_workers=int(_env_optional("ARTIFACT_WORKERS", "2")),
+            artifact_backlog=int(_env_optional("ARTIFACT_BACKLOG", "8")),
+            artifact_max_mb=_env_float("ARTIFACT_MAX_MB"),
+            artifact_max_incidents=_env_int("ARTIFACT_MAX_INCIDENTS"),
+            artifact_index_path=_env_path("ARTIFACT_INDEX_PATH"),
+            keyframe_annotation=_env_optional("KEYFRAME_ANNOTATION", "upload").lower(),
+        )
+
+        gating = GatingConfig(
+            enabled=_env_flag("MOTION_GATE", False),
+            method=_env_optional("MOTION_GATE_METHOD", "diff").lower(),
+            threshold=float(_env_optional("MOTION_GATE_THRESHOLD", "0.02")),
+            max_stale_frames=int(_env_optional("MOTION_GATE_MAX_STALE", "15")),
+        )
+
+        tiling = TilingConfig(
+            enabled=_env_flag("TILED_INFERENCE", False),
+            tile_size=int(_env_optional("TILE_SIZE", "640")),
+            overlap=float(_env_optional("TILE_OVERLAP", "0.2")),
+            full_frame=_env_flag("TILE_FULL_FRAME", True),
+            prefilter_confidence=_env_float("TILE_PREFILTER_CONFIDENCE"),
+        )
+
+        tracking = TrackingConfig(
+            iou_threshold=float(_env_optional("TRACK_IOU_THRESHOLD", "0.3")),
+            max_missed_sec=float(_env_optional("TRACK_MAX_MISSED_SEC", "5")),
+            confidence_jump=float(_env_optional("TRACK_CONFIDENCE_JUMP", "0.15")),
+            area_growth=float(_env_optional("TRACK_AREA_GROWTH", "2.0")),
+            update_interval_sec=float(_env_optional("TRACK_UPDATE_INTERVAL_SEC", "30")),
+        )
+
+        metrics = MetricsConfig(
+            window=int(_env_optional("METRICS_WINDOW", "1024")),
+            host=_env_optional("METRICS_HOST", "127.0.0.1"),
+            port=_env_int("METRICS_PORT"),
+            snapshot_path=_env_path("METRICS_SNAPSHOT_PATH"),
+            snapshot_interval_sec=float(_env_optional("METRICS_SNAPSHOT_INTERVAL_SEC", "30")),
+        )
+
+        outbox = OutboxConfig(
+            enabled=_env_flag("OUTBOX_ENABLED", True),
+            path=_env_path("OUTBOX_PATH"),
+            concurrency=int(_env_optional("OUTBOX_CONCURRENCY", "2")),
+            base_backoff_sec=float(_env_optional("OUTBOX_BACKOFF_SEC", "2")),
+            max_backoff_sec=float(_env_optional("OUTBOX_MAX_BACKOFF_SEC", "300")),
         )
 
         video = VideoSourceConfig(
             source=_env_optional("VIDEO_SOURCE", "0"),
+            capture_mode=_env_optional("CAPTURE_MODE", "sync").lower(),
+            queue_size=int(_env_optional("CAPTURE_QUEUE_SIZE", "2")),
+            drop_policy=_env_optional("CAPTURE_DROP_POLICY", "latest").lower(),
         )
 
         device_id = _env_optional("DEVICE_ID")
@@ -126,11 +386,71 @@ class Settings(BaseModel):
             video=video,
             detection=detection,
             events=events,
+            gating=gating,
+            tiling=tiling,
+            tracking=tracking,
+            metrics=metrics,
+            outbox=outbox,
             camara=camara_config,
             device_id=device_id,
         )
 
 
+def load_stream_configs(path: Path) -> List[StreamConfig]:
+    """Read stream definitions from a sources file."""
+
+    return streams_from_sources(read_stream_entries(path))
+
+
+def read_stream_entries(path: Path) -> List[dict]:
+    """Parse a sources file into raw stream entries.
+
+    JSON files hold a list of objects with ``source`` and optional ``name``/``device_id``.
+    Any other file is read line by line as ``<source> [device_id] [name]``; blank
+    lines and ``#`` comments are ignored.
+    """
+
+    if path.suffix.lower() == ".json":
+        entries = json.loads(path.read_text())
+    else:
+        entries = []
+        for line in path.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            entry = {"source": parts[0]}
+            if len(parts) > 1:
+                entry["device_id"] = parts[1]
+            if len(parts) > 2:
+                entry["name"] = parts[2]
+            entries.append(entry)
+    return entries
+
+
+def streams_from_sources(entries: List[object]) -> List[StreamConfig]:
+    """Build stream configs from plain source strings or dicts, assigning unique names."""
+
+    streams: List[StreamConfig] = []
+    used: set[str] = set()
+    for index, entry in enumerate(entries):
+        values = dict(entry) if isinstance(entry, dict) else {"source": str(entry)}
+        base = values.get("name") or _stream_name(values["source"], index)
+        name, suffix = base, 1
+        while name in used:
+            name, suffix = f"{base}-{suffix}", suffix + 1
+        used.add(name)
+        values["name"] = name
+        streams.append(StreamConfig(**values))
+    return streams
+
+
+def _stream_name(source: str, index: int) -> str:
+    stem = Path(source.rstrip("/")).stem if not source.isdigit() else f"camera{source}"
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "-", stem).strip("-")
+    return slug or f"stream{index}"
+
+
 def _env_required(key: str) -> str:
     value = _env_optional(key)
     if not value:
@@ -144,6 +464,40 @@ def _env_optional(key: str, default: Optional[str] = None) -> Optional[str]:
     return getenv(key, default)
 
 
+def _env_flag(key: str, default: bool) -> bool:
+    value = _env_optional(key)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(key: str, default: Optional[int] = None) -> Optional[int]:
+    """Read an optional integer; an empty value or ``none`` disables the setting."""
+
+    value = _env_optional(key)
+    if value is None:
+        return default
+    if value.strip().lower() in {"", "none", "off"}:
+        return None
+    return int(value)
+
+
+def _env_float(key: str, default: Optional[float] = None) -> Optional[float]:
+    """Read an optional float; an empty value or ``none`` disables the setting."""
+
+    value = _env_optional(key)
+    if value is None:
+        return default
+    if value.strip().lower() in {"", "none", "off"}:
+        return None
+    return float(value)
+
+
+def _env_path(key: str) -> Optional[Path]:
+    value = _env_optional(key)
+    return Path(value.strip()) if value and value.strip() else None
+
+
 def _parse_list(value: Optional[str]) -> Optional[List[str]]:
     if value is None:
         return None
@@ -1,6 +1,6 @@
 """Detector package exports."""
 
+from .backends import InferenceBackend, create_backend
 from .fire_detector import FireDetectionModel, DetectionResult
 
-__all__ = ["FireDetectionModel", "DetectionResult"]
-
+__all__ = ["FireDetectionModel", "DetectionResult", "InferenceBackend", "create_backend"]
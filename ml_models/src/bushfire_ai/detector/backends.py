@@ -0,0 +1,245 @@
+"""Inference engines that run the fire detector.
+
+Every backend returns, per input frame, an ``(N, 6)`` float32 array of
+``x1, y1, x2, y2, conf, cls`` rows in frame coordinates, so
+``FireDetectionModel`` builds identical ``DetectionResult`` objects whichever
+engine is loaded.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.postprocess import LetterboxBuffers, decode_yolo_output, scale_boxes
+
+
+BackendName = Literal["ultralytics", "onnxruntime", "openvino"]
+
+EMPTY_ROWS = np.empty((0, 6), dtype=np.float32)
+MODEL_STRIDE = 32
+
+
+class InferenceBackend(ABC):
+    """Runs a YOLO-style detector on a batch of BGR frames."""
+
+    names: Dict[int, str]
+    supports_batching: bool = True
+
+    @abstractmethod
+    def infer(
+        self,
+        frames: Sequence[np.ndarray],
+        confidence_threshold: float,
+        iou_threshold: float,
+        max_detections: int,
+    ) -> List[np.ndarray]:
+        """Return one ``(N, 6)`` box-row array per frame."""
+
+
+class UltralyticsBackend(InferenceBackend):
+    """PyTorch inference through ``ultralytics.YOLO``.
+
+    Frames are letterboxed into reused ``LetterboxBuffers`` and handed to
+    ``predict`` as an already normalized tensor, so Ultralytics skips its own
+    per-frame letterbox, stack and conversion copies. Boxes come back in
+    model-input coordinates and are mapped to the frame with the letterbox meta.
+    """
+
+    def __init__(self, weights_path: Path, device: Optional[str] = None, imgsz: int = 640) -> None:
+        try:
+            from ultralytics import YOLO  # type: ignore
+        except ImportError as exc:  # pragma: no cover - handled at runtime
+            raise RuntimeError(
+                "Ultralytics is required for the torch backend. Install with `pip install ultralytics`."
+            ) from exc
+
+        self.device = device
+        self.imgsz = imgsz
+        self.model = YOLO(str(weights_path))
+        self.names = dict(self.model.names)
+        self.letterbox = LetterboxBuffers(imgsz, MODEL_STRIDE)
+
+    def infer(
+        self,
+        frames: Sequence[np.ndarray],
+        confidence_threshold: float,
+        iou_threshold: float,
+        max_detections: int,
+    ) -> List[np.ndarray]:
+        import torch  # type: ignore
+
+        blob, metas = self.letterbox(frames)
+        results = self.model.predict(
+            source=torch.from_numpy(blob),
+            conf=confidence_threshold,
+            iou=iou_threshold,
+            max_det=max_detections,
+            device=self.device,
+            verbose=False,
+        )
+        rows: List[np.ndarray] = []
+        for result, meta in zip(results, metas):
+            boxes = getattr(result, "boxes", None)
+            if boxes is None or len(boxes) == 0:
+                rows.append(EMPTY_ROWS)
+                continue
+            # one device-to-host copy for all boxes: rows are x1, y1, x2, y2, conf, cls
+            data = np.array(boxes.data.cpu().numpy(), dtype=np.float32)
+            data[:, :4] = scale_boxes(data[:, :4], meta)
+            rows.append(data)
+        return rows
+
+
+class _ExportedModelBackend(InferenceBackend):
+    """Shared letterbox/decode logic for engines running an exported YOLOv8 graph.
+
+    Graphs exported with dynamic spatial axes get the same stride-padded
+    rectangular input Ultralytics would use, so a 16:9 frame costs a 384x640
+    pass rather than 640x640.
+    """
+
+    imgsz: int
+    dynamic_shape: bool = False
+    letterbox: LetterboxBuffers
+
+    def infer(
+        self,
+        frames: Sequence[np.ndarray],
+        confidence_threshold: float,
+        iou_threshold: float,
+        max_detections: int,
+    ) -> List[np.ndarray]:
+        blob, metas = self.letterbox(frames)
+        if self.supports_batching:
+            outputs = self._run(blob)
+        else:
+            outputs = np.concatenate([self._run(blob[i : i + 1]) for i in range(blob.shape[0])])
+        return [
+            decode_yolo_output(output, meta, confidence_threshold, iou_threshold, max_detections)
+            for output, meta in zip(outputs, metas)
+        ]
+
+    @abstractmethod
+    def _run(self, blob: np.ndarray) -> np.ndarray:
+        """Run the graph on a ``(B, 3, S, S)`` blob, returning ``(B, 4 + classes, anchors)``."""
+
+
+class OnnxRuntimeBackend(_ExportedModelBackend):
+    """CPU inference of an Ultralytics ONNX export with ONNX Runtime."""
+
+    def __init__(self, weights_path: Path, imgsz: int = 640, threads: Optional[int] = None) -> None:
+        try:
+            import onnxruntime as ort  # type: ignore
+        except ImportError as exc:  # pragma: no cover - handled at runtime
+            raise RuntimeError(
+                "onnxruntime is required for the ONNX backend. Install with `pip install onnxruntime`."
+            ) from exc
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(str(weights_path), options, providers=["CPUExecutionProvider"])
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.supports_batching = not isinstance(model_input.shape[0], int)
+        self.dynamic_shape = not all(isinstance(dim, int) for dim in model_input.shape[2:])
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names = _parse_names(metadata.get("names"))
+        self.imgsz = _static_size(model_input.shape) or imgsz
+        self.letterbox = LetterboxBuffers(self.imgsz, MODEL_STRIDE if self.dynamic_shape else None)
+
+    def _run(self, blob: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {self.input_name: blob})[0]
+
+
+class OpenVinoBackend(_ExportedModelBackend):
+    """CPU inference of an Ultralytics OpenVINO export (``*_openvino_model`` directory or ``.xml``)."""
+
+    def __init__(self, weights_path: Path, imgsz: int = 640, device: str = "CPU") -> None:
+        try:
+            import openvino as ov  # type: ignore
+        except ImportError as exc:  # pragma: no cover - handled at runtime
+            raise RuntimeError(
+                "OpenVINO is required for the OpenVINO backend. Install with `pip install openvino`."
+            ) from exc
+
+        xml_path = weights_path if weights_path.suffix == ".xml" else next(weights_path.glob("*.xml"))
+        core = ov.Core()
+        model = core.read_model(str(xml_path))
+        model_input = model.inputs[0]
+        shape = model_input.get_partial_shape()
+        self.supports_batching = shape[0].is_dynamic
+        self.dynamic_shape = shape[2].is_dynamic or shape[3].is_dynamic
+        self.compiled = core.compile_model(model, device, {"PERFORMANCE_HINT": "LATENCY"})
+        self.names = _read_openvino_names(xml_path.parent / "metadata.yaml")
+        self.imgsz = shape[2].get_length() if shape[2].is_static else imgsz
+        self.letterbox = LetterboxBuffers(self.imgsz, MODEL_STRIDE if self.dynamic_shape else None)
+
+    def _run(self, blob: np.ndarray) -> np.ndarray:
+        return self.compiled(blob)[0]
+
+
+def create_backend(
+    backend: BackendName,
+    weights_path: Path,
+    device: Optional[str] = None,
+    imgsz: int = 640,
+) -> InferenceBackend:
+    """Instantiate the named backend for ``weights_path``."""
+
+    if not weights_path.exists():
+        raise FileNotFoundError(f"Model weights not found at {weights_path}")
+
+    logger.info("Loading {} detection model from {}", backend, weights_path)
+    if backend == "ultralytics":
+        return UltralyticsBackend(weights_path, device=device, imgsz=imgsz)
+    if backend == "onnxruntime":
+        return OnnxRuntimeBackend(weights_path, imgsz=imgsz, threads=_env_threads())
+    if backend == "openvino":
+        return OpenVinoBackend(weights_path, imgsz=imgsz, device=(device or "CPU").upper())
+    raise ValueError(f"Unknown inference backend: {backend}")
+
+
+def _parse_names(raw: Optional[str]) -> Dict[int, str]:
+    if not raw:
+        return {}
+    parsed: Any = ast.literal_eval(raw)
+    return {int(key): str(value) for key, value in parsed.items()}
+
+
+def _read_openvino_names(metadata_path: Path) -> Dict[int, str]:
+    """Read the ``names`` mapping Ultralytics writes next to an OpenVINO export."""
+
+    if not metadata_path.exists():
+        return {}
+    names: Dict[int, str] = {}
+    in_names = False
+    for line in metadata_path.read_text().splitlines():
+        if line.startswith("names:"):
+            in_names = True
+            continue
+        if in_names:
+            if not line.startswith(" "):
+                break
+            key, _, value = line.strip().partition(":")
+            names[int(key)] = value.strip().strip("'\"")
+    return names
+
+
+def _static_size(shape: Sequence[Any]) -> Optional[int]:
+    height = shape[2] if len(shape) > 2 else None
+    return height if isinstance(height, int) else None
+
+
+def _env_threads() -> Optional[int]:
+    value = os.getenv("ORT_NUM_THREADS")
+    return int(value) if value else None
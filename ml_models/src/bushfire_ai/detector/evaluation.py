@@ -0,0 +1,55 @@
+"""Detection agreement metrics used to compare backends, precisions and input sizes."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from bushfire_ai.detector.postprocess import box_iou, greedy_pairs
+
+
+def match_detections(reference: np.ndarray, candidate: np.ndarray, iou_threshold: float) -> Tuple[int, List[float]]:
+    """Greedily pair same-class ``x1, y1, x2, y2, conf, cls`` rows by IoU.
+
+    Returns the number of matched pairs and their absolute confidence deltas.
+    """
+
+    if reference.shape[0] == 0 or candidate.shape[0] == 0:
+        return 0, []
+    overlaps = box_iou(reference[:, :4], candidate[:, :4])
+    overlaps[reference[:, 5, None] != candidate[None, :, 5]] = 0.0
+    pairs = greedy_pairs(overlaps, iou_threshold)
+    return len(pairs), [abs(float(reference[row, 4] - candidate[column, 4])) for row, column in pairs]
+
+
+def agreement(
+    reference: Sequence[np.ndarray],
+    candidate: Sequence[np.ndarray],
+    iou_threshold: float = 0.5,
+) -> Dict[str, float]:
+    """Precision/recall/F1 of ``candidate`` detections against ``reference``, frame by frame.
+
+    ``reference`` may be model output or ground truth; ground-truth rows only
+    need their box and class columns.
+    """
+
+    matched, deltas = 0, []
+    for ref_rows, cand_rows in zip(reference, candidate):
+        count, frame_deltas = match_detections(ref_rows, cand_rows, iou_threshold)
+        matched += count
+        deltas.extend(frame_deltas)
+    ref_total = sum(rows.shape[0] for rows in reference)
+    cand_total = sum(rows.shape[0] for rows in candidate)
+    precision = matched / cand_total if cand_total else 1.0
+    recall = matched / ref_total if ref_total else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "reference_detections": ref_total,
+        "detections": cand_total,
+        "matched": matched,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "max_confidence_delta": max(deltas, default=0.0),
+    }
@@ -3,33 +3,55 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, Mapping, Optional, Sequence
 
 import numpy as np
-from loguru import logger
 
-try:
-    from ultralytics import YOLO  # type: ignore
-except ImportError as exc:  # pragma: no cover - handled at runtime
-    raise RuntimeError(
-        "Ultralytics is required for FireDetectionModel. Install with `pip install ultralytics`."
-    ) from exc
+from bushfire_ai.detector.backends import BackendName, InferenceBackend, create_backend
+from bushfire_ai.detector.tiling import TiledInference
 
 
 class DetectionResult:
-    """Container representing a detection event."""
+    """Container representing a detection event.
+
+    Boxes, confidences and class ids are held as contiguous arrays; label
+    strings are only resolved from ``names`` when ``labels`` is first read.
+    """
+
+    __slots__ = ("boxes", "confidences", "class_ids", "_labels", "_names")
 
     def __init__(
         self,
         boxes: np.ndarray,
         confidences: np.ndarray,
         class_ids: np.ndarray,
-        labels: List[str],
+        labels: Optional[List[str]] = None,
+        names: Optional[Mapping[int, str]] = None,
     ) -> None:
-        self.boxes = boxes
-        self.confidences = confidences
-        self.class_ids = class_ids
-        self.labels = labels
+        self.boxes = np.ascontiguousarray(boxes, dtype=np.float32).reshape(-1, 4)
+        self.confidences = np.ascontiguousarray(confidences, dtype=np.float32).reshape(-1)
+        self.class_ids = np.ascontiguousarray(class_ids, dtype=np.int32).reshape(-1)
+        self._labels = labels
+        self._names = names
+
+    @classmethod
+    def empty(cls, names: Optional[Mapping[int, str]] = None) -> "DetectionResult":
+        return cls(
+            boxes=np.empty((0, 4), dtype=np.float32),
+            confidences=np.empty(0, dtype=np.float32),
+            class_ids=np.empty(0, dtype=np.int32),
+            names=names,
+        )
+
+    def __len__(self) -> int:
+        return int(self.confidences.size)
+
+    @property
+    def labels(self) -> List[str]:
+        if self._labels is None:
+            names = self._names or {}
+            self._labels = [names.get(class_id, f"class_{class_id}") for class_id in self.class_ids.tolist()]
+        return self._labels
 
     def has_fire(self, threshold: float) -> bool:
         return bool((self.confidences >= threshold).any())
@@ -40,8 +62,54 @@ class DetectionResult:
         return float(self.confidences.max())
 
 
+def build_class_mask(names: Mapping[int, str], target_classes: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+    """Return a boolean lookup table indexed by class id, or ``None`` to keep every class."""
+
+    if not target_classes:
+        return None
+    targets = {cls.lower() for cls in target_classes}
+    mask = np.zeros(max(names, default=-1) + 1, dtype=bool)
+    for class_id, label in names.items():
+        mask[class_id] = label.lower() in targets
+    return mask
+
+
+def extract_detections(
+    data: np.ndarray,
+    names: Mapping[int, str],
+    class_mask: Optional[np.ndarray] = None,
+) -> DetectionResult:
+    """Build a ``DetectionResult`` from Ultralytics-style box rows.
+
+    Rows are ``x1, y1, x2, y2, [track_id,] conf, cls`` as in ``Boxes.data``.
+    """
+
+    if data.shape[0] == 0:
+        return DetectionResult.empty(names)
+
+    class_ids = data[:, -1].astype(np.int32)
+    if class_mask is not None:
+        in_range = (class_ids >= 0) & (class_ids < class_mask.size)
+        keep = in_range & class_mask[np.where(in_range, class_ids, 0)]
+        data = data[keep]
+        class_ids = class_ids[keep]
+
+    return DetectionResult(
+        boxes=data[:, :4],
+        confidences=data[:, -2],
+        class_ids=class_ids,
+        names=names,
+    )
+
+
 class FireDetectionModel:
-    """Ultralytics YOLO wrapper for fire detection."""
+    """YOLO fire detector running on a pluggable inference backend.
+
+    ``backend`` selects the engine: ``ultralytics`` (PyTorch) loads ``.pt``
+    weights, ``onnxruntime`` an ``.onnx`` export and ``openvino`` an
+    ``*_openvino_model`` export directory. With ``tiler`` frames are
+    detected on overlapping tiles (see ``TiledInference``).
+    """
 
     def __init__(
         self,
@@ -51,6 +119,9 @@ class FireDetectionModel:
         max_detections: int,
         device: Optional[str] = None,
         target_classes: Optional[Sequence[str]] = None,
+        backend: BackendName = "ultralytics",
+        imgsz: int = 640,
+        tiler: Optional[TiledInference] = None,
     ) -> None:
         self.weights_path = weights_path
         self.confidence_threshold = confidence_threshold
@@ -59,60 +130,42 @@ class FireDetectionModel:
         self.device = device
         self.target_classes = {cls.lower() for cls in target_classes} if target_classes else None
 
-        if not self.weights_path.exists():
-            raise FileNotFoundError(f"Model weights not found at {self.weights_path}")
-
-        logger.info("Loading detection model from {}", self.weights_path)
-        self.model = YOLO(str(self.weights_path))
+        self.tiler = tiler
+        self.backend: InferenceBackend = create_backend(backend, weights_path, device=device, imgsz=imgsz)
+        self.names: Mapping[int, str] = self.backend.names
+        self._class_mask = build_class_mask(self.names, self.target_classes)
 
     def predict(self, frame: np.ndarray) -> DetectionResult:
         """Run inference on a single frame."""
 
-        results = self.model.predict(
-            source=frame,
-            conf=self.confidence_threshold,
-            iou=self.iou_threshold,
-            max_det=self.max_detections,
-            device=self.device,
-            verbose=False,
-        )
+        return self.predict_batch([frame])[0]
 
-        boxes: List[List[float]] = []
-        confidences: List[float] = []
-        class_ids: List[int] = []
-        labels: List[str] = []
-
-        for result in results:
-            if not hasattr(result, "boxes") or result.boxes is None:
-                continue
-            for box in result.boxes:
-                boxes.append(box.xyxy[0].tolist())
-                confidences.append(float(box.conf))
-                class_id = int(box.cls)
-                class_ids.append(class_id)
-                label = self.model.names.get(class_id, f"class_{class_id}")
-                if self.target_classes and label.lower() not in self.target_classes:
-                    # discard detection not in target list
-                    boxes.pop()
-                    confidences.pop()
-                    class_ids.pop()
-                    continue
-                labels.append(label)
-
-        return DetectionResult(
-            boxes=np.array(boxes, dtype=np.float32) if boxes else np.empty((0, 4), dtype=np.float32),
-            confidences=np.array(confidences, dtype=np.float32) if confidences else np.empty(0),
-            class_ids=np.array(class_ids, dtype=np.int32) if class_ids else np.empty(0, dtype=np.int32),
-            labels=labels,
-        )
+    def predict_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionResult]:
+        """Run inference on several frames in one model call.
+
+        Returns one ``DetectionResult`` per input frame, in input order.
+        """
+
+        if not frames:
+            return []
+
+        thresholds = (self.confidence_threshold, self.iou_threshold, self.max_detections)
+        if self.tiler is not None:
+            rows = self.tiler.infer(self.backend, frames, *thresholds)
+        else:
+            rows = self.backend.infer(frames, *thresholds)
+        return [extract_detections(data, self.names, self._class_mask) for data in rows]
 
     @staticmethod
-    def draw_detections(frame: np.ndarray, detections: DetectionResult) -> np.ndarray:
-        """Annotate frame with detection bounding boxes and labels."""
+    def draw_detections(frame: np.ndarray, detections: DetectionResult, copy: bool = True) -> np.ndarray:
+        """Annotate frame with detection bounding boxes and labels.
+
+        With ``copy=False`` the boxes are drawn straight onto ``frame``.
+        """
 
         import cv2  # lazy import to avoid global dependency in headless tests
 
-        annotated = frame.copy()
+        annotated = frame.copy() if copy else frame
         for box, conf, label in zip(detections.boxes, detections.confidences, detections.labels):
             x1, y1, x2, y2 = map(int, box)
             cv2.rectangle(annotated, (x1, y1), (x2, y2), (0, 0, 255), 2)
@@ -0,0 +1,245 @@
+"""NumPy pre/post-processing shared by the inference backends.
+
+These mirror Ultralytics' letterbox, box scaling and NMS so every backend
+produces the same ``x1, y1, x2, y2, conf, cls`` rows for a given frame.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+# Ultralytics offsets boxes by class * MAX_WH so one NMS pass never merges different classes
+MAX_WH = 7680.0
+MAX_NMS_CANDIDATES = 30000
+PAD_VALUE = 114
+INV_255 = np.float32(1.0 / 255.0)
+
+
+@dataclass
+class LetterboxMeta:
+    """Maps model-input coordinates back to the original frame."""
+
+    scale: float
+    pad_x: float
+    pad_y: float
+    frame_width: int
+    frame_height: int
+
+
+def letterbox_layout(
+    height: int, width: int, size: int, stride: Optional[int] = None
+) -> Tuple[Tuple[int, int], Tuple[int, int], LetterboxMeta]:
+    """Return the canvas ``(height, width)``, resized ``(height, width)`` and meta for a frame.
+
+    With ``stride`` the padding only reaches the next multiple of the stride,
+    giving the smaller rectangular input Ultralytics uses for dynamic-shape models.
+    """
+
+    scale = min(size / height, size / width)
+    new_w, new_h = int(round(width * scale)), int(round(height * scale))
+    canvas_w = canvas_h = size
+    if stride:
+        canvas_w = -(-new_w // stride) * stride
+        canvas_h = -(-new_h // stride) * stride
+    pad_w, pad_h = (canvas_w - new_w) / 2, (canvas_h - new_h) / 2
+    top, left = int(round(pad_h - 0.1)), int(round(pad_w - 0.1))
+    return (canvas_h, canvas_w), (new_h, new_w), LetterboxMeta(scale, left, top, width, height)
+
+
+def resize_into(frame: np.ndarray, target: np.ndarray) -> None:
+    """Resize ``frame`` straight into the ``target`` view without an intermediate image."""
+
+    if frame.shape[:2] == target.shape[:2]:
+        np.copyto(target, frame)
+    else:
+        cv2.resize(frame, (target.shape[1], target.shape[0]), dst=target, interpolation=cv2.INTER_LINEAR)
+
+
+def letterbox(frame: np.ndarray, size: int, stride: Optional[int] = None) -> Tuple[np.ndarray, LetterboxMeta]:
+    """Resize ``frame`` to fit a ``size`` x ``size`` canvas, padding the borders (see ``letterbox_layout``)."""
+
+    (canvas_h, canvas_w), (new_h, new_w), meta = letterbox_layout(frame.shape[0], frame.shape[1], size, stride)
+    canvas = np.full((canvas_h, canvas_w, 3), PAD_VALUE, dtype=np.uint8)
+    top, left = int(meta.pad_y), int(meta.pad_x)
+    resize_into(frame, canvas[top : top + new_h, left : left + new_w])
+    return canvas, meta
+
+
+class LetterboxBuffers:
+    """Letterboxes batches of frames into model-input buffers reused across calls.
+
+    Each canvas shape gets one uint8 canvas stack and one float32 RGB blob,
+    reallocated only when a batch outgrows them, so alternating shapes (the
+    full-frame and tile passes of tiled inference) do not thrash. Frames are
+    resized straight into their slot, and a slot's padding is only repainted
+    when the frame written to it has a different layout from the last one.
+    The returned blob is a view that the next call overwrites.
+    """
+
+    def __init__(self, size: int, stride: Optional[int] = None) -> None:
+        self.size = size
+        self.stride = stride
+        self.allocations = 0
+        self._buffers: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, List[Optional[Tuple[int, ...]]]]] = {}
+
+    def __call__(self, frames: Sequence[np.ndarray]) -> Tuple[np.ndarray, List[LetterboxMeta]]:
+        """Return a ``(B, 3, H, W)`` normalized RGB blob and one ``LetterboxMeta`` per frame."""
+
+        # a stride-padded canvas depends on the aspect ratio, so mixed shapes share the square one
+        stride = self.stride if len({frame.shape for frame in frames}) == 1 else None
+        layouts = [letterbox_layout(frame.shape[0], frame.shape[1], self.size, stride) for frame in frames]
+        count = len(frames)
+        canvas, blob, regions = self._reserve(count, layouts[0][0])
+
+        metas: List[LetterboxMeta] = []
+        for slot, (frame, (_, (new_h, new_w), meta)) in enumerate(zip(frames, layouts)):
+            top, left = int(meta.pad_y), int(meta.pad_x)
+            region = (top, left, new_h, new_w)
+            if regions[slot] != region:
+                canvas[slot].fill(PAD_VALUE)
+                regions[slot] = region
+            resize_into(frame, canvas[slot, top : top + new_h, left : left + new_w])
+            metas.append(meta)
+
+        blob = blob[:count]
+        np.multiply(canvas[:count, ..., ::-1].transpose(0, 3, 1, 2), INV_255, out=blob)
+        return blob, metas
+
+    def _reserve(
+        self, count: int, canvas_shape: Tuple[int, int]
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[Tuple[int, ...]]]]:
+        buffers = self._buffers.get(canvas_shape)
+        if buffers is None or buffers[0].shape[0] < count:
+            height, width = canvas_shape
+            buffers = (
+                np.empty((count, height, width, 3), dtype=np.uint8),
+                np.empty((count, 3, height, width), dtype=np.float32),
+                [None] * count,
+            )
+            self._buffers[canvas_shape] = buffers
+            self.allocations += 1
+        return buffers
+
+
+def to_blob(images: np.ndarray) -> np.ndarray:
+    """Convert a BGR ``(B, H, W, 3)`` uint8 stack to a normalized RGB ``(B, 3, H, W)`` float32 blob."""
+
+    blob = images[..., ::-1].transpose(0, 3, 1, 2)
+    return np.ascontiguousarray(blob, dtype=np.float32) / 255.0
+
+
+def scale_boxes(boxes: np.ndarray, meta: LetterboxMeta) -> np.ndarray:
+    """Undo letterboxing for ``(N, 4)`` xyxy boxes, clipping to the original frame."""
+
+    boxes = boxes.copy()
+    boxes[:, [0, 2]] = ((boxes[:, [0, 2]] - meta.pad_x) / meta.scale).clip(0, meta.frame_width)
+    boxes[:, [1, 3]] = ((boxes[:, [1, 3]] - meta.pad_y) / meta.scale).clip(0, meta.frame_height)
+    return boxes
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between ``(N, 4)`` and ``(M, 4)`` xyxy boxes."""
+
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod((bottom_right - top_left).clip(0), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    return intersection / (area_a[:, None] + area_b[None, :] - intersection + 1e-9)
+
+
+def greedy_pairs(scores: np.ndarray, limit: float, maximize: bool = True) -> List[Tuple[int, int]]:
+    """Repeatedly take the best remaining cell of ``scores`` while it is within ``limit``.
+
+    With ``maximize`` (e.g. a ``box_iou`` matrix) cells below ``limit`` never
+    pair; otherwise (e.g. distances) cells above it never pair. Each row and
+    column is used at most once; returns ``(row, column)`` pairs, best first.
+    """
+
+    scores = scores.astype(np.float64, copy=True)
+    blocked = -np.inf if maximize else np.inf
+    pairs: List[Tuple[int, int]] = []
+    while scores.size:
+        flat = np.argmax(scores) if maximize else np.argmin(scores)
+        row, column = np.unravel_index(flat, scores.shape)
+        value = scores[row, column]
+        if (maximize and value < limit) or (not maximize and value > limit) or not np.isfinite(value):
+            break
+        pairs.append((int(row), int(column)))
+        scores[row, :] = blocked
+        scores[:, column] = blocked
+    return pairs
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float,
+    class_ids: Optional[np.ndarray] = None,
+    max_detections: Optional[int] = None,
+) -> np.ndarray:
+    """Greedy NMS; returns kept indices in descending score order.
+
+    Each step compares the best remaining box against all others at once, so
+    memory stays linear in the number of boxes. With ``class_ids`` boxes only
+    suppress boxes of the same class.
+    """
+
+    if boxes.shape[0] == 0:
+        return np.empty(0, dtype=np.int64)
+
+    candidates = boxes.astype(np.float32, copy=True)
+    if class_ids is not None:
+        candidates += (class_ids.astype(np.float32) * MAX_WH)[:, None]
+
+    order = np.argsort(-scores, kind="stable")[:MAX_NMS_CANDIDATES]
+    keep = []
+    while order.size:
+        best = order[0]
+        keep.append(best)
+        if max_detections and len(keep) >= max_detections:
+            break
+        rest = order[1:]
+        overlaps = box_iou(candidates[best : best + 1], candidates[rest])[0]
+        order = rest[overlaps <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def decode_yolo_output(
+    prediction: np.ndarray,
+    meta: LetterboxMeta,
+    confidence_threshold: float,
+    iou_threshold: float,
+    max_detections: int,
+) -> np.ndarray:
+    """Turn one raw YOLOv8 head output ``(4 + num_classes, anchors)`` into box rows.
+
+    Returns an ``(N, 6)`` float32 array of ``x1, y1, x2, y2, conf, cls`` in frame coordinates.
+    """
+
+    prediction = prediction.T
+    class_scores = prediction[:, 4:]
+    class_ids = class_scores.argmax(axis=1)
+    confidences = class_scores[np.arange(class_scores.shape[0]), class_ids]
+    mask = confidences > confidence_threshold
+    if not mask.any():
+        return np.empty((0, 6), dtype=np.float32)
+
+    centers = prediction[mask, :4]
+    confidences = confidences[mask]
+    class_ids = class_ids[mask]
+    boxes = np.empty_like(centers)
+    boxes[:, :2] = centers[:, :2] - centers[:, 2:] / 2
+    boxes[:, 2:] = centers[:, :2] + centers[:, 2:] / 2
+
+    keep = non_max_suppression(boxes, confidences, iou_threshold, class_ids, max_detections)
+    rows = np.empty((keep.size, 6), dtype=np.float32)
+    rows[:, :4] = scale_boxes(boxes[keep], meta)
+    rows[:, 4] = confidences[keep]
+    rows[:, 5] = class_ids[keep]
+    return rows
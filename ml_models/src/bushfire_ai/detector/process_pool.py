@@ -0,0 +1,320 @@
+"""Fire detection spread over worker processes fed through shared memory.
+
+Frames are copied once into a ring of fixed-size slots in a
+``multiprocessing.shared_memory`` block; only the slot number and frame
+shape travel over the task queue, so pixels are never pickled. Each worker
+loads its own ``FireDetectionModel`` and runs it outside the main
+process's GIL. Results carry the submission sequence number and are handed
+back strictly in submission order.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.fire_detector import DetectionResult, FireDetectionModel
+
+
+DetectorFactory = Callable[[], Any]
+
+_READY = "ready"
+_RESULT = "result"
+_ERROR = "error"
+
+
+def limit_threads(threads: int) -> None:
+    """Keep a worker process to ``threads`` compute threads in OpenCV, ONNX Runtime and torch."""
+
+    import cv2
+
+    cv2.setNumThreads(threads)
+    os.environ.setdefault("ORT_NUM_THREADS", str(threads))
+    try:
+        import torch  # type: ignore
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+class SharedFrameRing:
+    """Fixed-size frame slots in one shared memory block, owned by the main process."""
+
+    def __init__(self, slots: int, slot_bytes: int) -> None:
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.memory = shared_memory.SharedMemory(create=True, size=slots * slot_bytes)
+        self._free: "queue.Queue[int]" = queue.Queue()
+        for slot in range(slots):
+            self._free.put_nowait(slot)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def acquire(self) -> Optional[int]:
+        """Return a free slot, or None while every slot holds a frame in flight."""
+
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self, slot: int) -> None:
+        self._free.put_nowait(slot)
+
+    def write(self, slot: int, frame: np.ndarray) -> None:
+        view = slot_view(self.memory, slot, self.slot_bytes, frame.shape)
+        np.copyto(view, frame, casting="no")
+
+    def close(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+
+def slot_view(memory: shared_memory.SharedMemory, slot: int, slot_bytes: int, shape: Tuple[int, ...]) -> np.ndarray:
+    return np.ndarray(shape, dtype=np.uint8, buffer=memory.buf, offset=slot * slot_bytes)
+
+
+class WorkerTilingStats:
+    """Tile counts summed over the workers' ``TiledInference`` instances, read like a local tiler's."""
+
+    def __init__(self) -> None:
+        self.tiles_total = 0
+        self.tiles_run = 0
+
+    @property
+    def tiles_skipped_fraction(self) -> float:
+        return 1.0 - self.tiles_run / self.tiles_total if self.tiles_total else 0.0
+
+
+class ProcessDetectorPool:
+    """Drop-in replacement for ``FireDetectionModel`` that infers in ``workers`` processes.
+
+    ``predict_batch`` spreads its frames over the workers and returns once
+    all are done. ``submit``/``next_result`` keep up to ``slots`` frames in
+    flight for callers that pipeline capture and inference; results come
+    back in submission order either way. The ring is sized from the first
+    frame and reallocated if the frame size changes. When the workers tile
+    their frames, ``tiler`` sums the tile counts they report with each result.
+    """
+
+    def __init__(
+        self,
+        factory: DetectorFactory,
+        workers: int = 2,
+        slots: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        start_timeout: float = 300.0,
+    ) -> None:
+        self.workers = workers
+        self.slots = slots or 2 * workers
+        self.tiler: Optional[WorkerTilingStats] = None
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks = self._context.Queue()
+        self._results = self._context.Queue()
+        self._ring: Optional[SharedFrameRing] = None
+        self._next_seq = 0
+        self._next_result = 0
+        self._completed: Dict[int, Any] = {}
+        self._inflight: Dict[int, int] = {}  # seq -> slot
+        threads = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+        self._processes = [
+            self._context.Process(
+                target=_worker_main,
+                args=(factory, self._tasks, self._results, threads),
+                name=f"detector-{index}",
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in self._processes:
+            process.start()
+        self.names: Mapping[int, str] = {}
+        self._await_ready(start_timeout)
+        logger.info("Started {} detector worker processes ({} threads each)", workers, threads)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight) + len(self._completed)
+
+    def predict(self, frame: np.ndarray) -> DetectionResult:
+        return self.predict_batch([frame])[0]
+
+    def predict_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionResult]:
+        if self.in_flight:
+            raise RuntimeError("predict_batch cannot be mixed with pending submit() calls")
+        results: List[DetectionResult] = []
+        try:
+            for frame in frames:
+                self.submit(frame)
+                while self.in_flight >= self.slots:
+                    results.append(self.next_result()[1])
+            while self.in_flight:
+                results.append(self.next_result()[1])
+        except RuntimeError:
+            self._discard_in_flight()
+            raise
+        return results
+
+    def submit(self, frame: np.ndarray) -> int:
+        """Copy ``frame`` into a free slot and queue it; waits for a slot while all are in use."""
+
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        ring = self._ring_for(frame)
+        slot = ring.acquire()
+        while slot is None:
+            self._receive()
+            slot = ring.acquire()
+        ring.write(slot, frame)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._inflight[seq] = slot
+        self._tasks.put((seq, ring.name, slot, ring.slot_bytes, frame.shape))
+        return seq
+
+    def next_result(self, timeout: Optional[float] = None) -> Tuple[int, DetectionResult]:
+        """Return ``(seq, detection)`` for the oldest submitted frame, waiting for it if needed."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._next_result not in self._completed:
+            if not self._inflight:
+                raise RuntimeError("next_result called with no frames in flight")
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if remaining == 0.0:
+                raise TimeoutError(f"No detection for frame {self._next_result} within {timeout} s")
+            self._receive(remaining)
+        seq = self._next_result
+        self._next_result += 1
+        outcome = self._completed.pop(seq)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return seq, outcome
+
+    def _discard_in_flight(self) -> None:
+        while self._inflight:
+            self._receive()
+        self._next_result = self._next_seq
+        self._completed.clear()
+
+    def close(self) -> None:
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=10.0)
+            if process.is_alive():  # pragma: no cover - stuck model
+                process.terminate()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def _ring_for(self, frame: np.ndarray) -> SharedFrameRing:
+        if self._ring is not None and frame.nbytes <= self._ring.slot_bytes:
+            return self._ring
+        while self._inflight:
+            self._receive()
+        if self._ring is not None:
+            logger.info("Frame size changed to {}; reallocating the shared frame ring", frame.shape)
+            self._ring.close()
+        self._ring = SharedFrameRing(self.slots, frame.nbytes)
+        return self._ring
+
+    def _receive(self, timeout: Optional[float] = None) -> None:
+        """Take one message off the result queue, freeing its slot."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = 1.0 if deadline is None else min(1.0, max(0.0, deadline - time.monotonic()))
+            try:
+                message = self._results.get(timeout=wait)
+                break
+            except queue.Empty:
+                self._check_workers()
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+        kind, seq, payload = message
+        slot = self._inflight.pop(seq)
+        if self._ring is not None:
+            self._ring.release(slot)
+        if kind == _ERROR:
+            self._completed[seq] = RuntimeError(f"Detector worker failed on frame {seq}: {payload}")
+        else:
+            boxes, confidences, class_ids, tiles = payload
+            if tiles is not None:
+                if self.tiler is None:
+                    self.tiler = WorkerTilingStats()
+                self.tiler.tiles_run += tiles[0]
+                self.tiler.tiles_total += tiles[1]
+            self._completed[seq] = DetectionResult(boxes, confidences, class_ids, names=self.names)
+
+    def _await_ready(self, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        ready = 0
+        while ready < self.workers:
+            try:
+                kind, _, payload = self._results.get(timeout=1.0)
+            except queue.Empty:
+                self._check_workers()
+                if time.monotonic() > deadline:
+                    self.close()
+                    raise TimeoutError(f"Detector workers did not start within {timeout} s")
+                continue
+            if kind == _ERROR:
+                self.close()
+                raise RuntimeError(f"Detector worker failed to start: {payload}")
+            self.names = payload
+            ready += 1
+
+    def _check_workers(self) -> None:
+        dead = [process.name for process in self._processes if not process.is_alive()]
+        if dead:
+            raise RuntimeError(f"Detector worker processes exited: {', '.join(dead)}")
+
+
+Detector = Union[FireDetectionModel, ProcessDetectorPool]
+
+
+def _worker_main(factory: DetectorFactory, tasks: Any, results: Any, threads: int) -> None:
+    limit_threads(threads)
+    try:
+        detector = factory()
+    except Exception as error:
+        results.put((_ERROR, -1, repr(error)))
+        return
+    results.put((_READY, -1, dict(detector.names)))
+
+    attached: Dict[str, shared_memory.SharedMemory] = {}
+    tiler = getattr(detector, "tiler", None)
+    reported = (0, 0)  # tile counts already sent; each result carries the increment
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            seq, name, slot, slot_bytes, shape = task
+            try:
+                memory = attached.get(name)
+                if memory is None:
+                    for stale in attached.values():  # the ring was reallocated for a new frame size
+                        stale.close()
+                    attached = {name: shared_memory.SharedMemory(name=name)}
+                    memory = attached[name]
+                detection = detector.predict(slot_view(memory, slot, slot_bytes, shape))
+                tiles = None
+                if tiler is not None:
+                    tiles = (tiler.tiles_run - reported[0], tiler.tiles_total - reported[1])
+                    reported = (tiler.tiles_run, tiler.tiles_total)
+                results.put((_RESULT, seq, (detection.boxes, detection.confidences, detection.class_ids, tiles)))
+            except Exception as error:
+                results.put((_ERROR, seq, repr(error)))
+    finally:
+        for memory in attached.values():
+            memory.close()
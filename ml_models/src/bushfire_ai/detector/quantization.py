@@ -0,0 +1,193 @@
+"""INT8 post-training quantization of exported ONNX detectors.
+
+Calibration frames come from footage (a video file or a directory such as
+``videos/``) or from the images of a YOLO dataset YAML. The detection head's
+box decoding (DFL, anchor arithmetic, concatenation) is left in float so
+box coordinates keep full precision; only the convolutional backbone, neck
+and head convolutions are quantized.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.detector.postprocess import letterbox, to_blob
+
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+VIDEO_SUFFIXES = {".mp4", ".avi", ".mov", ".mkv", ".m4v", ".ts"}
+
+
+def dataset_images(data_yaml: Path, splits: Sequence[str] = ("val", "train")) -> List[Path]:
+    """Image paths of the first available split in a YOLO dataset YAML."""
+
+    try:
+        import yaml  # type: ignore
+    except ImportError as exc:  # pragma: no cover - handled at runtime
+        raise RuntimeError(
+            "PyYAML is required to read dataset YAML files. Install with `pip install pyyaml`."
+        ) from exc
+
+    config = yaml.safe_load(data_yaml.read_text()) or {}
+    root = Path(config.get("path", "."))
+    if not root.is_absolute():
+        root = (data_yaml.parent / root).resolve()
+    for split in splits:
+        entry = config.get(split)
+        if not entry:
+            continue
+        split_dir = root / entry
+        images = sorted(path for path in split_dir.rglob("*") if path.suffix.lower() in IMAGE_SUFFIXES)
+        if images:
+            return images
+    raise FileNotFoundError(f"No images found for splits {list(splits)} of {data_yaml}")
+
+
+def int8_weights_path(weights_path: Path) -> Path:
+    """Default location of the INT8 model derived from ``weights_path``."""
+
+    return weights_path.with_name(f"{weights_path.stem}_int8.onnx")
+
+
+def label_path(image_path: Path) -> Path:
+    """YOLO label file for ``image_path`` (``.../images/x.jpg`` -> ``.../labels/x.txt``)."""
+
+    parts = list(image_path.parts)
+    for index in range(len(parts) - 1, -1, -1):
+        if parts[index] == "images":
+            parts[index] = "labels"
+            break
+    return Path(*parts).with_suffix(".txt")
+
+
+def load_frames(source: Path, count: int) -> List[np.ndarray]:
+    """Sample up to ``count`` BGR frames spread evenly over ``source``.
+
+    ``source`` may be a dataset YAML, an image, a video, or a directory of
+    images and videos.
+    """
+
+    if source.suffix.lower() in {".yaml", ".yml"}:
+        return _read_images(_spread(dataset_images(source), count))
+    if source.is_dir():
+        files = sorted(path for path in source.rglob("*") if path.suffix.lower() in IMAGE_SUFFIXES | VIDEO_SUFFIXES)
+        videos = [path for path in files if path.suffix.lower() in VIDEO_SUFFIXES]
+        images = [path for path in files if path.suffix.lower() in IMAGE_SUFFIXES]
+        frames = _read_images(_spread(images, count))
+        remaining = count - len(frames)
+        for position, video in enumerate(videos):
+            share = remaining // (len(videos) - position)
+            sampled = _read_video(video, share)
+            frames.extend(sampled)
+            remaining -= len(sampled)
+        if not frames:
+            raise FileNotFoundError(f"No images or videos found under {source}")
+        return frames
+    if source.suffix.lower() in IMAGE_SUFFIXES:
+        return _read_images([source])
+    return _read_video(source, count)
+
+
+def quantize_onnx(fp32_path: Path, int8_path: Path, frames: Sequence[np.ndarray], imgsz: int = 640) -> Path:
+    """Statically quantize ``fp32_path`` to INT8 (QDQ, per-channel weights) using ``frames`` for calibration."""
+
+    try:
+        import onnx  # type: ignore
+        from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+        from onnxruntime.quantization.shape_inference import quant_pre_process
+    except ImportError as exc:  # pragma: no cover - handled at runtime
+        raise RuntimeError(
+            "onnx and onnxruntime are required for INT8 quantization. Install with `pip install onnx onnxruntime`."
+        ) from exc
+
+    if not frames:
+        raise ValueError("At least one calibration frame is required")
+
+    model = onnx.load(str(fp32_path))
+    input_name = model.graph.input[0].name
+    excluded = _head_decode_nodes([node.name for node in model.graph.node])
+
+    class FrameReader(CalibrationDataReader):
+        def __init__(self) -> None:
+            self._blobs = (to_blob(letterbox(frame, imgsz)[0][None]) for frame in frames)
+
+        def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+            blob = next(self._blobs, None)
+            return None if blob is None else {input_name: blob}
+
+    logger.info("Calibrating INT8 model on {} frames at {}px", len(frames), imgsz)
+    with tempfile.TemporaryDirectory() as tmp:
+        prepared = Path(tmp) / "prepared.onnx"
+        quant_pre_process(str(fp32_path), str(prepared), skip_symbolic_shape=True)
+        quantize_static(
+            str(prepared),
+            str(int8_path),
+            FrameReader(),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            nodes_to_exclude=excluded,
+        )
+
+    # keep the class names the backends read from the export metadata
+    quantized = onnx.load(str(int8_path))
+    existing = {prop.key for prop in quantized.metadata_props}
+    for prop in model.metadata_props:
+        if prop.key not in existing:
+            quantized.metadata_props.add(key=prop.key, value=prop.value)
+    onnx.save(quantized, str(int8_path))
+    logger.success("Wrote INT8 model to {}", int8_path)
+    return int8_path
+
+
+def _head_decode_nodes(node_names: Sequence[str]) -> List[str]:
+    """Nodes of the last ``/model.N/`` block that are not its ``cv*`` convolution branches."""
+
+    prefixes = [name.split("/")[1] for name in node_names if name.startswith("/model.")]
+    if not prefixes:
+        return []
+    head = max(prefixes, key=lambda prefix: int(prefix.split(".")[1]))
+    head_prefix = f"/{head}/"
+    return [
+        name
+        for name in node_names
+        if name.startswith(head_prefix) and not name[len(head_prefix) :].startswith("cv")
+    ]
+
+
+def _spread(items: Sequence[Path], count: int) -> List[Path]:
+    if len(items) <= count:
+        return list(items)
+    indices = np.linspace(0, len(items) - 1, count).round().astype(int)
+    return [items[index] for index in indices]
+
+
+def _read_images(paths: Sequence[Path]) -> List[np.ndarray]:
+    frames = [cv2.imread(str(path)) for path in paths]
+    return [frame for frame in frames if frame is not None]
+
+
+def _read_video(path: Path, count: int) -> List[np.ndarray]:
+    if count <= 0:
+        return []
+    capture = cv2.VideoCapture(str(path))
+    total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    wanted = set(np.linspace(0, max(total - 1, 0), count).round().astype(int).tolist()) if total > 0 else None
+    frames: List[np.ndarray] = []
+    index = 0
+    while len(frames) < count:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        if wanted is None or index in wanted:
+            frames.append(frame)
+        index += 1
+    capture.release()
+    return frames
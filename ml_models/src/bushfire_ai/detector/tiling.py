@@ -0,0 +1,142 @@
+"""Sliced inference for high-resolution frames.
+
+Shrinking a 4K frame to the model input size turns a spot fire a few pixels
+wide into less than one pixel. ``TiledInference`` instead runs overlapping
+tiles at (close to) native resolution, all frames' tiles in one backend
+call, and merges the per-tile boxes with class-aware NMS.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from bushfire_ai.detector.backends import InferenceBackend
+from bushfire_ai.detector.postprocess import non_max_suppression
+
+
+EMPTY_ROWS = np.empty((0, 6), dtype=np.float32)
+
+
+def tile_grid(width: int, height: int, tile_size: int, overlap: float) -> np.ndarray:
+    """Return ``(T, 4)`` ``x1, y1, x2, y2`` tiles covering the frame.
+
+    Tiles step by ``tile_size * (1 - overlap)``; the last row and column are
+    shifted back to end exactly on the frame edge so every tile is full size
+    (or the whole frame along an axis shorter than ``tile_size``).
+    """
+
+    def starts(length: int) -> np.ndarray:
+        if length <= tile_size:
+            return np.zeros(1, dtype=np.int64)
+        step = max(1, int(tile_size * (1.0 - overlap)))
+        positions = np.arange(0, length - tile_size + 1, step)
+        if positions[-1] != length - tile_size:
+            positions = np.append(positions, length - tile_size)
+        return positions
+
+    xs, ys = starts(width), starts(height)
+    x1, y1 = np.meshgrid(xs, ys)
+    x1, y1 = x1.ravel(), y1.ravel()
+    return np.stack(
+        [x1, y1, np.minimum(x1 + tile_size, width), np.minimum(y1 + tile_size, height)],
+        axis=1,
+    )
+
+
+def tiles_with_candidates(tiles: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Boolean mask of tiles that intersect any candidate box."""
+
+    if candidates.shape[0] == 0:
+        return np.zeros(tiles.shape[0], dtype=bool)
+    top_left = np.maximum(tiles[:, None, :2], candidates[None, :, :2])
+    bottom_right = np.minimum(tiles[:, None, 2:], candidates[None, :, 2:])
+    return (bottom_right > top_left).all(axis=2).any(axis=1)
+
+
+def merge_detections(rows: Sequence[np.ndarray], iou_threshold: float, max_detections: int) -> np.ndarray:
+    """Concatenate ``x1, y1, x2, y2, conf, cls`` rows and drop cross-tile duplicates with class-aware NMS."""
+
+    rows = [block for block in rows if block.shape[0]]
+    if not rows:
+        return EMPTY_ROWS
+    merged = np.concatenate(rows)
+    keep = non_max_suppression(merged[:, :4], merged[:, 4], iou_threshold, merged[:, 5], max_detections)
+    return merged[keep]
+
+
+class TiledInference:
+    """Runs a backend on overlapping tiles and merges the results per frame.
+
+    With ``full_frame`` the whole frame is inferred too, keeping fires large
+    enough to be cut apart by tile borders. With ``prefilter_confidence``
+    that full-frame pass runs at the lower threshold and only tiles touching
+    one of its candidates are inferred.
+    """
+
+    def __init__(
+        self,
+        tile_size: int = 640,
+        overlap: float = 0.2,
+        full_frame: bool = True,
+        prefilter_confidence: Optional[float] = None,
+    ) -> None:
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.full_frame = full_frame
+        self.prefilter_confidence = prefilter_confidence
+        self.tiles_total = 0
+        self.tiles_run = 0
+
+    @property
+    def tiles_skipped_fraction(self) -> float:
+        return 1.0 - self.tiles_run / self.tiles_total if self.tiles_total else 0.0
+
+    def infer(
+        self,
+        backend: InferenceBackend,
+        frames: Sequence[np.ndarray],
+        confidence_threshold: float,
+        iou_threshold: float,
+        max_detections: int,
+    ) -> List[np.ndarray]:
+        prefilter = self.prefilter_confidence
+        ran_full = self.full_frame or prefilter is not None
+        full_rows: List[np.ndarray] = [EMPTY_ROWS] * len(frames)
+        if ran_full:
+            full_conf = min(confidence_threshold, prefilter) if prefilter is not None else confidence_threshold
+            full_rows = backend.infer(frames, full_conf, iou_threshold, max_detections)
+
+        crops: List[np.ndarray] = []
+        origins: List[np.ndarray] = []
+        owners: List[int] = []
+        keep_full = [self.full_frame] * len(frames)
+        for index, frame in enumerate(frames):
+            height, width = frame.shape[:2]
+            tiles = tile_grid(width, height, self.tile_size, self.overlap)
+            self.tiles_total += tiles.shape[0]
+            if tiles.shape[0] == 1 and ran_full:
+                keep_full[index] = True  # the frame fits in one tile, which the full-frame pass already covered
+                continue
+            if prefilter is not None:
+                tiles = tiles[tiles_with_candidates(tiles, full_rows[index][:, :4])]
+            for x1, y1, x2, y2 in tiles.tolist():
+                crops.append(frame[y1:y2, x1:x2])
+                origins.append(np.array([x1, y1, x1, y1], dtype=np.float32))
+                owners.append(index)
+        self.tiles_run += len(crops)
+
+        per_frame: List[List[np.ndarray]] = [[] for _ in frames]
+        for index, rows in enumerate(full_rows):
+            if keep_full[index]:
+                per_frame[index].append(rows[rows[:, 4] >= confidence_threshold])
+        if crops:
+            tile_rows = backend.infer(crops, confidence_threshold, iou_threshold, max_detections)
+            for rows, origin, owner in zip(tile_rows, origins, owners):
+                if rows.shape[0]:
+                    shifted = rows.copy()
+                    shifted[:, :4] += origin
+                    per_frame[owner].append(shifted)
+
+        return [merge_detections(rows, iou_threshold, max_detections) for rows in per_frame]
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import io
 import json
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, BinaryIO, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 import httpx
 from loguru import logger
@@ -13,6 +20,11 @@ from loguru import logger
 from bushfire_ai.config.settings import CamaraConfig
 
 
+T = TypeVar("T")
+
+DEFAULT_TOKEN_LIFETIME_SEC = 3600.0
+
+
 MOCK_LOCATION = {
     "latitude": -33.708,
     "longitude": 150.311,
@@ -44,19 +56,241 @@ MOCK_UPLOAD = {
 }
 
 
+def http2_available() -> bool:
+    """HTTP/2 in httpx needs the optional ``h2`` package."""
+
+    return importlib.util.find_spec("h2") is not None
+
+
+def seconds_until(timestamp: Optional[str]) -> float:
+    """Seconds from now until an ISO-8601 ``timestamp`` (0 when missing or unparseable)."""
+
+    if not timestamp:
+        return 0.0
+    try:
+        moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - datetime.now(timezone.utc)).total_seconds()
+
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class UploadProgress:
+    """Counts bytes read from an upload's file parts and reports every ``step`` of the total.
+
+    httpx rewinds file parts before (re)sending them, so a retried request
+    restarts the count instead of exceeding the total.
+    """
+
+    def __init__(self, total: int, callback: ProgressCallback, step: float = 0.25) -> None:
+        self.total = total
+        self.callback = callback
+        self.step = max(1, int(total * step))
+        self._readers: List[_ProgressReader] = []
+        self._next_report = self.step
+
+    @property
+    def sent(self) -> int:
+        return sum(reader.position for reader in self._readers)
+
+    def wrap(self, handle: BinaryIO) -> "_ProgressReader":
+        reader = _ProgressReader(handle, self)
+        self._readers.append(reader)
+        return reader
+
+    def _advanced(self) -> None:
+        sent = self.sent
+        if sent >= self._next_report or sent == self.total:
+            self._rewound()
+            self.callback(sent, self.total)
+
+    def _rewound(self) -> None:
+        self._next_report = (self.sent // self.step + 1) * self.step
+
+
+class _ProgressReader:
+    """Binary file wrapper that reports its read position to an ``UploadProgress``."""
+
+    def __init__(self, handle: BinaryIO, progress: UploadProgress) -> None:
+        self.handle = handle
+        self.progress = progress
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.handle.read(size)
+        if chunk:
+            self.position += len(chunk)
+            self.progress._advanced()
+        return chunk
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.position = self.handle.seek(offset, whence)
+        self.progress._rewound()
+        return self.position
+
+    def tell(self) -> int:
+        return self.handle.tell()
+
+    def fileno(self) -> int:
+        return self.handle.fileno()
+
+
+def _log_progress(name: str, sent: int, total: int) -> None:
+    logger.debug("Uploading {}: {:.0%} of {:.1f} MB", name, sent / total if total else 1.0, total / 1e6)
+
+
+class TtlCache:
+    """Per-key values that expire; concurrent misses on one key share a single fetch.
+
+    ``fetch`` returns the value and how many seconds it stays valid; values
+    with a non-positive lifetime are returned but not kept. Must be used from
+    one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Tuple[Any, float]]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._fill(key, fetch))
+            self._inflight[key] = pending
+        # a cancelled caller must not cancel the fetch other callers are waiting on
+        return await asyncio.shield(pending)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def _fill(self, key: str, fetch: Callable[[], Awaitable[Tuple[Any, float]]]) -> Any:
+        try:
+            value, ttl = await fetch()
+            if ttl > 0:
+                self._entries[key] = (time.monotonic() + ttl, value)
+            else:
+                self._entries.pop(key, None)
+            return value
+        finally:
+            del self._inflight[key]
+
+
 class CamaraClient:
+    """Async CAMARA API client sharing one pooled HTTP connection set across calls.
+
+    The underlying ``httpx.AsyncClient`` is created on first use, so it
+    belongs to the event loop that runs the requests. The OAuth token is
+    refreshed ``token_refresh_margin_sec`` (at most half its lifetime) before
+    it expires, locations are cached per device for ``location_ttl_sec`` and
+    a granted QoD session is reused until shortly before its ``validUntil``.
+    """
+
     def __init__(self, config: CamaraConfig) -> None:
         self.config = config
-        self._token: Optional[str] = None
-        self._client = httpx.AsyncClient(timeout=self.config.timeout_seconds)
+        self._client: Optional[httpx.AsyncClient] = None
+        self.token_cache = TtlCache()
+        self.location_cache = TtlCache()
+        self.qod_cache = TtlCache()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            http2 = self.config.http2 and http2_available()
+            if self.config.http2 and not http2:
+                logger.warning("HTTP/2 requested for CAMARA but the 'h2' package is missing; using HTTP/1.1")
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout_seconds,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                ),
+            )
+        return self._client
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        caches = {"token": self.token_cache, "location": self.location_cache, "qod": self.qod_cache}
+        return {
+            name: {"hits": cache.hits, "misses": cache.misses, "hit_rate": cache.hit_rate}
+            for name, cache in caches.items()
+        }
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _get_token(self) -> str:
-        if self._token:
-            return self._token
+        return await self.token_cache.get("token", self._fetch_token)
+
+    async def get_location(self, device_id: str) -> Dict[str, Any]:
+        return await self.location_cache.get(device_id, partial(self._fetch_location, device_id))
+
+    async def request_quality_on_demand(self, device_id: str) -> Optional[Dict[str, Any]]:
+        if not self.config.qod_url:
+            return None
+        return await self.qod_cache.get(device_id, partial(self._fetch_qod, device_id))
 
+    async def upload_incident(
+        self,
+        metadata: Dict[str, Any],
+        image_path: Path,
+        clip_path: Optional[Path] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Post the incident as multipart form data, streaming the evidence files from disk.
+
+        httpx reads the open handles in 64 KiB chunks while sending, so memory
+        use does not grow with clip size. ``progress`` receives ``(sent, total)``
+        byte counts as the upload advances.
+        """
+
+        parts = [("frame", image_path, "image/jpeg")]
+        if clip_path and clip_path.exists():
+            parts.append(("clip", clip_path, "video/mp4"))
+        tracker = UploadProgress(
+            sum(path.stat().st_size for _, path, _ in parts),
+            progress or partial(_log_progress, image_path.stem),
+        )
+        with ExitStack() as stack:
+            files: Dict[str, Any] = {"metadata": (None, json.dumps(metadata), "application/json")}
+            for field, path, content_type in parts:
+                handle = stack.enter_context(path.open("rb"))
+                files[field] = (path.name, tracker.wrap(handle), content_type)
+            response = await self._authorized("POST", str(self.config.upload_url), files=files)
+        return response.json()
+
+    async def _authorized(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request with the cached token, refreshing it once if the server rejects it."""
+
+        for attempt in range(2):
+            token = await self._get_token()
+            response = await self.http.request(method, url, headers={"Authorization": f"Bearer {token}"}, **kwargs)
+            if response.status_code != 401 or attempt:
+                break
+            logger.info("CAMARA rejected the access token; refreshing it")
+            self.token_cache.invalidate("token")
+        response.raise_for_status()
+        return response
+
+    async def _fetch_token(self) -> Tuple[str, float]:
         data = {
             "grant_type": "client_credentials",
             "client_id": self.config.client_id,
@@ -64,80 +298,128 @@ class CamaraClient:
             "scope": self.config.scope,
         }
 
-        response = await self._client.post(str(self.config.token_url), data=data)
+        response = await self.http.post(str(self.config.token_url), data=data)
         response.raise_for_status()
         payload = response.json()
-        self._token = payload["access_token"]
-        return self._token
+        expires_in = float(payload.get("expires_in", DEFAULT_TOKEN_LIFETIME_SEC))
+        return payload["access_token"], self._refresh_before(expires_in)
 
-    async def get_location(self, device_id: str) -> Dict[str, Any]:
-        token = await self._get_token()
-        endpoint = f"{self.config.base_url}{self.config.location_endpoint}"
-        headers = {"Authorization": f"Bearer {token}"}
-        response = await self._client.get(endpoint, params={"deviceId": device_id}, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    async def _fetch_location(self, device_id: str) -> Tuple[Dict[str, Any], float]:
+        endpoint = f"{str(self.config.base_url).rstrip('/')}{self.config.location_endpoint}"
+        response = await self._authorized("GET", endpoint, params={"deviceId": device_id})
+        return response.json(), self.config.location_ttl_sec
 
-    async def request_quality_on_demand(self, device_id: str) -> Optional[Dict[str, Any]]:
-        if not self.config.qod_url:
-            return None
-        token = await self._get_token()
+    async def _fetch_qod(self, device_id: str) -> Tuple[Dict[str, Any], float]:
         payload = {"deviceId": device_id, "priority": "high"}
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        response = await self._client.post(str(self.config.qod_url), json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        response = await self._authorized("POST", str(self.config.qod_url), json=payload)
+        session = response.json()
+        return session, self._qod_lifetime(session)
+
+    def _qod_lifetime(self, session: Dict[str, Any]) -> float:
+        if not self.config.qod_reuse:
+            return 0.0
+        return self._refresh_before(seconds_until(session.get("validUntil")))
+
+    def _refresh_before(self, lifetime: float) -> float:
+        """Cache lifetime for a credential valid for ``lifetime`` seconds.
+
+        The refresh margin is capped at half the lifetime, so short-lived
+        tokens and sessions are still cached instead of fetched on every call.
+        """
+
+        return lifetime - min(self.config.token_refresh_margin_sec, lifetime / 2)
+
+
+class MockCamaraClient(CamaraClient):
+    """Offline stand-in that answers with canned responses for a bushfire-prone area in Australia.
+
+    Responses go through the same caches as the live client; the mock QoD
+    session is valid for 30 minutes from the request.
+    """
+
+    async def close(self) -> None:
+        return None
+
+    async def request_quality_on_demand(self, device_id: str) -> Optional[Dict[str, Any]]:
+        return await self.qod_cache.get(device_id, partial(self._fetch_qod, device_id))
+
+    async def _fetch_token(self) -> Tuple[str, float]:
+        return "mock-token", DEFAULT_TOKEN_LIFETIME_SEC
+
+    async def _fetch_location(self, device_id: str) -> Tuple[Dict[str, Any], float]:
+        return dict(MOCK_LOCATION), self.config.location_ttl_sec
+
+    async def _fetch_qod(self, device_id: str) -> Tuple[Dict[str, Any], float]:
+        valid_until = datetime.now(timezone.utc) + timedelta(minutes=30)
+        session = dict(MOCK_QOD, validUntil=valid_until.isoformat().replace("+00:00", "Z"))
+        return session, self._qod_lifetime(session)
 
     async def upload_incident(
         self,
         metadata: Dict[str, Any],
         image_path: Path,
         clip_path: Optional[Path] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
-        token = await self._get_token()
-        headers = {"Authorization": f"Bearer {token}"}
+        return dict(MOCK_UPLOAD)
 
-        files = {
-            "metadata": (None, json.dumps(metadata), "application/json"),
-            "frame": (image_path.name, image_path.read_bytes(), "image/jpeg"),
-        }
-        if clip_path and clip_path.exists():
-            files["clip"] = (clip_path.name, clip_path.read_bytes(), "video/mp4")
 
-        response = await self._client.post(str(self.config.upload_url), files=files, headers=headers)
-        response.raise_for_status()
-        return response.json()
+def create_camara_client(config: CamaraConfig) -> CamaraClient:
+    return MockCamaraClient(config) if config.offline else CamaraClient(config)
 
 
 class CamaraClientSyncAdapter:
-    """Synchronous adapter for environments without async orchestration."""
+    """Synchronous adapter that runs client coroutines on one persistent event loop.
+
+    ``asyncio.run`` per call would build a new loop each time, and the
+    client's pooled connections cannot outlive the loop they were opened on.
+    The loop runs on a daemon thread started by the first call, and any
+    number of threads may call into it at once.
+    """
 
     def __init__(self, client: CamaraClient) -> None:
         self.client = client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run ``coroutine`` on the background loop and wait for its result."""
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop()).result(timeout)
 
     def get_location(self, device_id: str) -> Dict[str, Any]:
-        # return asyncio.run(self.client.get_location(device_id))
-        
-        # Offline stub: return mock coordinates for a bushfire-prone area in Australia.
-        return dict(MOCK_LOCATION)
+        return self.run(self.client.get_location(device_id))
 
     def request_quality_on_demand(self, device_id: str) -> Optional[Dict[str, Any]]:
-        # return asyncio.run(self.client.request_quality_on_demand(device_id))
-
-        # Offline stub: return a mock QoD response as if from CAMARA API.
-        return dict(MOCK_QOD)
+        return self.run(self.client.request_quality_on_demand(device_id))
 
     def upload_incident(
         self,
         metadata: Dict[str, Any],
         image_path: Path,
         clip_path: Optional[Path] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
-        # return asyncio.run(self.client.upload_incident(metadata, image_path, clip_path))
+        return self.run(self.client.upload_incident(metadata, image_path, clip_path, progress))
 
-        # Offline stub: return a mock upload response as if from CAMARA API.
-        return dict(MOCK_UPLOAD)
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), loop).result(self.client.config.timeout_seconds)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5.0)
+            loop.close()
 
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="camara-loop", daemon=True)
+                self._thread.start()
+            return self._loop
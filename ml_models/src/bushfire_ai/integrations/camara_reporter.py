@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
 
 from loguru import logger
 
 from bushfire_ai.config.settings import Settings
-from bushfire_ai.integrations.camara_client import CamaraClient, CamaraClientSyncAdapter
+from bushfire_ai.integrations.camara_client import CamaraClientSyncAdapter, create_camara_client
+from bushfire_ai.integrations.outbox import IncidentOutbox, OutboxEntry
+from bushfire_ai.storage.keyframes import render_annotated
+from bushfire_ai.utils.metrics import LatencyWindow, PipelineMetrics
+
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -20,10 +28,80 @@ class IncidentPayload:
 
 
 class IncidentReporter:
-    def __init__(self, settings: Settings) -> None:
+    """Reports incidents to CAMARA; location and QoD are requested concurrently before the upload.
+
+    ``report_incident`` may be called from any thread: the work runs on the
+    adapter's shared event loop, so concurrent reports share one connection pool.
+
+    With the outbox enabled each incident is stored before its first upload
+    attempt. Failed uploads stay in the outbox, and a drainer task on the same
+    loop retries them with backoff, highest confidence first, including
+    entries left over from an earlier run. ``on_uploaded`` is called with the
+    keyframe path once an entry leaves the outbox (delivered, or dropped
+    because its keyframe is gone), so the artifact store can evict it again.
+
+    Keyframes are stored raw; the annotated render is drawn (once, then
+    cached) just before the upload unless ``keyframe_annotation`` is off.
+    """
+
+    def __init__(self, settings: Settings, metrics: Optional[PipelineMetrics] = None) -> None:
         self.settings = settings
-        self.client = CamaraClient(settings.camara)
+        self.client = create_camara_client(settings.camara)
         self.adapter = CamaraClientSyncAdapter(self.client)
+        metrics = metrics or PipelineMetrics()
+        self._location_latency = metrics.latency("camara_location")
+        self._qod_latency = metrics.latency("camara_qod")
+        self._upload_latency = metrics.latency("camara_upload")
+        self._cache_counters = {
+            name: (metrics.counter(f"camara_{name}_cache_hits"), metrics.counter(f"camara_{name}_cache_misses"))
+            for name in self.client.cache_stats()
+        }
+
+        config = settings.outbox
+        self.outbox: Optional[IncidentOutbox] = None
+        if config.enabled:
+            self.outbox = IncidentOutbox(
+                config.path or settings.events.artifact_dir / "outbox.sqlite3",
+                base_backoff_sec=config.base_backoff_sec,
+                max_backoff_sec=config.max_backoff_sec,
+            )
+            metrics.gauge("outbox_depth", self.outbox.depth)
+        self._delivered = metrics.counter("outbox_delivered")
+        self._retries = metrics.counter("outbox_retries")
+        self._upload_slots = asyncio.Semaphore(config.concurrency)
+        self._inflight: Set[int] = set()
+        self._drainer: Optional[asyncio.Task] = None
+        self.on_uploaded: Optional[Callable[[Path], None]] = None
+
+    def start(self) -> None:
+        """Begin draining incidents that are still in the outbox from an earlier run."""
+
+        if self.outbox and self.outbox.depth():
+            logger.info("Outbox holds {} undelivered incidents; draining in the background", self.outbox.depth())
+            self.adapter.run(self._start_drainer())
+
+    def close(self) -> None:
+        stats = self.client.cache_stats()
+        if any(entry["hits"] + entry["misses"] for entry in stats.values()):
+            logger.info(
+                "CAMARA cache hit rates: {}",
+                ", ".join(
+                    f"{name} {entry['hit_rate']:.0%} ({entry['hits']:.0f}/{entry['hits'] + entry['misses']:.0f})"
+                    for name, entry in stats.items()
+                ),
+            )
+        if self._drainer is not None:
+            self.adapter.run(self._stop_drainer())
+        if self.outbox:
+            pending = self.outbox.depth()
+            logger.info(
+                "Outbox delivered {} incidents after {} retries; {} pending for the next run",
+                self._delivered.value,
+                self._retries.value,
+                pending,
+            )
+            self.outbox.close()
+        self.adapter.close()
 
     def build_metadata(
         self,
@@ -31,6 +109,7 @@ class IncidentReporter:
         detection_labels: list[str],
         location_payload: Optional[Dict[str, Any]],
         qod_payload: Optional[Dict[str, Any]],
+        tracks: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         metadata: Dict[str, Any] = {
             "eventType": "fire_detection",
@@ -41,6 +120,8 @@ class IncidentReporter:
             metadata["location"] = location_payload
         if qod_payload:
             metadata["quality"] = qod_payload
+        if tracks:
+            metadata["tracks"] = tracks
         return metadata
 
     def report_incident(
@@ -49,33 +130,177 @@ class IncidentReporter:
         detection_labels: list[str],
         frame_path: Path,
         clip_path: Optional[Path],
+        device_id: Optional[str] = None,
+        tracks: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        return self.adapter.run(
+            self.report_incident_async(confidence, detection_labels, frame_path, clip_path, device_id, tracks)
+        )
+
+    async def report_incident_async(
+        self,
+        confidence: float,
+        detection_labels: list[str],
+        frame_path: Path,
+        clip_path: Optional[Path],
+        device_id: Optional[str] = None,
+        tracks: Optional[List[Dict[str, Any]]] = None,
     ) -> Optional[Dict[str, Any]]:
-        device_id = self.settings.device_id
+        started = time.perf_counter()
+        device_id = device_id or self.settings.device_id
         location_payload: Optional[Dict[str, Any]] = None
         qod_payload: Optional[Dict[str, Any]] = None
 
         if device_id:
-            try:
-                location_payload = self.adapter.get_location(device_id)
+            location_payload, qod_payload = await asyncio.gather(
+                self._timed(self.client.get_location(device_id), self._location_latency),
+                self._timed(self.client.request_quality_on_demand(device_id), self._qod_latency),
+                return_exceptions=True,
+            )
+            if isinstance(location_payload, Exception):
+                logger.opt(exception=location_payload).error("Failed to retrieve location data from CAMARA")
+                location_payload = None
+            else:
                 logger.info("Retrieved location from CAMARA for device {}", device_id)
-            except Exception:
-                logger.exception("Failed to retrieve location data from CAMARA")
+            if isinstance(qod_payload, Exception):
+                logger.opt(exception=qod_payload).error("Failed to request QoD from CAMARA")
+                qod_payload = None
+            elif qod_payload:
+                logger.info("Requested Quality-on-Demand for critical event")
+
+        metadata = self.build_metadata(confidence, detection_labels, location_payload, qod_payload, tracks)
 
+        self._sync_cache_counters()
+        logger.debug(
+            "Reporting incident to CAMARA with metadata: {}, frame_path: {}, clip_path: {}",
+            metadata,
+            frame_path,
+            clip_path,
+        )
+        if self.outbox is not None:
+            await self._start_drainer()
+            response = await self._deliver(self.outbox.add(confidence, metadata, frame_path, clip_path))
+            if response is None:
+                return None
+        else:
             try:
-                qod_payload = self.adapter.request_quality_on_demand(device_id)
-                if qod_payload:
-                    logger.info("Requested Quality-on-Demand for critical event")
+                image_path = await self._evidence_image(frame_path)
+                response = await self._timed(
+                    self.client.upload_incident(metadata, image_path, clip_path), self._upload_latency
+                )
             except Exception:
-                logger.exception("Failed to request QoD from CAMARA")
+                logger.exception("Failed to upload incident to CAMARA")
+                return None
+        logger.info(
+            "Incident reported to CAMARA in {:.0f} ms: {}", (time.perf_counter() - started) * 1000.0, response
+        )
+        return response
+
+    async def _deliver(self, entry: OutboxEntry) -> Optional[Dict[str, Any]]:
+        """Upload one outbox entry; on failure it is rescheduled and None is returned."""
+
+        assert self.outbox is not None
+        self._inflight.add(entry.entry_id)
+        try:
+            async with self._upload_slots:
+                if not entry.frame_path.exists():
+                    logger.warning(
+                        "Dropping outbox incident {}: keyframe {} no longer exists", entry.entry_id, entry.frame_path
+                    )
+                    self.outbox.remove(entry.entry_id)
+                    self._uploaded(entry.frame_path)
+                    return None
+                image_path = await self._evidence_image(entry.frame_path)
+                try:
+                    response = await self._timed(
+                        self.client.upload_incident(entry.metadata, image_path, entry.clip_path),
+                        self._upload_latency,
+                    )
+                except Exception as error:
+                    delay = self.outbox.retry_later(entry.entry_id, repr(error))
+                    self._retries.inc()
+                    logger.warning(
+                        "Upload of incident {} failed (attempt {}): {}; retrying in {:.0f} s",
+                        entry.entry_id,
+                        entry.attempts + 1,
+                        error,
+                        delay,
+                    )
+                    return None
+                self.outbox.remove(entry.entry_id)
+                self._uploaded(entry.frame_path)
+                self._delivered.inc()
+                return response
+        finally:
+            self._inflight.discard(entry.entry_id)
+
+    def _uploaded(self, frame_path: Path) -> None:
+        if self.on_uploaded is None:
+            return
+        try:
+            self.on_uploaded(frame_path)
+        except Exception:
+            logger.exception("Failed to release uploaded incident {} for eviction", frame_path)
 
-        metadata = self.build_metadata(confidence, detection_labels, location_payload, qod_payload)
+    async def _evidence_image(self, frame_path: Path) -> Path:
+        """The image uploaded for ``frame_path``: its annotated render, or the raw keyframe."""
 
+        if self.settings.events.keyframe_annotation == "off":
+            return frame_path
         try:
-            logger.debug(f"Reporting incident to CAMARA with metadata: {metadata}, frame_path: {frame_path}, clip_path: {clip_path}")
-            response = self.adapter.upload_incident(metadata, frame_path, clip_path)
-            logger.info("Incident reported to CAMARA: {}", response)
-            return response
+            return await asyncio.get_running_loop().run_in_executor(None, render_annotated, frame_path)
         except Exception:
-            logger.exception("Failed to upload incident to CAMARA")
-            return None
+            logger.exception("Failed to annotate keyframe {}; uploading it unannotated", frame_path)
+            return frame_path
 
+    async def _start_drainer(self) -> None:
+        if self._drainer is None:
+            self._drainer = asyncio.ensure_future(self._drain_forever())
+
+    async def _stop_drainer(self) -> None:
+        if self._drainer is not None:
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+            self._drainer = None
+
+    async def _drain_forever(self) -> None:
+        assert self.outbox is not None
+        config = self.settings.outbox
+        while True:
+            try:
+                entries = self.outbox.due(config.concurrency, exclude=self._inflight)
+                if entries:
+                    delivered = await asyncio.gather(*(self._deliver(entry) for entry in entries))
+                    if any(response is not None for response in delivered):
+                        logger.info(
+                            "Outbox delivered {} of {} retried incidents; {} pending",
+                            sum(response is not None for response in delivered),
+                            len(entries),
+                            self.outbox.depth(),
+                        )
+                    continue
+                wait = self.outbox.next_due_in()
+            except Exception:
+                logger.exception("Outbox drainer failed; retrying")
+                wait = config.poll_interval_sec
+            # entries being delivered right now are due but excluded, so never spin on them
+            if wait is None:
+                wait = config.poll_interval_sec
+            await asyncio.sleep(min(max(wait, 0.5), config.poll_interval_sec))
+
+    def _sync_cache_counters(self) -> None:
+        for name, entry in self.client.cache_stats().items():
+            hits, misses = self._cache_counters[name]
+            hits.set(int(entry["hits"]))
+            misses.set(int(entry["misses"]))
+
+    @staticmethod
+    async def _timed(coroutine: Awaitable[T], latency: LatencyWindow) -> T:
+        started = time.perf_counter()
+        try:
+            return await coroutine
+        finally:
+            latency.observe(time.perf_counter() - started)
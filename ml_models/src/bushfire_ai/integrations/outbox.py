@@ -0,0 +1,146 @@
+"""Durable SQLite outbox for incidents that still have to reach CAMARA."""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    confidence REAL NOT NULL,
+    metadata TEXT NOT NULL,
+    frame_path TEXT NOT NULL,
+    clip_path TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS incidents_due ON incidents (next_attempt, confidence DESC);
+"""
+
+
+@dataclass
+class OutboxEntry:
+    entry_id: int
+    created: float
+    confidence: float
+    metadata: Dict[str, Any]
+    frame_path: Path
+    clip_path: Optional[Path]
+    attempts: int = 0
+
+
+class IncidentOutbox:
+    """Incidents waiting for upload, kept in SQLite so they survive restarts and uplink loss.
+
+    Entries are written before the first upload attempt and deleted once
+    CAMARA accepts them. A failed attempt reschedules the entry with
+    exponential backoff (``base_backoff_sec * 2**(attempts - 1)`` capped at
+    ``max_backoff_sec``, with jitter). ``due`` hands out the highest
+    confidence entries first.
+    """
+
+    def __init__(self, path: Path, base_backoff_sec: float = 2.0, max_backoff_sec: float = 300.0) -> None:
+        self.path = path
+        self.base_backoff_sec = base_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._final_depth: Optional[int] = None
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def add(
+        self,
+        confidence: float,
+        metadata: Dict[str, Any],
+        frame_path: Path,
+        clip_path: Optional[Path] = None,
+    ) -> OutboxEntry:
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO incidents (created, confidence, metadata, frame_path, clip_path, next_attempt) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (now, confidence, json.dumps(metadata), str(frame_path), str(clip_path) if clip_path else None, now),
+            )
+        return OutboxEntry(cursor.lastrowid, now, confidence, metadata, frame_path, clip_path)
+
+    def due(self, limit: int, exclude: Collection[int] = ()) -> List[OutboxEntry]:
+        """Entries whose next attempt is due, highest confidence first, skipping ``exclude``."""
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, created, confidence, metadata, frame_path, clip_path, attempts FROM incidents "
+                "WHERE next_attempt <= ? ORDER BY confidence DESC, created LIMIT ?",
+                (time.time(), limit + len(exclude)),
+            ).fetchall()
+        entries = [
+            OutboxEntry(
+                entry_id=row[0],
+                created=row[1],
+                confidence=row[2],
+                metadata=json.loads(row[3]),
+                frame_path=Path(row[4]),
+                clip_path=Path(row[5]) if row[5] else None,
+                attempts=row[6],
+            )
+            for row in rows
+            if row[0] not in exclude
+        ]
+        return entries[:limit]
+
+    def remove(self, entry_id: int) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM incidents WHERE id = ?", (entry_id,))
+
+    def retry_later(self, entry_id: int, error: str) -> float:
+        """Record a failed attempt and return the delay before the next one."""
+
+        with self._lock:
+            row = self._db.execute("SELECT attempts FROM incidents WHERE id = ?", (entry_id,)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            delay = self.backoff(attempts)
+            self._db.execute(
+                "UPDATE incidents SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                (attempts, time.time() + delay, error[:500], entry_id),
+            )
+        return delay
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.max_backoff_sec, self.base_backoff_sec * 2 ** max(0, attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def depth(self) -> int:
+        with self._lock:
+            if self._final_depth is not None:
+                return self._final_depth
+            return self._db.execute("SELECT COUNT(*) FROM incidents").fetchone()[0]
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest entry is due (0 if one is due now), or None when empty."""
+
+        with self._lock:
+            row = self._db.execute("SELECT MIN(next_attempt) FROM incidents").fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def close(self) -> None:
+        """Close the database; ``depth`` keeps reporting the final count for late metric exports."""
+
+        with self._lock:
+            if self._final_depth is None:
+                self._final_depth = self._db.execute("SELECT COUNT(*) FROM incidents").fetchone()[0]
+                self._db.close()
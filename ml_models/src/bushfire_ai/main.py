@@ -3,45 +3,185 @@
 from __future__ import annotations
 
 import argparse
+import sys
 
 from pathlib import Path
+from typing import List, Optional
 
-from bushfire_ai.config.settings import Settings
+from loguru import logger
+
+from bushfire_ai.config.settings import Settings, read_stream_entries, streams_from_sources
+from bushfire_ai.pipeline.batch import BatchRunner, discover_videos
+from bushfire_ai.pipeline.multi_stream import MultiStreamOrchestrator
 from bushfire_ai.pipeline.orchestrator import PipelineOrchestrator
+from bushfire_ai.storage.keyframes import find_keyframes, render_annotated
 from bushfire_ai.utils.logging import configure_logging
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Bushfire detection pipeline")
-    parser.add_argument("--source", help="Video source (camera index, file path, or RTSP URL)")
+    parser.add_argument(
+        "--source",
+        action="append",
+        help="Video source (camera index, file path, or RTSP URL). Repeat to run several streams.",
+    )
+    parser.add_argument(
+        "--sources-file",
+        help="File listing streams (one '<source> [device_id] [name]' per line, or a JSON list)",
+        default=None,
+    )
+    add_model_args(parser)
+    parser.add_argument(
+        "--capture-mode",
+        choices=["sync", "threaded"],
+        default=None,
+        help="Decode frames on the inference thread (sync) or a background capture thread (threaded).",
+    )
+    parser.add_argument(
+        "--drop-policy",
+        choices=["latest", "drop_oldest", "block"],
+        default=None,
+        help="Threaded capture behaviour when inference falls behind.",
+    )
+    parser.add_argument("--run-seconds", type=float, help="Optional runtime limit in seconds")
+    parser.add_argument(
+        "--track-update-interval",
+        type=float,
+        default=None,
+        help="Seconds between batched updates for fires that are already reported.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this port (overrides METRICS_PORT; 0 picks a free port).",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_batch_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="bushfire_ai.main batch",
+        description="Reprocess recorded videos offline across worker processes",
+    )
+    parser.add_argument("inputs", nargs="+", help="Video files, directories or glob patterns")
+    parser.add_argument("--output", required=True, help="Directory for detections.jsonl, incidents.jsonl, summary.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU core)")
+    parser.add_argument("--segment-seconds", type=float, default=300.0, help="Length of the time ranges per task")
+    parser.add_argument(
+        "--warmup-seconds",
+        type=float,
+        default=2.0,
+        help="Footage before each range fed to the tracker only, so ongoing fires are not re-reported",
+    )
+    add_model_args(parser)
+    return parser.parse_args(argv)
+
+
+def parse_render_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="bushfire_ai.main render",
+        description="Draw detections onto stored keyframes (cached; each keyframe is drawn once)",
+    )
+    parser.add_argument("inputs", nargs="+", help="Keyframe files or artifact directories")
+    parser.add_argument("--log-level", default="INFO", help="Log level")
+    parser.add_argument("--json-logs", action="store_true", help="Emit logs in JSON format")
+    return parser.parse_args(argv)
+
+
+def add_model_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--weights", help="Path to model weights", default=None)
     parser.add_argument("--device", help="Torch device (cpu, cuda:0, etc.)", default=None)
+    parser.add_argument(
+        "--backend",
+        choices=["ultralytics", "onnxruntime", "openvino"],
+        help="Inference backend (overrides FIRE_BACKEND); exported models need the matching --weights",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["standard", "fast"],
+        help="Detection profile (overrides FIRE_PROFILE); 'fast' runs the INT8 model at FIRE_FAST_IMGSZ",
+    )
     parser.add_argument("--env", help="Path to environment file", default=None)
-    parser.add_argument("--run-seconds", type=float, help="Optional runtime limit in seconds")
     parser.add_argument("--log-level", default="INFO", help="Log level")
     parser.add_argument("--json-logs", action="store_true", help="Emit logs in JSON format")
-    parser.add_argument(
-        "--skip-frames-after-detection",
-        type=int,
-        default=None,
-        help="Override number of frames to skip after a detection event.",
+
+
+def apply_model_args(settings: Settings, args: argparse.Namespace) -> None:
+    if args.weights:
+        settings.detection.weights_path = Path(args.weights)
+    if args.backend:
+        settings.detection.backend = args.backend
+    if args.profile:
+        settings.detection.profile = args.profile
+
+
+def run_batch(argv: List[str]) -> None:
+    args = parse_batch_args(argv)
+    configure_logging(args.log_level, args.json_logs)
+
+    settings = Settings.from_env(args.env)
+    apply_model_args(settings, args)
+    videos = discover_videos(args.inputs)
+    if not videos:
+        raise SystemExit(f"No videos found in {' '.join(args.inputs)}")
+    runner = BatchRunner(
+        settings,
+        Path(args.output),
+        workers=args.workers,
+        segment_sec=args.segment_seconds,
+        warmup_sec=args.warmup_seconds,
+        device=args.device,
     )
-    return parser.parse_args()
+    runner.run(videos)
 
 
-def main() -> None:
-    args = parse_args()
+def run_render(argv: List[str]) -> None:
+    args = parse_render_args(argv)
+    configure_logging(args.log_level, args.json_logs)
+
+    keyframes = find_keyframes(Path(value) for value in args.inputs)
+    if not keyframes:
+        raise SystemExit(f"No keyframes with detection sidecars found in {' '.join(args.inputs)}")
+    for keyframe in keyframes:
+        logger.info("Rendered {}", render_annotated(keyframe))
+    logger.success("Rendered {} keyframes", len(keyframes))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        run_batch(argv[1:])
+        return
+    if argv and argv[0] == "render":
+        run_render(argv[1:])
+        return
+
+    args = parse_args(argv)
     configure_logging(args.log_level, args.json_logs)
 
     settings = Settings.from_env(args.env)
-    if args.source:
-        settings.video.source = args.source
-    if args.weights:
-        settings.detection.weights_path = Path(args.weights)
-    if args.skip_frames_after_detection is not None:
-        settings.events.skip_frames_after_detection = args.skip_frames_after_detection
+    entries: list = list(args.source or [])
+    if args.sources_file:
+        entries += read_stream_entries(Path(args.sources_file))
+    streams = streams_from_sources(entries)
+    if len(streams) == 1:
+        settings.video.source = streams[0].source
+        settings.device_id = streams[0].device_id or settings.device_id
+    if args.capture_mode:
+        settings.video.capture_mode = args.capture_mode
+    if args.drop_policy:
+        settings.video.drop_policy = args.drop_policy
+    apply_model_args(settings, args)
+    if args.track_update_interval is not None:
+        settings.tracking.update_interval_sec = args.track_update_interval
+    if args.metrics_port is not None:
+        settings.metrics.port = args.metrics_port
 
-    orchestrator = PipelineOrchestrator(settings, device=args.device)
+    if len(streams) > 1:
+        orchestrator = MultiStreamOrchestrator(settings, streams, device=args.device)
+    else:
+        orchestrator = PipelineOrchestrator(settings, device=args.device)
     orchestrator.run(run_seconds=args.run_seconds)
 
 
@@ -1,6 +1,7 @@
 """Pipeline utilities."""
 
+from .multi_stream import MultiStreamOrchestrator
 from .orchestrator import PipelineOrchestrator
 
-__all__ = ["PipelineOrchestrator"]
+__all__ = ["MultiStreamOrchestrator", "PipelineOrchestrator"]
 
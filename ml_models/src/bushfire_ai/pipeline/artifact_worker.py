@@ -0,0 +1,76 @@
+"""Background workers for evidence writing and incident reporting."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+CompletionCallback = Callable[[Any, Optional[BaseException]], None]
+
+
+class ArtifactWorkerPool:
+    """Runs artifact tasks off the inference loop with a bounded backlog.
+
+    At most ``max_workers`` tasks run at once and ``max_backlog`` more may
+    wait; further submissions are rejected so a burst of detections can never
+    queue unbounded amounts of buffered video.
+    """
+
+    def __init__(self, max_workers: int = 2, max_backlog: int = 8) -> None:
+        self.max_workers = max_workers
+        self.max_backlog = max_backlog
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact")
+        self._slots = threading.BoundedSemaphore(max_workers + max_backlog)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self.submitted - self.completed - self.failed
+
+    def submit(self, task: Callable[[], Any], on_complete: Optional[CompletionCallback] = None) -> bool:
+        """Queue ``task``; returns False when the backlog is full and the task was dropped."""
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            logger.warning("Artifact backlog full ({} tasks); dropping task", self.max_workers + self.max_backlog)
+            return False
+
+        with self._lock:
+            self.submitted += 1
+        future = self._executor.submit(task)
+        future.add_done_callback(partial(self._finish, on_complete))
+        return True
+
+    def _finish(self, on_complete: Optional[CompletionCallback], future: Future) -> None:
+        self._slots.release()
+        error = future.exception()
+        result = None if error else future.result()
+        with self._lock:
+            if error:
+                self.failed += 1
+            else:
+                self.completed += 1
+        if error:
+            logger.opt(exception=error).error("Artifact task failed")
+
+        if on_complete:
+            try:
+                on_complete(result, error)
+            except Exception:
+                logger.exception("Artifact completion callback failed")
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait and self.in_flight:
+            logger.info("Waiting for {} artifact tasks to finish", self.in_flight)
+        self._executor.shutdown(wait=wait)
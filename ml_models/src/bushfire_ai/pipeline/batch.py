@@ -0,0 +1,333 @@
+"""Offline reprocessing of recorded footage across a pool of worker processes.
+
+Each video is split into time ranges that run independently: a worker
+seeks to its range, detects on every frame with the container PTS as the
+clock, tracks fires to raise incidents and writes its part of the JSONL
+output. The parent concatenates the parts in video and time order, so the
+results read as if a single process had gone through the archive.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.config.settings import Settings
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.detector.process_pool import limit_threads
+
+
+VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".avi", ".ts", ".m4v", ".webm"}
+
+
+@dataclass
+class BatchSegment:
+    """One time range of a video, ``[start_sec, end_sec)`` on the container clock."""
+
+    index: int
+    video: Path
+    start_sec: float
+    end_sec: float
+
+
+@dataclass
+class SegmentResult:
+    index: int
+    video: str
+    frames: int
+    frames_with_fire: int
+    incidents: int
+    media_seconds: float
+    wall_seconds: float
+
+
+def discover_videos(inputs: Iterable[str]) -> List[Path]:
+    """Expand directories (recursively) and glob patterns into a sorted list of video files."""
+
+    videos = set()
+    for entry in inputs:
+        path = Path(entry)
+        if path.is_dir():
+            candidates = (child for child in path.rglob("*") if child.suffix.lower() in VIDEO_EXTENSIONS)
+        elif path.exists():
+            candidates = iter([path])
+        else:
+            candidates = (Path(match) for match in glob.glob(entry, recursive=True))
+        videos.update(candidate.resolve() for candidate in candidates if candidate.is_file())
+    return sorted(videos)
+
+
+def probe_duration(video: Path) -> Optional[float]:
+    """Duration in seconds from the container's frame count and rate, or None if unknown."""
+
+    capture = cv2.VideoCapture(str(video))
+    try:
+        if not capture.isOpened():
+            return None
+        frames = capture.get(cv2.CAP_PROP_FRAME_COUNT)
+        fps = capture.get(cv2.CAP_PROP_FPS)
+    finally:
+        capture.release()
+    if frames <= 0 or fps <= 0:
+        return None
+    return frames / fps
+
+
+def plan_segments(videos: Sequence[Path], segment_sec: float) -> List[BatchSegment]:
+    """Split each video into ``segment_sec`` ranges; videos of unknown length become one open range."""
+
+    segments: List[BatchSegment] = []
+    for video in videos:
+        duration = probe_duration(video)
+        if duration is None:
+            logger.warning("Could not read the duration of {}; processing it as one segment", video)
+            segments.append(BatchSegment(len(segments), video, 0.0, math.inf))
+            continue
+        count = max(1, math.ceil(duration / segment_sec))
+        for part in range(count):
+            end = math.inf if part == count - 1 else (part + 1) * segment_sec  # the last range runs to the end
+            segments.append(BatchSegment(len(segments), video, part * segment_sec, end))
+    return segments
+
+
+def detection_records(detection: DetectionResult) -> List[Dict[str, Any]]:
+    return [
+        {"label": label, "confidence": round(float(confidence), 4), "box": [round(float(v), 1) for v in box]}
+        for label, confidence, box in zip(detection.labels, detection.confidences, detection.boxes)
+    ]
+
+
+def read_segment(
+    capture: cv2.VideoCapture,
+    start_sec: float,
+    end_sec: float,
+) -> Iterator[Tuple[int, float, np.ndarray]]:
+    """Yield ``(frame_index, pts, frame)`` for frames with ``start_sec <= pts < end_sec``."""
+
+    if start_sec > 0:
+        capture.set(cv2.CAP_PROP_POS_MSEC, start_sec * 1000.0)
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            return
+        pts = capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if pts >= end_sec:
+            return
+        if pts < start_sec - 1e-6:  # seeking may land on an earlier keyframe
+            continue
+        yield int(capture.get(cv2.CAP_PROP_POS_FRAMES)) - 1, pts, frame
+
+
+class SegmentProcessor:
+    """Runs detection and tracking over segments inside one worker process.
+
+    The detector is loaded once per process. ``warmup_sec`` of footage
+    before each segment only feeds the tracker, so a fire that is already
+    burning when a range starts is not reported again by every segment.
+    """
+
+    def __init__(self, settings: Settings, device: Optional[str], part_dir: Path, warmup_sec: float) -> None:
+        from bushfire_ai.pipeline.orchestrator import build_detector, inference_batch_size
+
+        self.settings = settings
+        self.part_dir = part_dir
+        self.warmup_sec = warmup_sec
+        self.batch_size = inference_batch_size(settings)
+        self.detector = build_detector(settings, device)
+
+    def process(self, segment: BatchSegment) -> SegmentResult:
+        from bushfire_ai.pipeline.orchestrator import build_tracker
+
+        started = time.perf_counter()
+        tracker = build_tracker(self.settings)
+        result = SegmentResult(segment.index, str(segment.video), 0, 0, 0, 0.0, 0.0)
+        detections_path, incidents_path = part_paths(self.part_dir, segment.index)
+        capture = cv2.VideoCapture(str(segment.video))
+        if not capture.isOpened():
+            raise RuntimeError(f"Unable to open video {segment.video}")
+        frame_interval = 1.0 / (capture.get(cv2.CAP_PROP_FPS) or 30.0)
+        first_pts: Optional[float] = None
+        last_pts = 0.0
+        try:
+            with detections_path.open("w", encoding="utf-8") as detections_out, incidents_path.open(
+                "w", encoding="utf-8"
+            ) as incidents_out:
+                frames = read_segment(capture, max(0.0, segment.start_sec - self.warmup_sec), segment.end_sec)
+                for batch in _batched(frames, self.batch_size):
+                    outputs = self.detector.predict_batch([frame for _, _, frame in batch])
+                    for (index, pts, frame), detection in zip(batch, outputs):
+                        events = tracker.update(detection, pts, frame.shape)
+                        if pts < segment.start_sec:
+                            continue  # warm-up frame
+                        if first_pts is None:
+                            first_pts = pts
+                        last_pts = pts
+                        result.frames += 1
+                        record = {
+                            "video": str(segment.video),
+                            "frame": index,
+                            "pts": round(pts, 3),
+                            "detections": detection_records(detection),
+                        }
+                        detections_out.write(json.dumps(record) + "\n")
+                        if len(detection):
+                            result.frames_with_fire += 1
+                        for event in events:
+                            result.incidents += 1
+                            incident = {
+                                "video": str(segment.video),
+                                "segment": segment.index,
+                                "frame": index,
+                                "pts": round(pts, 3),
+                                "event": event.kind,
+                                "confidence": round(detection.highest_confidence(), 4),
+                                "labels": detection.labels,
+                                **event.track.to_dict(),
+                            }
+                            incidents_out.write(json.dumps(incident) + "\n")
+        finally:
+            capture.release()
+        if first_pts is not None:
+            result.media_seconds = last_pts - first_pts + frame_interval
+        result.wall_seconds = time.perf_counter() - started
+        return result
+
+
+_processor: Optional[SegmentProcessor] = None
+
+
+def _init_worker(settings: Settings, device: Optional[str], part_dir: str, warmup_sec: float, threads: int) -> None:
+    global _processor
+    # keep each worker to its share of the cores instead of every process spawning one thread per core
+    limit_threads(threads)
+    _processor = SegmentProcessor(settings, device, Path(part_dir), warmup_sec)
+
+
+def _run_segment(segment: BatchSegment) -> SegmentResult:
+    assert _processor is not None, "worker was not initialized"
+    return _processor.process(segment)
+
+
+class BatchRunner:
+    """Process a video archive faster than real time by running segments in parallel processes."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        output_dir: Path,
+        workers: Optional[int] = None,
+        segment_sec: float = 300.0,
+        warmup_sec: float = 2.0,
+        device: Optional[str] = None,
+    ) -> None:
+        # the archive is already split across processes; each one runs its model in-process
+        detection = settings.detection.model_copy(update={"inference_workers": 0})
+        self.settings = settings.model_copy(update={"detection": detection})
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.segment_sec = segment_sec
+        self.warmup_sec = warmup_sec
+        self.device = device
+
+    def run(self, videos: Sequence[Path]) -> Dict[str, Any]:
+        if not videos:
+            raise ValueError("No videos to process")
+        segments = plan_segments(videos, self.segment_sec)
+        part_dir = self.output_dir / "parts"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        workers = min(self.workers, len(segments))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        logger.info(
+            "Processing {} videos as {} segments of up to {:.0f} s on {} worker processes",
+            len(videos),
+            len(segments),
+            self.segment_sec,
+            workers,
+        )
+
+        started = time.perf_counter()
+        results: List[SegmentResult] = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.settings, self.device, str(part_dir), self.warmup_sec, threads),
+        ) as pool:
+            for result in pool.map(_run_segment, segments):
+                results.append(result)
+                logger.info(
+                    "Segment {}/{} of {}: {} frames, {} incidents, {:.1f}x real time",
+                    result.index + 1,
+                    len(segments),
+                    Path(result.video).name,
+                    result.frames,
+                    result.incidents,
+                    result.media_seconds / result.wall_seconds if result.wall_seconds else 0.0,
+                )
+        wall_seconds = time.perf_counter() - started
+
+        self._merge(part_dir, [segment.index for segment in segments])
+        media_seconds = sum(result.media_seconds for result in results)
+        summary = {
+            "videos": len(videos),
+            "segments": len(segments),
+            "workers": workers,
+            "frames": sum(result.frames for result in results),
+            "frames_with_fire": sum(result.frames_with_fire for result in results),
+            "incidents": sum(result.incidents for result in results),
+            "media_seconds": media_seconds,
+            "wall_seconds": wall_seconds,
+            "speed": media_seconds / wall_seconds if wall_seconds else 0.0,
+            "per_segment": [asdict(result) for result in results],
+        }
+        (self.output_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+        logger.success(
+            "Processed {:.0f} s of footage in {:.1f} s ({:.1f}x real time): {} frames, {} incidents; results in {}",
+            media_seconds,
+            wall_seconds,
+            summary["speed"],
+            summary["frames"],
+            summary["incidents"],
+            self.output_dir,
+        )
+        return summary
+
+    def _merge(self, part_dir: Path, indices: Sequence[int]) -> None:
+        with (self.output_dir / "detections.jsonl").open("wb") as detections, (
+            self.output_dir / "incidents.jsonl"
+        ).open("wb") as incidents:
+            for index in indices:
+                detections_part, incidents_part = part_paths(part_dir, index)
+                for part, target in ((detections_part, detections), (incidents_part, incidents)):
+                    with part.open("rb") as handle:
+                        while chunk := handle.read(1 << 20):
+                            target.write(chunk)
+                    part.unlink()
+        part_dir.rmdir()
+
+
+def part_paths(part_dir: Path, index: int) -> Tuple[Path, Path]:
+    return part_dir / f"{index:05d}.detections.jsonl", part_dir / f"{index:05d}.incidents.jsonl"
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,230 @@
+"""Pluggable encoders for event clips.
+
+``FfmpegClipEncoder`` pipes raw BGR frames into an ffmpeg subprocess that
+encodes H.264/H.265, which is much smaller than OpenCV's ``mp4v`` for the
+same visual quality and cheaper to send over a constrained uplink.
+``OpenCvClipEncoder`` keeps the original ``cv2.VideoWriter`` path and is the
+fallback when no ffmpeg binary is available.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Literal, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+
+ClipCodec = Literal["h264", "h265"]
+
+FFMPEG_CODECS = {"h264": "libx264", "h265": "libx265"}
+
+
+class ClipEncoderError(RuntimeError):
+    """Raised when an encoder cannot start or fails to finish a clip."""
+
+
+class ClipWriter(ABC):
+    """Receives the frames of one clip in order; ``close`` finalizes the file."""
+
+    def __init__(self, path: Path, size: Tuple[int, int]) -> None:
+        self.path = path
+        self.size = size
+        self.frames = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        width, height = self.size
+        if frame.shape[1] != width or frame.shape[0] != height:
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        self._write(frame)
+        self.frames += 1
+
+    @abstractmethod
+    def _write(self, frame: np.ndarray) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> Path:
+        ...
+
+
+class ClipEncoder(ABC):
+    """Creates a ``ClipWriter`` per clip; frames must be BGR ``uint8`` of the opened size."""
+
+    name = "encoder"
+
+    @abstractmethod
+    def open(self, path: Path, width: int, height: int, fps: float) -> ClipWriter:
+        ...
+
+
+class _OpenCvWriter(ClipWriter):
+    def __init__(self, path: Path, size: Tuple[int, int], writer: cv2.VideoWriter) -> None:
+        super().__init__(path, size)
+        self._writer = writer
+
+    def _write(self, frame: np.ndarray) -> None:
+        self._writer.write(frame)
+
+    def close(self) -> Path:
+        self._writer.release()
+        return self.path
+
+
+class OpenCvClipEncoder(ClipEncoder):
+    name = "opencv"
+
+    def __init__(self, fourcc: str = "mp4v") -> None:
+        self.fourcc = fourcc
+
+    def open(self, path: Path, width: int, height: int, fps: float) -> ClipWriter:
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*self.fourcc), fps, (width, height))
+        if not writer.isOpened():
+            raise ClipEncoderError(f"cv2.VideoWriter could not open {path} with fourcc {self.fourcc}")
+        return _OpenCvWriter(path, (width, height), writer)
+
+
+class _FfmpegWriter(ClipWriter):
+    def __init__(self, path: Path, size: Tuple[int, int], process: subprocess.Popen) -> None:
+        super().__init__(path, size)
+        self._process = process
+
+    def _write(self, frame: np.ndarray) -> None:
+        try:
+            self._process.stdin.write(np.ascontiguousarray(frame).data)
+        except BrokenPipeError as error:
+            raise ClipEncoderError(f"ffmpeg exited while encoding {self.path}: {self._stderr()}") from error
+
+    def close(self) -> Path:
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self._process.wait() != 0:
+            raise ClipEncoderError(f"ffmpeg failed to encode {self.path}: {self._stderr()}")
+        return self.path
+
+    def _stderr(self) -> str:
+        self._process.wait()
+        return self._process.stderr.read().decode(errors="replace").strip()
+
+
+class FfmpegClipEncoder(ClipEncoder):
+    """Encodes through ``ffmpeg`` reading raw ``bgr24`` frames from stdin.
+
+    ``max_width`` downscales wider clips (keeping the aspect ratio); output
+    dimensions are rounded to even numbers as ``yuv420p`` requires. Lower
+    ``crf`` means higher quality and larger files; slower presets trade
+    encode time for size.
+    """
+
+    name = "ffmpeg"
+
+    def __init__(
+        self,
+        codec: ClipCodec = "h264",
+        preset: str = "veryfast",
+        crf: int = 28,
+        max_width: Optional[int] = None,
+        ffmpeg_path: Optional[str] = None,
+        threads: Optional[int] = None,
+    ) -> None:
+        executable = find_ffmpeg(ffmpeg_path)
+        if executable is None:
+            raise ClipEncoderError("ffmpeg executable not found (set FFMPEG_PATH or install .[ffmpeg])")
+        self.executable = executable
+        self.codec = codec
+        self.preset = preset
+        self.crf = crf
+        self.max_width = max_width
+        self.threads = threads
+
+    def output_size(self, width: int, height: int) -> Tuple[int, int]:
+        if self.max_width and width > self.max_width:
+            height = round(height * self.max_width / width)
+            width = self.max_width
+        return width - width % 2, height - height % 2
+
+    def command(self, path: Path, width: int, height: int, fps: float) -> List[str]:
+        out_width, out_height = self.output_size(width, height)
+        command = [
+            self.executable,
+            "-hide_banner",
+            "-loglevel", "error",
+            "-y",
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}",
+            "-r", f"{fps:g}",
+            "-i", "pipe:0",
+        ]
+        if (out_width, out_height) != (width, height):
+            command += ["-vf", f"scale={out_width}:{out_height}"]
+        command += [
+            "-c:v", FFMPEG_CODECS[self.codec],
+            "-preset", self.preset,
+            "-crf", str(self.crf),
+            "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+        ]
+        if self.codec == "h265":
+            command += ["-tag:v", "hvc1", "-x265-params", "log-level=error"]
+        if self.threads:
+            command += ["-threads", str(self.threads)]
+        return command + [str(path)]
+
+    def open(self, path: Path, width: int, height: int, fps: float) -> ClipWriter:
+        try:
+            process = subprocess.Popen(
+                self.command(path, width, height, fps),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except OSError as error:
+            raise ClipEncoderError(f"Could not start ffmpeg: {error}") from error
+        return _FfmpegWriter(path, (width, height), process)
+
+
+def find_ffmpeg(path: Optional[str] = None) -> Optional[str]:
+    """Resolve the ffmpeg binary: explicit path, then ``PATH``, then the imageio-ffmpeg wheel."""
+
+    if path:
+        return path if Path(path).exists() else shutil.which(path)
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    try:
+        import imageio_ffmpeg  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except RuntimeError:
+        return None
+
+
+def create_clip_encoder(
+    backend: Literal["ffmpeg", "opencv"] = "ffmpeg",
+    codec: ClipCodec = "h264",
+    preset: str = "veryfast",
+    crf: int = 28,
+    max_width: Optional[int] = None,
+    ffmpeg_path: Optional[str] = None,
+) -> ClipEncoder:
+    """Build the configured encoder, falling back to OpenCV when ffmpeg is unavailable."""
+
+    if backend == "ffmpeg":
+        try:
+            encoder = FfmpegClipEncoder(codec, preset, crf, max_width, ffmpeg_path)
+        except ClipEncoderError as error:
+            logger.warning("{}; writing clips with cv2.VideoWriter (mp4v) instead", error)
+        else:
+            logger.info("Encoding clips with ffmpeg {} (preset {}, CRF {})", codec, preset, crf)
+            return encoder
+    return OpenCvClipEncoder()
@@ -0,0 +1,125 @@
+"""Incremental encoding of one event clip while its post-event frames arrive."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Iterator, Optional
+
+from loguru import logger
+
+from bushfire_ai.pipeline.clip_encoder import ClipEncoder, ClipEncoderError, ClipWriter, OpenCvClipEncoder
+from bushfire_ai.pipeline.frame_buffer import BufferSnapshot
+from bushfire_ai.pipeline.video_source import Frame
+
+
+class ClipSession:
+    """Encodes the pre-event frames at once, then each appended frame, on a thread of its own.
+
+    The capture loop only hands frames over (``append`` never blocks; frames
+    beyond ``max_pending`` waiting to be encoded are dropped) and calls
+    ``finish`` once the media clock passes ``until``. ``future`` resolves to
+    the clip path when the file is finalized, or to the encoding error.
+    """
+
+    def __init__(
+        self,
+        encoder: ClipEncoder,
+        path: Path,
+        fps: float,
+        pre_event: BufferSnapshot,
+        until: float,
+        max_pending: int = 64,
+    ) -> None:
+        self.encoder = encoder
+        self.path = path
+        self.fps = fps
+        self.pre_event = pre_event
+        self.until = until
+        self.max_pending = max_pending
+        self.future: Future = Future()
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._pending: "queue.Queue[Optional[Frame]]" = queue.Queue()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, name=f"clip-{path.stem}", daemon=True)
+        self._thread.start()
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def append(self, frame: Frame) -> bool:
+        """Queue a post-event frame; returns False if the session is finished or the encoder is behind."""
+
+        if self._finished:
+            return False
+        if self._pending.qsize() >= self.max_pending:
+            self.frames_dropped += 1
+            return False
+        self._pending.put_nowait(frame)
+        return True
+
+    def finish(self) -> None:
+        """Stop accepting frames; the clip is finalized once the queued ones are encoded."""
+
+        if not self._finished:
+            self._finished = True
+            self._pending.put_nowait(None)
+
+    def wait(self, timeout: Optional[float] = None) -> Path:
+        return self.future.result(timeout)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait until the encoding thread (including ``future`` callbacks) has finished."""
+
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            path = self._encode()
+        except BaseException as error:  # surfaced through the future
+            self.future.set_exception(error)
+            return
+        logger.debug(
+            "Finalized clip {} ({} frames, {} dropped while encoding)",
+            path,
+            self.frames_written,
+            self.frames_dropped,
+        )
+        self.future.set_result(path)
+
+    def _encode(self) -> Path:
+        writer: Optional[ClipWriter] = None
+        try:
+            for frame in self._frames():
+                if writer is None:
+                    height, width = frame.data.shape[:2]
+                    writer = self._open(width, height)
+                writer.write(frame.data)
+                self.frames_written = writer.frames
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            raise ClipEncoderError(f"No frames were captured for {self.path}")
+        return self.path
+
+    def _open(self, width: int, height: int) -> ClipWriter:
+        try:
+            return self.encoder.open(self.path, width, height, self.fps)
+        except ClipEncoderError:
+            if isinstance(self.encoder, OpenCvClipEncoder):
+                raise
+            logger.exception("{} could not start clip {}; using cv2.VideoWriter", self.encoder.name, self.path)
+            return OpenCvClipEncoder().open(self.path, width, height, self.fps)
+
+    def _frames(self) -> Iterator[Frame]:
+        yield from self.pre_event
+        while True:
+            frame = self._pending.get()
+            if frame is None:
+                return
+            yield frame
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import math
 import time
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Deque, Optional
+from typing import Dict, Iterable, List, Optional
 
-import cv2
 from loguru import logger
 
+from bushfire_ai.pipeline.clip_encoder import ClipEncoder, ClipEncoderError, ClipWriter, OpenCvClipEncoder
+from bushfire_ai.pipeline.clip_session import ClipSession
+from bushfire_ai.pipeline.frame_buffer import BufferSnapshot, FrameRingBuffer
 from bushfire_ai.pipeline.video_source import Frame
 from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.storage.keyframes import sidecar_path, write_keyframe
+
+
+def artifact_file(stem: Path, suffix: str) -> Path:
+    return stem.with_name(stem.name + suffix)
 
 
 @dataclass
@@ -22,9 +29,17 @@ class EventArtifact:
     confidence: float
     timestamp: float
 
+    @property
+    def sidecar_path(self) -> Path:
+        return sidecar_path(self.keyframe_path)
+
 
 class EventAccumulator:
-    """Maintains a rolling frame buffer and materializes artifacts on demand."""
+    """Maintains a rolling frame buffer and materializes artifacts on demand.
+
+    The buffer only needs to cover ``pre_event_seconds``: frames after a
+    trigger are streamed into the open ``ClipSession`` as they arrive.
+    """
 
     def __init__(
         self,
@@ -32,31 +47,123 @@ class EventAccumulator:
         pre_event_seconds: float,
         post_event_seconds: float,
         clip_fps: float,
+        buffer_max_bytes: int = 256 * 1024 * 1024,
+        buffer_max_width: Optional[int] = None,
+        buffer_jpeg_quality: Optional[int] = None,
+        clip_encoder: Optional[ClipEncoder] = None,
+        max_clip_sessions: int = 2,
     ) -> None:
         self.artifact_dir = artifact_dir
         self.pre_event_seconds = pre_event_seconds
         self.post_event_seconds = post_event_seconds
         self.clip_fps = clip_fps
-        self.buffer: Deque[Frame] = deque()
-        self.max_buffer_seconds = pre_event_seconds + post_event_seconds
+        self.clip_encoder = clip_encoder or OpenCvClipEncoder()
+        self.max_clip_sessions = max_clip_sessions
+        self.sessions: List[ClipSession] = []
+        self.buffer = FrameRingBuffer(
+            max_bytes=buffer_max_bytes,
+            store_fps=clip_fps,
+            max_width=buffer_max_width,
+            jpeg_quality=buffer_jpeg_quality,
+            max_frames=math.ceil(pre_event_seconds * clip_fps) + 1,
+        )
+        self.max_buffer_seconds = pre_event_seconds
+        self.last_frame: Optional[Frame] = None
 
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
 
     def add_frame(self, frame: Frame) -> None:
-        self.buffer.append(frame)
+        self.last_frame = frame
+        stored = self.buffer.push(frame)
+        if self.sessions:
+            self._feed_sessions(frame, stored)
         self._trim()
 
+    def open_clip(self, timestamp: float, trigger_time: float, stem: Optional[Path] = None) -> Optional[ClipSession]:
+        """Start encoding the buffered pre-event frames into a clip that runs until
+        ``post_event_seconds`` after ``trigger_time`` (media time).
+
+        ``stem`` is the incident's file path without suffix (see ``create_artifact``).
+        Returns None when ``max_clip_sessions`` clips are already being recorded.
+        """
+
+        if len(self.sessions) >= self.max_clip_sessions:
+            logger.warning("{} clips already recording; writing a pre-event clip only", len(self.sessions))
+            return None
+        session = ClipSession(
+            self.clip_encoder,
+            artifact_file(stem or self._default_stem(timestamp), ".mp4"),
+            self.clip_fps,
+            self.snapshot(),
+            until=trigger_time + self.post_event_seconds,
+            max_pending=math.ceil(self.post_event_seconds * self.clip_fps) + 2,
+        )
+        self.sessions.append(session)
+        return session
+
+    def finish_clips(self) -> List[ClipSession]:
+        """Finalize every clip still recording (end of stream) and return their sessions."""
+
+        sessions, self.sessions = self.sessions, []
+        for session in sessions:
+            session.finish()
+        return sessions
+
+    def _feed_sessions(self, frame: Frame, stored: bool) -> None:
+        media_time = frame.media_time
+        recording: List[ClipSession] = []
+        for session in self.sessions:
+            if stored and media_time <= session.until:
+                session.append(frame)
+            if media_time >= session.until:
+                session.finish()
+            else:
+                recording.append(session)
+        self.sessions = recording
+
     def _trim(self) -> None:
-        if len(self.buffer) < 2:
+        if self.last_frame is None:
             return
-        start_time = self.buffer[-1].timestamp - self.max_buffer_seconds
-        while self.buffer and self.buffer[0].timestamp < start_time:
-            self.buffer.popleft()
+        self.buffer.trim_before(self.last_frame.media_time - self.max_buffer_seconds)
+
+    def buffer_stats(self) -> Dict[str, float]:
+        """Current event buffer occupancy (frames, bytes, budget, fraction used)."""
+
+        return self.buffer.stats()
+
+    def snapshot(self) -> BufferSnapshot:
+        """Detach the buffered clip frames so artifacts can be written while capture continues."""
 
-    def create_artifact(self, confidence: float, detections: DetectionResult) -> EventArtifact:
-        timestamp = time.time()
-        keyframe_path = self._write_keyframe(timestamp, detections)
-        clip_path = self._write_clip(timestamp) if len(self.buffer) > 1 else None
+        return self.buffer.snapshot()
+
+    def create_artifact(
+        self,
+        confidence: float,
+        detections: DetectionResult,
+        frames: Optional[BufferSnapshot] = None,
+        timestamp: Optional[float] = None,
+        keyframe: Optional[Frame] = None,
+        clip_path: Optional[Path] = None,
+        stem: Optional[Path] = None,
+    ) -> EventArtifact:
+        """Write the keyframe and clip for ``frames`` (defaults to the live buffer).
+
+        ``keyframe`` should be the full-resolution frame the detections refer to;
+        it defaults to the most recently added frame. ``clip_path`` is a clip
+        already finalized by a ``ClipSession``, in which case ``frames`` is ignored.
+        Files are named ``stem`` plus their suffix; ``stem`` defaults to
+        ``fire_<timestamp>`` in ``artifact_dir``.
+        """
+
+        keyframe = keyframe or self.last_frame
+        if keyframe is None:
+            raise ValueError("create_artifact requires at least one buffered frame")
+        timestamp = time.time() if timestamp is None else timestamp
+        stem = stem or self._default_stem(timestamp)
+        keyframe_path = self._write_keyframe(keyframe, timestamp, detections, stem)
+        if clip_path is None:
+            frames = self.snapshot() if frames is None else frames
+            clip_path = self._write_clip(frames, artifact_file(stem, ".mp4")) if len(frames) > 1 else None
 
         logger.info("Created artifact at {} with confidence {:.2f}", keyframe_path, confidence)
         return EventArtifact(
@@ -66,31 +173,36 @@ class EventAccumulator:
             timestamp=timestamp,
         )
 
-    def _write_keyframe(self, timestamp: float, detections: DetectionResult) -> Path:
-        frame = self.buffer[-1].data
-        annotated = frame
-        try:
-            from bushfire_ai.detector.fire_detector import FireDetectionModel
-
-            annotated = FireDetectionModel.draw_detections(frame, detections)
-        except Exception:  # pragma: no cover - fallback if annotation fails
-            logger.exception("Failed to annotate frame; storing raw frame")
-
-        filename = self.artifact_dir / f"fire_{int(timestamp)}.jpg"
-        cv2.imwrite(str(filename), annotated)
-        return filename
+    def _write_keyframe(
+        self, keyframe: Frame, timestamp: float, detections: DetectionResult, stem: Optional[Path] = None
+    ) -> Path:
+        """Store the raw keyframe and its detection sidecar; annotation is left to ``render_annotated``."""
 
-    def _write_clip(self, timestamp: float) -> Path:
-        frames = list(self.buffer)
-        height, width = frames[0].data.shape[:2]
-        clip_path = self.artifact_dir / f"fire_{int(timestamp)}.mp4"
+        path = artifact_file(stem or self._default_stem(timestamp), ".jpg")
+        return write_keyframe(path, keyframe.data, detections, timestamp)
 
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        writer = cv2.VideoWriter(str(clip_path), fourcc, self.clip_fps, (width, height))
-
-        for frame in frames:
-            writer.write(frame.data)
-
-        writer.release()
+    def _write_clip(self, frames: Iterable[Frame], clip_path: Path) -> Path:
+        try:
+            return self._encode(self.clip_encoder, frames, clip_path)
+        except ClipEncoderError:
+            if isinstance(self.clip_encoder, OpenCvClipEncoder):
+                raise
+            logger.exception("{} clip encoding failed; retrying with cv2.VideoWriter", self.clip_encoder.name)
+            return self._encode(OpenCvClipEncoder(), frames, clip_path)
+
+    def _default_stem(self, timestamp: float) -> Path:
+        return self.artifact_dir / f"fire_{int(timestamp)}"
+
+    def _encode(self, encoder: ClipEncoder, frames: Iterable[Frame], clip_path: Path) -> Path:
+        writer: Optional[ClipWriter] = None
+        try:
+            for frame in frames:
+                if writer is None:
+                    height, width = frame.data.shape[:2]
+                    writer = encoder.open(clip_path, width, height, self.clip_fps)
+                writer.write(frame.data)
+        finally:
+            if writer is not None:
+                writer.close()
         return clip_path
 
@@ -0,0 +1,201 @@
+"""Memory-bounded ring buffer of pre-event frames."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from bushfire_ai.pipeline.video_source import Frame, RateSampler
+
+
+@dataclass
+class BufferSnapshot:
+    """Detached copy of buffered frames, decoded lazily when iterated."""
+
+    timestamps: List[float]
+    raw: Optional[np.ndarray] = None
+    encoded: List[bytes] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[Frame]:
+        for position, timestamp in enumerate(self.timestamps):
+            if self.raw is not None:
+                data = self.raw[position]
+            else:
+                data = cv2.imdecode(np.frombuffer(self.encoded[position], dtype=np.uint8), cv2.IMREAD_COLOR)
+            yield Frame(data=data, timestamp=timestamp)
+
+
+class FrameRingBuffer:
+    """Keeps recent frames within a fixed byte budget.
+
+    Frames are sampled down to ``store_fps`` (on ``Frame.media_time``) and
+    scaled to at most ``max_width`` pixels wide as they are stored. Raw frames
+    go into one preallocated block of fixed-size slots, never more than
+    ``max_frames``; with ``jpeg_quality`` set they are kept JPEG-encoded
+    instead and the oldest are evicted once the budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        store_fps: Optional[float] = None,
+        max_width: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
+        max_frames: Optional[int] = None,
+    ) -> None:
+        self.max_bytes = int(max_bytes)
+        self.max_frames = max_frames
+        self._sampler = RateSampler(store_fps)
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
+
+        self._slots: Optional[np.ndarray] = None
+        self._slot_timestamps: Optional[np.ndarray] = None
+        self._source_shape: Optional[Tuple[int, ...]] = None
+        self._head = 0
+        self._count = 0
+        self._encoded: Deque[Tuple[float, bytes]] = deque()
+        self._encoded_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._encoded) if self.jpeg_quality is not None else self._count
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Number of raw slots, or ``None`` in JPEG mode where capacity depends on content."""
+
+        return None if self._slots is None else int(self._slots.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        if self.jpeg_quality is not None:
+            return self._encoded_bytes
+        if self._slots is None:
+            return 0
+        return self._count * int(self._slots[0].nbytes)
+
+    @property
+    def allocated_bytes(self) -> int:
+        if self.jpeg_quality is not None:
+            return self._encoded_bytes
+        return 0 if self._slots is None else int(self._slots.nbytes)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "frames": len(self),
+            "bytes": self.nbytes,
+            "budget_bytes": self.max_bytes,
+            "occupancy": self.nbytes / self.max_bytes if self.max_bytes else 0.0,
+        }
+
+    def push(self, frame: Frame) -> bool:
+        """Store ``frame`` if it is due at the storage frame rate; returns whether it was kept."""
+
+        if not self._sampler.due(frame.media_time):
+            return False
+        if self.jpeg_quality is not None:
+            self._push_encoded(frame)
+        else:
+            self._push_raw(frame)
+        return True
+
+    def trim_before(self, timestamp: float) -> None:
+        """Drop frames whose media time is older than ``timestamp``."""
+
+        if self.jpeg_quality is not None:
+            while self._encoded and self._encoded[0][0] < timestamp:
+                self._encoded_bytes -= len(self._encoded.popleft()[1])
+            return
+        while self._count and self._slot_timestamps[self._tail] < timestamp:
+            self._count -= 1
+
+    def snapshot(self) -> BufferSnapshot:
+        if self.jpeg_quality is not None:
+            return BufferSnapshot(
+                timestamps=[timestamp for timestamp, _ in self._encoded],
+                encoded=[payload for _, payload in self._encoded],
+            )
+        if not self._count:
+            return BufferSnapshot(timestamps=[])
+        order = (self._tail + np.arange(self._count)) % self._slots.shape[0]
+        return BufferSnapshot(
+            timestamps=self._slot_timestamps[order].tolist(),
+            raw=self._slots[order],
+        )
+
+    def clear(self) -> None:
+        self._count = 0
+        self._encoded.clear()
+        self._encoded_bytes = 0
+        self._sampler.reset()
+
+    @property
+    def _tail(self) -> int:
+        return (self._head - self._count) % self._slots.shape[0]
+
+    def _target_size(self, width: int, height: int) -> Tuple[int, int]:
+        if not self.max_width or width <= self.max_width:
+            return width, height
+        scale = self.max_width / width
+        return self.max_width, max(2, int(round(height * scale / 2)) * 2)
+
+    def _allocate(self, shape: Tuple[int, ...]) -> None:
+        height, width = shape[:2]
+        target_w, target_h = self._target_size(width, height)
+        slot_shape = (target_h, target_w) + tuple(shape[2:])
+        slot_bytes = int(np.prod(slot_shape))
+        capacity = max(2, self.max_bytes // slot_bytes)
+        if self.max_frames:
+            capacity = max(2, min(capacity, self.max_frames))
+        if self._slots is not None:
+            logger.warning("Frame size changed to {}x{}; resetting event buffer", width, height)
+        self._slots = np.empty((capacity,) + slot_shape, dtype=np.uint8)
+        self._slot_timestamps = np.zeros(capacity, dtype=np.float64)
+        self._source_shape = shape
+        self._head = 0
+        self._count = 0
+        logger.info(
+            "Event buffer holds {} frames at {}x{} ({:.1f} MB)",
+            capacity,
+            target_w,
+            target_h,
+            self._slots.nbytes / 1e6,
+        )
+
+    def _push_raw(self, frame: Frame) -> None:
+        if self._source_shape != frame.data.shape:
+            self._allocate(frame.data.shape)
+        slot = self._slots[self._head]
+        if slot.shape == frame.data.shape:
+            np.copyto(slot, frame.data)
+        else:
+            cv2.resize(frame.data, (slot.shape[1], slot.shape[0]), dst=slot, interpolation=cv2.INTER_AREA)
+        self._slot_timestamps[self._head] = frame.media_time
+        self._head = (self._head + 1) % self._slots.shape[0]
+        self._count = min(self._count + 1, self._slots.shape[0])
+
+    def _push_encoded(self, frame: Frame) -> None:
+        height, width = frame.data.shape[:2]
+        target = self._target_size(width, height)
+        data = frame.data
+        if target != (width, height):
+            data = cv2.resize(data, target, interpolation=cv2.INTER_AREA)
+        ok, encoded = cv2.imencode(".jpg", data, [cv2.IMWRITE_JPEG_QUALITY, int(self.jpeg_quality)])
+        if not ok:  # pragma: no cover - encoder failure is backend specific
+            logger.warning("Failed to JPEG-encode frame for event buffer")
+            return
+        payload = encoded.tobytes()
+        self._encoded.append((frame.media_time, payload))
+        if self.max_frames and len(self._encoded) > self.max_frames:
+            self._encoded_bytes -= len(self._encoded.popleft()[1])
+        self._encoded_bytes += len(payload)
+        while len(self._encoded) > 1 and self._encoded_bytes > self.max_bytes:
+            self._encoded_bytes -= len(self._encoded.popleft()[1])
@@ -0,0 +1,80 @@
+"""Cheap change detection used to skip inference on static frames."""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+import cv2
+import numpy as np
+
+
+GateMethod = Literal["diff", "histogram"]
+
+
+class MotionGate:
+    """Compares each frame with the last inferred one on a tiny grayscale thumbnail.
+
+    ``diff`` scores the mean absolute pixel difference (0-1) and ``histogram``
+    the Bhattacharyya distance between 32-bin intensity histograms (0-1).
+    Frames scoring below ``threshold`` may reuse the previous detection, but
+    never more than ``max_stale_frames`` in a row.
+    """
+
+    def __init__(
+        self,
+        method: GateMethod = "diff",
+        threshold: float = 0.02,
+        downscale_width: int = 64,
+        max_stale_frames: int = 15,
+    ) -> None:
+        self.method = method
+        self.threshold = threshold
+        self.downscale_width = downscale_width
+        self.max_stale_frames = max_stale_frames
+        self.inferred = 0
+        self.skipped = 0
+        self.last_score: Optional[float] = None
+        self._reference: Optional[np.ndarray] = None
+        self._stale = 0
+
+    @property
+    def saved_fraction(self) -> float:
+        total = self.inferred + self.skipped
+        return self.skipped / total if total else 0.0
+
+    def reset(self) -> None:
+        self._reference = None
+        self._stale = 0
+
+    def should_infer(self, frame: np.ndarray) -> bool:
+        """Return True if ``frame`` needs inference; it then becomes the new reference."""
+
+        signature = self._signature(frame)
+        if self._reference is not None and self._reference.shape == signature.shape:
+            self.last_score = self._score(signature)
+            if self.last_score < self.threshold and self._stale < self.max_stale_frames:
+                self._stale += 1
+                self.skipped += 1
+                return False
+
+        self._reference = signature
+        self._stale = 0
+        self.inferred += 1
+        return True
+
+    def _signature(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        target_w = min(self.downscale_width, width)
+        target_h = max(1, round(height * target_w / width))
+        small = cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        if self.method == "histogram":
+            hist = cv2.calcHist([small], [0], None, [32], [0, 256])
+            return cv2.normalize(hist, hist).astype(np.float32)
+        return small
+
+    def _score(self, signature: np.ndarray) -> float:
+        if self.method == "histogram":
+            return float(cv2.compareHist(self._reference, signature, cv2.HISTCMP_BHATTACHARYYA))
+        return float(cv2.absdiff(self._reference, signature).mean() / 255.0)
@@ -0,0 +1,228 @@
+"""Run several drone feeds against one shared fire detector."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from bushfire_ai.config.settings import Settings, StreamConfig
+from bushfire_ai.integrations.camara_reporter import IncidentReporter
+from bushfire_ai.pipeline.orchestrator import (
+    PipelineOrchestrator,
+    build_artifact_pool,
+    build_detector,
+    build_metrics_exporter,
+    build_storage,
+    inference_batch_size,
+)
+from bushfire_ai.pipeline.video_source import Frame, capture_clock
+from bushfire_ai.utils.metrics import PipelineMetrics
+
+
+@dataclass
+class StreamStats:
+    frames_inferred: int = 0
+    frames_gated: int = 0
+    frames_decoded: int = 0
+    frames_dropped: int = 0
+    lag_total: float = 0.0
+    lag_max: float = 0.0
+    window_inferred: int = 0
+    window_start: float = 0.0
+
+    def record_inference(self, frame: Frame, now: float) -> None:
+        lag = max(0.0, now - frame.timestamp)
+        self.frames_inferred += 1
+        self.window_inferred += 1
+        self.lag_total += lag
+        self.lag_max = max(self.lag_max, lag)
+
+    def record_capture(self, frame: Frame) -> None:
+        self.frames_decoded = frame.decoded_frames
+        self.frames_dropped = frame.dropped_frames
+
+    @property
+    def gated_fraction(self) -> float:
+        total = self.frames_inferred + self.frames_gated
+        return self.frames_gated / total if total else 0.0
+
+    @property
+    def mean_lag(self) -> float:
+        return self.lag_total / self.frames_inferred if self.frames_inferred else 0.0
+
+
+@dataclass
+class StreamState:
+    config: StreamConfig
+    pipeline: PipelineOrchestrator
+    stats: StreamStats
+    active: bool = True
+
+
+class MultiStreamOrchestrator:
+    """Schedules frames from many streams round-robin onto a single detector.
+
+    Each stream keeps its own ``EventAccumulator``, fire tracker and CAMARA
+    ``device_id``; only the model and the CAMARA client are shared. Metrics
+    go to one registry, labelled by stream name.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        streams: Sequence[StreamConfig],
+        device: Optional[str] = None,
+        stats_interval_sec: float = 10.0,
+    ) -> None:
+        if not streams:
+            raise ValueError("MultiStreamOrchestrator requires at least one stream")
+
+        self.settings = settings
+        self.stats_interval_sec = stats_interval_sec
+        self.detector = build_detector(settings, device)
+        self.metrics = PipelineMetrics(window=settings.metrics.window)
+        self.reporter = IncidentReporter(settings, self.metrics)
+        self.artifact_pool = build_artifact_pool(settings)
+        # one index and one quota for every stream; files are sharded by stream name under the date
+        self.storage = build_storage(settings)
+        self.metrics_exporter = build_metrics_exporter(settings, self.metrics)
+        self.batch_size = inference_batch_size(settings)
+        self.streams: List[StreamState] = [self._build_stream(stream) for stream in streams]
+        self._next_stream = 0
+
+    def _build_stream(self, stream: StreamConfig) -> StreamState:
+        stream_settings = self.settings.model_copy(
+            update={
+                # every stream decodes on its own thread so a slow feed never stalls the others
+                "video": self.settings.video.model_copy(
+                    update={"source": stream.source, "capture_mode": "threaded"}
+                ),
+                "device_id": stream.device_id or self.settings.device_id,
+            }
+        )
+        pipeline = PipelineOrchestrator(
+            stream_settings,
+            detector=self.detector,
+            reporter=self.reporter,
+            name=stream.name,
+            artifact_pool=self.artifact_pool,
+            metrics=self.metrics,
+            storage=self.storage,
+        )
+        return StreamState(config=stream, pipeline=pipeline, stats=StreamStats())
+
+    def run(self, run_seconds: Optional[float] = None) -> None:
+        start_time = time.time()
+        last_report = time.monotonic()
+        for state in self.streams:
+            state.stats.window_start = last_report
+
+        logger.info("Starting {} streams on a shared detector", len(self.streams))
+        if self.metrics_exporter:
+            self.metrics_exporter.start()
+        self.reporter.start()
+        try:
+            with contextlib.ExitStack() as stack:
+                for state in self.streams:
+                    stack.enter_context(state.pipeline.video_source.stream())
+
+                while any(state.active for state in self.streams):
+                    batch = self._collect_batch()
+                    if batch:
+                        self._infer(batch)
+                    else:
+                        time.sleep(0.002)
+
+                    now = time.monotonic()
+                    if now - last_report >= self.stats_interval_sec:
+                        self._report_stats(now)
+                        last_report = now
+
+                    if run_seconds and (time.time() - start_time) > run_seconds:
+                        logger.info("Stopping pipeline after {} seconds", run_seconds)
+                        break
+        finally:
+            self._report_stats(time.monotonic())
+            for state in self.streams:
+                state.pipeline.close()
+            self.artifact_pool.shutdown(wait=True)
+            self.reporter.close()
+            self.storage.close()
+            if hasattr(self.detector, "close"):
+                self.detector.close()
+            for state in self.streams:
+                state.pipeline.log_stage_latency()
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()
+
+    def _collect_batch(self) -> List[Tuple[StreamState, Frame]]:
+        """Take at most one ready frame per stream, resuming after the last stream served."""
+
+        batch: List[Tuple[StreamState, Frame]] = []
+        count = len(self.streams)
+        start = self._next_stream
+        self._next_stream = (start + 1) % count
+        for offset in range(count):
+            index = (start + offset) % count
+            state = self.streams[index]
+            if not state.active:
+                continue
+            source = state.pipeline.video_source
+            frame = source.poll()
+            if frame is None:
+                if source.exhausted:
+                    logger.info("Stream {} ended", state.config.name)
+                    state.active = False
+                continue
+
+            state.stats.record_capture(frame)
+            state.pipeline.record_capture(frame)
+            reused = state.pipeline.gated_detection(frame)
+            if reused is not None:
+                state.stats.frames_gated += 1
+                state.pipeline.handle_detections([frame], [reused])
+                continue
+
+            batch.append((state, frame))
+            if len(batch) >= self.batch_size:
+                self._next_stream = (index + 1) % count
+                break
+        return batch
+
+    def _infer(self, batch: List[Tuple[StreamState, Frame]]) -> None:
+        started = time.perf_counter()
+        detections = self.detector.predict_batch([frame.data for _, frame in batch])
+        elapsed = time.perf_counter() - started
+        now = capture_clock()
+        for (state, frame), detection in zip(batch, detections):
+            state.stats.record_inference(frame, now)
+            state.pipeline.record_inference(1, elapsed)
+            state.pipeline.handle_detections([frame], [detection])
+
+    def _report_stats(self, now: float) -> None:
+        for state in self.streams:
+            stats = state.stats
+            elapsed = max(now - stats.window_start, 1e-6)
+            buffer_stats = state.pipeline.event_accumulator.buffer_stats()
+            logger.info(
+                "Stream {}: {:.1f} inferred fps, {} inferred, {} gated ({:.0%} saved), {} incidents, "
+                "{} decoded, {} dropped, lag mean {:.0f} ms / max {:.0f} ms, buffer {:.0%}",
+                state.config.name,
+                stats.window_inferred / elapsed,
+                stats.frames_inferred,
+                stats.frames_gated,
+                stats.gated_fraction,
+                state.pipeline.incidents_raised,
+                stats.frames_decoded,
+                stats.frames_dropped,
+                stats.mean_lag * 1000.0,
+                stats.lag_max * 1000.0,
+                buffer_stats["occupancy"],
+            )
+            stats.window_inferred = 0
+            stats.window_start = now
+
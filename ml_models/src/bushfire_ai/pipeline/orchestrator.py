@@ -2,107 +2,554 @@
 
 from __future__ import annotations
 
+import json
+import threading
 import time
-from typing import Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from loguru import logger
 
 from bushfire_ai.config.settings import Settings
 from bushfire_ai.detector.fire_detector import DetectionResult, FireDetectionModel
+from bushfire_ai.detector.process_pool import Detector, ProcessDetectorPool
+from bushfire_ai.detector.quantization import int8_weights_path
+from bushfire_ai.detector.tiling import TiledInference
 from bushfire_ai.integrations.camara_reporter import IncidentReporter
-from bushfire_ai.pipeline.event_accumulator import EventAccumulator
-from bushfire_ai.pipeline.video_source import Frame, VideoSource
-from bushfire_ai.storage.local_store import LocalStorage
+from bushfire_ai.pipeline.artifact_worker import ArtifactWorkerPool
+from bushfire_ai.pipeline.clip_encoder import ClipEncoder, create_clip_encoder
+from bushfire_ai.pipeline.clip_session import ClipSession
+from bushfire_ai.pipeline.event_accumulator import EventAccumulator, EventArtifact
+from bushfire_ai.pipeline.frame_buffer import BufferSnapshot
+from bushfire_ai.pipeline.motion_gate import MotionGate
+from bushfire_ai.pipeline.tracker import FireTracker
+from bushfire_ai.pipeline.video_source import Frame, RateSampler, VideoSource, capture_clock
+from bushfire_ai.storage.keyframes import annotated_path, render_annotated
+from bushfire_ai.storage.local_store import LocalStorage, StoredIncident
+from bushfire_ai.utils.metrics import MetricsExporter, PipelineMetrics, StreamMetrics
+
+
+def build_detector(settings: Settings, device: Optional[str] = None) -> Detector:
+    """Load the fire detector described by ``settings.detection``.
+
+    With ``inference_workers`` set this is a ``ProcessDetectorPool`` whose
+    workers each load the in-process model.
+    """
+
+    detection = settings.detection
+    if detection.inference_workers:
+        if detection.batch_size < detection.inference_workers:
+            logger.info(
+                "Batching {} frames per model call (FIRE_BATCH_SIZE={}) so each of the {} inference workers gets one",
+                inference_batch_size(settings),
+                detection.batch_size,
+                detection.inference_workers,
+            )
+        in_process = settings.model_copy(
+            update={"detection": detection.model_copy(update={"inference_workers": 0})}, deep=True
+        )
+        return ProcessDetectorPool(partial(build_detector, in_process, device), workers=detection.inference_workers)
+    backend, weights_path, imgsz = detection.backend, detection.weights_path, detection.imgsz
+    if detection.profile == "fast":
+        backend = "onnxruntime"
+        weights_path = detection.fast_weights_path or int8_weights_path(detection.weights_path)
+        imgsz = detection.fast_imgsz
+        logger.info("Fast detection profile: INT8 model {} at {}px", weights_path, imgsz)
+
+    return FireDetectionModel(
+        weights_path=weights_path,
+        confidence_threshold=detection.confidence_threshold,
+        iou_threshold=detection.iou_threshold,
+        max_detections=detection.max_detections,
+        device=device,
+        target_classes=detection.target_classes,
+        backend=backend,
+        imgsz=imgsz,
+        tiler=build_tiler(settings),
+    )
+
+
+def inference_batch_size(settings: Settings) -> int:
+    """Frames per model call: ``batch_size``, raised so that every inference worker gets a frame of each batch."""
+
+    return max(settings.detection.batch_size, settings.detection.inference_workers)
+
+
+def build_tiler(settings: Settings) -> Optional[TiledInference]:
+    tiling = settings.tiling
+    if not tiling.enabled:
+        return None
+    return TiledInference(
+        tile_size=tiling.tile_size,
+        overlap=tiling.overlap,
+        full_frame=tiling.full_frame,
+        prefilter_confidence=tiling.prefilter_confidence,
+    )
+
+
+def build_motion_gate(settings: Settings) -> Optional[MotionGate]:
+    gating = settings.gating
+    if not gating.enabled:
+        return None
+    return MotionGate(
+        method=gating.method,
+        threshold=gating.threshold,
+        downscale_width=gating.downscale_width,
+        max_stale_frames=gating.max_stale_frames,
+    )
+
+
+def decode_fps(settings: Settings) -> Optional[float]:
+    """Frames per second the pipeline needs decoded: enough for inference and, when storing, the event clips."""
+
+    infer_fps = settings.detection.infer_fps
+    if infer_fps is None:
+        return None
+    if settings.events.detection_mode == "store":
+        return max(infer_fps, settings.events.clip_frame_rate)
+    return infer_fps
+
+
+def build_tracker(settings: Settings) -> FireTracker:
+    tracking = settings.tracking
+    return FireTracker(
+        iou_threshold=tracking.iou_threshold,
+        max_centroid_distance=tracking.max_centroid_distance,
+        max_missed_sec=tracking.max_missed_sec,
+        confidence_jump=tracking.confidence_jump,
+        area_growth=tracking.area_growth,
+        update_interval_sec=tracking.update_interval_sec,
+    )
+
+
+def build_clip_encoder(settings: Settings) -> ClipEncoder:
+    events = settings.events
+    return create_clip_encoder(
+        backend=events.clip_encoder,
+        codec=events.clip_codec,
+        preset=events.clip_preset,
+        crf=events.clip_crf,
+        max_width=events.clip_max_width,
+        ffmpeg_path=events.ffmpeg_path,
+    )
+
+
+def build_artifact_pool(settings: Settings) -> ArtifactWorkerPool:
+    return ArtifactWorkerPool(
+        max_workers=settings.events.artifact_workers,
+        max_backlog=settings.events.artifact_backlog,
+    )
+
+
+def build_storage(settings: Settings) -> LocalStorage:
+    events = settings.events
+    return LocalStorage(
+        events.artifact_dir,
+        index_path=events.artifact_index_path,
+        max_bytes=int(events.artifact_max_mb * 1024 * 1024) if events.artifact_max_mb else None,
+        max_incidents=events.artifact_max_incidents,
+    )
+
+
+def build_metrics_exporter(settings: Settings, metrics: PipelineMetrics) -> Optional[MetricsExporter]:
+    config = settings.metrics
+    if config.port is None and config.snapshot_path is None:
+        return None
+    return MetricsExporter(
+        metrics,
+        host=config.host,
+        port=config.port,
+        snapshot_path=config.snapshot_path,
+        snapshot_interval_sec=config.snapshot_interval_sec,
+    )
+
+
+IncidentCallback = Callable[[EventArtifact, Optional[Dict[str, Any]]], None]
 
 
 class PipelineOrchestrator:
-    def __init__(self, settings: Settings, device: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        device: Optional[str] = None,
+        detector: Optional[Detector] = None,
+        reporter: Optional[IncidentReporter] = None,
+        name: Optional[str] = None,
+        artifact_pool: Optional[ArtifactWorkerPool] = None,
+        on_incident: Optional[IncidentCallback] = None,
+        metrics: Optional[PipelineMetrics] = None,
+        storage: Optional[LocalStorage] = None,
+    ) -> None:
         self.settings = settings
+        self.name = name
+        self.on_incident = on_incident
         self.video_source = VideoSource(
             settings.video.source,
             width=settings.video.width,
             height=settings.video.height,
+            capture_mode=settings.video.capture_mode,
+            queue_size=settings.video.queue_size,
+            drop_policy=settings.video.drop_policy,
+            decode_fps=decode_fps(settings),
         )
-        self.detector = FireDetectionModel(
-            weights_path=settings.detection.weights_path,
-            confidence_threshold=settings.detection.confidence_threshold,
-            iou_threshold=settings.detection.iou_threshold,
-            max_detections=settings.detection.max_detections,
-            device=device,
-            target_classes=settings.detection.target_classes,
-        )
+        self._owns_detector = detector is None
+        self.detector = detector or build_detector(settings, device)
         self.event_accumulator = EventAccumulator(
             artifact_dir=settings.events.artifact_dir,
             pre_event_seconds=settings.events.pre_event_buffer_sec,
             post_event_seconds=settings.events.post_event_buffer_sec,
             clip_fps=settings.events.clip_frame_rate,
+            buffer_max_bytes=int(settings.events.buffer_max_mb * 1024 * 1024),
+            buffer_max_width=settings.events.buffer_max_width,
+            buffer_jpeg_quality=settings.events.buffer_jpeg_quality,
+            clip_encoder=build_clip_encoder(settings) if settings.events.detection_mode == "store" else None,
+            max_clip_sessions=settings.events.artifact_workers,
         )
-        self.storage = LocalStorage(settings.events.artifact_dir)
-        self.reporter = IncidentReporter(settings)
-        self.skip_frames_remaining = 0
+        self._owns_storage = storage is None
+        self.storage = storage or build_storage(settings)
+        # a shared registry is exported by its owner (the multi-stream orchestrator)
+        self.metrics = metrics or PipelineMetrics(window=settings.metrics.window)
+        self.metrics_exporter = None if metrics else build_metrics_exporter(settings, self.metrics)
+        self.stage_metrics = StreamMetrics(self.metrics, name)
+        self._owns_reporter = reporter is None
+        self.reporter = reporter or IncidentReporter(settings, self.metrics)
+        # evidence queued in the outbox is kept through quota eviction until it is delivered
+        self.reporter.on_uploaded = self.storage.mark_uploaded
+        self.device_id = settings.device_id
+        self._owns_artifact_pool = artifact_pool is None
+        self.artifact_pool = artifact_pool or build_artifact_pool(settings)
         self.detection_mode = settings.events.detection_mode
         self.store_artifacts = self.detection_mode == "store"
         self.view_detections = self.detection_mode == "view"
-        self.skip_frame_budget = (
-            settings.events.skip_frames_after_detection if self.store_artifacts else 0
-        )
+        self.tracker = build_tracker(settings)
+        self.fire_frames = 0
+        self.incidents_raised = 0
+        self._updates_lock = threading.Lock()
+        self._updates_path = settings.events.artifact_dir / (name or "") / "track_updates.jsonl"
+        self.batch_size = inference_batch_size(settings)
+        self.batch_timeout = settings.detection.batch_timeout_ms / 1000.0
+        self.motion_gate = build_motion_gate(settings)
+        self.inference_sampler = RateSampler(settings.detection.infer_fps) if settings.detection.infer_fps else None
+        self.last_detection: Optional[DetectionResult] = None
 
     def run(self, run_seconds: Optional[float] = None) -> None:
         start_time = time.time()
+        last_frame: Optional[Frame] = None
+        pending: List[Frame] = []
+        batch_deadline = 0.0
+        if self.metrics_exporter:
+            self.metrics_exporter.start()
+        if self._owns_reporter:
+            self.reporter.start()
         try:
             with self.video_source.stream() as frame_stream:
+                waiting_since = time.perf_counter()
                 for frame in frame_stream:
-                    if self.skip_frames_remaining > 0:
-                        self.event_accumulator.add_frame(frame)
-                        self.skip_frames_remaining -= 1
-                        continue
-
-                    detection, triggered = self._process_frame(frame)
-                    if self.view_detections:
-                        self._render_frame(frame, detection)
-
-                    if triggered and self.skip_frame_budget > 0:
-                        self.skip_frames_remaining = self.skip_frame_budget
+                    self.stage_metrics.capture.observe(time.perf_counter() - waiting_since)
+                    self.record_capture(frame)
+                    last_frame = frame
+                    if not pending:
+                        batch_deadline = time.monotonic() + self.batch_timeout
+                    pending.append(frame)
+                    if len(pending) >= self.batch_size or time.monotonic() >= batch_deadline:
+                        self._process_batch(pending)
+                        pending = []
 
                     if run_seconds and (time.time() - start_time) > run_seconds:
                         logger.info("Stopping pipeline after {} seconds", run_seconds)
                         break
+                    waiting_since = time.perf_counter()
+                if pending:
+                    self._process_batch(pending)
         finally:
+            if last_frame is not None:
+                buffer_stats = self.event_accumulator.buffer_stats()
+                logger.info(
+                    "Capture summary: {} frames decoded, {} skipped without decoding, {} dropped before inference; "
+                    "event buffer {} frames / {:.1f} MB ({:.0%} of budget)",
+                    last_frame.decoded_frames,
+                    self.video_source.grabbed_frames,
+                    last_frame.dropped_frames,
+                    buffer_stats["frames"],
+                    buffer_stats["bytes"] / 1e6,
+                    buffer_stats["occupancy"],
+                )
+            if self.motion_gate:
+                logger.info(
+                    "Motion gate reused the previous detection for {} of {} frames ({:.0%} of inferences saved)",
+                    self.motion_gate.skipped,
+                    self.motion_gate.skipped + self.motion_gate.inferred,
+                    self.motion_gate.saved_fraction,
+                )
+            if self.fire_frames:
+                logger.info(
+                    "Tracker raised {} incidents for {} frames with fire ({} tracks active)",
+                    self.incidents_raised,
+                    self.fire_frames,
+                    len(self.tracker.tracks),
+                )
+            tiler = getattr(self.detector, "tiler", None)
+            if tiler and tiler.tiles_total:
+                logger.info(
+                    "Tiled inference ran {} of {} tiles ({:.0%} skipped)",
+                    tiler.tiles_run,
+                    tiler.tiles_total,
+                    tiler.tiles_skipped_fraction,
+                )
+            self.close()
+            self.log_stage_latency()
+
+    def close(self) -> None:
+        """Finalize recording clips, wait for pending artifact work and release CAMARA and display resources."""
+
+        for session in self.event_accumulator.finish_clips():
+            session.join()
+        if self._owns_artifact_pool:
+            self.artifact_pool.shutdown(wait=True)
+        if self._owns_reporter:
+            self.reporter.close()
+        if self._owns_storage:
+            self.storage.close()
+        if self._owns_detector and hasattr(self.detector, "close"):
+            self.detector.close()
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+        if self.view_detections:
+            try:
+                import cv2
+
+                cv2.destroyAllWindows()
+            except Exception:  # pragma: no cover - display cleanup best effort
+                logger.exception("Failed to close display windows")
+
+    def record_capture(self, frame: Frame) -> None:
+        self.stage_metrics.frames_captured.inc()
+        self.stage_metrics.frames_dropped.set(frame.dropped_frames)
+        self.stage_metrics.frames_not_decoded.set(frame.grabbed_frames)
+
+    def log_stage_latency(self) -> None:
+        stages = [
+            entry
+            for entry in self.metrics.snapshot()["stages"]
+            if entry["stream"] == self.name and entry["count"]
+        ]
+        if stages:
+            logger.info(
+                "Stage latency{} p50/p95/p99 ms: {}",
+                f" on {self.name}" if self.name else "",
+                ", ".join(
+                    f"{entry['stage']} {entry['p50_ms']:.1f}/{entry['p95_ms']:.1f}/{entry['p99_ms']:.1f}"
+                    for entry in stages
+                ),
+            )
+
+    def _process_batch(self, frames: Sequence[Frame]) -> None:
+        """Run one model call over ``frames`` and handle each result in capture order.
+
+        Frames that are not due at ``infer_fps`` or that the motion gate
+        considers unchanged reuse the detection of the frame inferred before
+        them instead of going to the model.
+        """
+
+        needs_inference = [self._needs_inference(frame) for frame in frames]
+        to_infer = [frame.data for frame, needed in zip(frames, needs_inference) if needed]
+        started = time.perf_counter()
+        inferred = iter(self._detect_batch(to_infer))
+        self.record_inference(len(to_infer), time.perf_counter() - started)
+        self.stage_metrics.frames_skipped.inc(len(frames) - len(to_infer))
+
+        # the gate always infers its first frame, so ``previous`` is set before any reuse
+        detections: List[DetectionResult] = []
+        previous = self.last_detection
+        for needed in needs_inference:
+            if needed:
+                previous = next(inferred)
+            detections.append(previous)
+        self.handle_detections(frames, detections)
+
+    def gated_detection(self, frame: Frame) -> Optional[DetectionResult]:
+        """Return the previous detection if ``infer_fps`` or the motion gate lets ``frame`` skip inference."""
+
+        if self._needs_inference(frame):
+            return None
+        self.stage_metrics.frames_skipped.inc()
+        return self.last_detection
+
+    def _needs_inference(self, frame: Frame) -> bool:
+        if self.inference_sampler is not None and not self.inference_sampler.due(frame.media_time):
+            return False
+        return self.motion_gate is None or self.motion_gate.should_infer(frame.data)
+
+    def record_inference(self, frames: int, seconds: float) -> None:
+        """Count ``frames`` as inferred by one model call that took ``seconds``."""
+
+        self.stage_metrics.frames_inferred.inc(frames)
+        for _ in range(frames):
+            self.stage_metrics.inference.observe(seconds)
+
+    def handle_detections(self, frames: Sequence[Frame], detections: Sequence[DetectionResult]) -> None:
+        """Apply detector output for ``frames``, which may come from a shared detector."""
+
+        for frame, detection in zip(frames, detections):
+            detection, _ = self._process_frame(frame, detection)
             if self.view_detections:
-                try:
-                    import cv2
+                self._render_frame(frame, detection)
+
+    def _process_frame(
+        self,
+        frame: Frame,
+        detection: Optional[DetectionResult] = None,
+    ) -> tuple[DetectionResult, bool]:
+        metrics = self.stage_metrics
+        with metrics.buffer.time():
+            self.event_accumulator.add_frame(frame)
+        if detection is None:
+            started = time.perf_counter()
+            detection = self._detect(frame.data)
+            self.record_inference(1, time.perf_counter() - started)
+        self.last_detection = detection
+        # the detector already drops boxes below the fire threshold, so every tracked box is fire
+        with metrics.tracking.time():
+            events = self.tracker.update(detection, frame.media_time, frame.data.shape)
+            updates = self.tracker.due_updates(frame.media_time)
+        metrics.end_to_end.observe(max(0.0, capture_clock() - frame.timestamp))
+        if updates and self.store_artifacts:
+            self.artifact_pool.submit(partial(self._write_track_updates, updates, time.time()))
+
+        if len(detection):
+            self.fire_frames += 1
+        if not events:
+            return detection, False
+
+        self.incidents_raised += 1
+        metrics.incidents.inc()
+        logger.info(
+            "Fire detected{} with confidence {:.2f} ({})",
+            f" on {self.name}" if self.name else "",
+            detection.highest_confidence(),
+            ", ".join(f"{event.kind} track {event.track.track_id}" for event in events),
+        )
+        if self.store_artifacts:
+            timestamp = time.time()
+            incident = self.storage.new_incident(timestamp, self.name, pending_upload=self.reporter.outbox is not None)
+            persist = partial(
+                self._persist_incident,
+                keyframe=frame,
+                detection=detection,
+                timestamp=timestamp,
+                tracks=[{"event": event.kind, **event.track.to_dict()} for event in events],
+                incident=incident,
+            )
+            # the clip keeps recording post-event frames; the incident is written once it is finalized
+            session = self.event_accumulator.open_clip(timestamp, frame.media_time, stem=incident.stem)
+            if session is None:
+                self._submit_incident(partial(persist, frames=self.event_accumulator.snapshot()), incident)
+            else:
+                session.future.add_done_callback(
+                    lambda _: self._submit_incident(partial(persist, clip=session), incident)
+                )
+        return detection, True
 
-                    cv2.destroyAllWindows()
-                except Exception:  # pragma: no cover - display cleanup best effort
-                    logger.exception("Failed to close display windows")
+    def _submit_incident(self, task: Callable[[], Any], incident: StoredIncident) -> None:
+        if not self.artifact_pool.submit(task, on_complete=self._incident_completed):
+            self.stage_metrics.artifacts_dropped.inc()
+            self.storage.discard_incident(incident)
 
-    def _process_frame(self, frame: Frame) -> tuple[DetectionResult, bool]:
-        self.event_accumulator.add_frame(frame)
-        detection = self._detect(frame.data)
-        if detection.has_fire(self.settings.detection.confidence_threshold):
-            logger.info("Fire detected with confidence {:.2f}", detection.highest_confidence())
-            artifact = None
+    def _persist_incident(
+        self,
+        keyframe: Frame,
+        detection: DetectionResult,
+        timestamp: float,
+        tracks: Optional[List[Dict[str, Any]]] = None,
+        frames: Optional[BufferSnapshot] = None,
+        clip: Optional[ClipSession] = None,
+        incident: Optional[StoredIncident] = None,
+    ) -> Tuple[EventArtifact, Optional[Dict[str, Any]]]:
+        """Write evidence and report it; runs on an artifact worker thread.
 
-            if self.store_artifacts:
+        The clip is either encoded here from ``frames`` or was already
+        finalized by ``clip``; if that session failed, the pre-event frames
+        it started from are encoded instead.
+        """
+
+        clip_path: Optional[Path] = None
+        if clip is not None:
+            try:
+                clip_path = clip.wait()
+            except Exception:
+                logger.exception("Clip {} failed; writing the pre-event frames only", clip.path)
+                frames = clip.pre_event
+
+        metrics = self.stage_metrics
+        with metrics.artifact.time():
+            try:
                 artifact = self.event_accumulator.create_artifact(
                     confidence=detection.highest_confidence(),
                     detections=detection,
+                    frames=frames,
+                    timestamp=timestamp,
+                    keyframe=keyframe,
+                    clip_path=clip_path,
+                    stem=incident.stem if incident else None,
                 )
-                paths = [artifact.keyframe_path]
-                if artifact.clip_path:
-                    paths.append(artifact.clip_path)
-                self.storage.save_paths(*paths)
-                self.reporter.report_incident(
-                    confidence=artifact.confidence,
-                    detection_labels=detection.labels,
-                    frame_path=artifact.keyframe_path,
-                    clip_path=artifact.clip_path,
-                )
+            except Exception:
+                if incident is not None:
+                    self.storage.discard_incident(incident)
+                raise
+            paths = [artifact.keyframe_path, artifact.sidecar_path]
+            if artifact.clip_path:
+                paths.append(artifact.clip_path)
+            self.storage.save_paths(*paths, incident=incident)
+            if self.settings.events.keyframe_annotation == "background":
+                # drawn here, off the capture loop; the upload below reuses the cached render
+                try:
+                    self.storage.save_paths(render_annotated(artifact.keyframe_path), incident=incident)
+                except Exception:
+                    logger.exception("Failed to annotate keyframe {}", artifact.keyframe_path)
+        metrics.artifacts_written.inc()
+        with metrics.report.time():
+            response = self.reporter.report_incident(
+                confidence=artifact.confidence,
+                detection_labels=detection.labels,
+                frame_path=artifact.keyframe_path,
+                clip_path=artifact.clip_path,
+                device_id=self.device_id,
+                tracks=tracks,
+            )
+        (metrics.uploads_succeeded if response is not None else metrics.uploads_failed).inc()
+        rendered = annotated_path(artifact.keyframe_path)
+        if self.settings.events.keyframe_annotation == "upload" and rendered.exists():
+            self.storage.save_paths(rendered, incident=incident)  # count the upload-time render against the quota
+        return artifact, response
 
-            return detection, True
+    def _write_track_updates(self, updates: List[Dict[str, Any]], timestamp: float) -> None:
+        """Append one batch of routine track updates to ``track_updates.jsonl``."""
 
-        return detection, False
+        path = self._updates_path
+        line = json.dumps({"timestamp": timestamp, "deviceId": self.device_id, "tracks": updates})
+        with self._updates_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+        logger.debug("Wrote {} batched track updates to {}", len(updates), path)
+
+    def _incident_completed(
+        self,
+        result: Optional[Tuple[EventArtifact, Optional[Dict[str, Any]]]],
+        error: Optional[BaseException],
+    ) -> None:
+        if error or result is None:
+            return
+        artifact, response = result
+        logger.debug(
+            "Incident evidence for {} completed {:.0f} ms after trigger",
+            artifact.keyframe_path,
+            (time.time() - artifact.timestamp) * 1000.0,
+        )
+        if self.on_incident:
+            self.on_incident(artifact, response)
 
     def _render_frame(self, frame: Frame, detection: DetectionResult) -> None:
         try:
@@ -111,8 +558,9 @@ class PipelineOrchestrator:
             logger.warning("OpenCV GUI components not available; cannot display detections")
             return
 
-        annotated = FireDetectionModel.draw_detections(frame.data, detection)
-        cv2.imshow("Bushfire Detection", annotated)
+        # the buffered frame may share ``frame.data``, so boxes go on a copy, and only when there are any
+        annotated = FireDetectionModel.draw_detections(frame.data, detection) if len(detection) else frame.data
+        cv2.imshow(f"Bushfire Detection - {self.name}" if self.name else "Bushfire Detection", annotated)
         if cv2.waitKey(1) & 0xFF == ord("q"):
             logger.info("Display window closed by user input")
             cv2.destroyAllWindows()
@@ -121,3 +569,10 @@ class PipelineOrchestrator:
     def _detect(self, frame: np.ndarray) -> DetectionResult:
         return self.detector.predict(frame)
 
+    def _detect_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionResult]:
+        if not frames:
+            return []
+        if len(frames) == 1:
+            return [self._detect(frames[0])]
+        return self.detector.predict_batch(frames)
+
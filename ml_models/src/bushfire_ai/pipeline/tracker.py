@@ -0,0 +1,189 @@
+"""IoU/centroid tracking of fire detections so each fire raises one incident."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.detector.postprocess import box_iou, greedy_pairs
+
+
+TrackEventKind = Literal["new", "escalation"]
+
+
+@dataclass
+class Track:
+    track_id: int
+    class_id: int
+    box: np.ndarray
+    confidence: float
+    first_seen: float
+    last_seen: float
+    hits: int = 1
+    peak_confidence: float = 0.0
+    reported_confidence: float = 0.0
+    reported_area: float = 0.0
+
+    @property
+    def area(self) -> float:
+        return float(max(0.0, self.box[2] - self.box[0]) * max(0.0, self.box[3] - self.box[1]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trackId": self.track_id,
+            "classId": self.class_id,
+            "box": [round(float(value), 1) for value in self.box],
+            "confidence": round(self.confidence, 4),
+            "peakConfidence": round(self.peak_confidence, 4),
+            "area": round(self.area, 1),
+            "hits": self.hits,
+            "firstSeen": self.first_seen,
+            "lastSeen": self.last_seen,
+        }
+
+
+@dataclass
+class TrackEvent:
+    kind: TrackEventKind
+    track: Track
+
+
+class FireTracker:
+    """Associates detections across frames and decides which ones are new incidents.
+
+    Detections match existing tracks of the same class by IoU, then by
+    centroid distance (as a fraction of the frame diagonal) for boxes that
+    moved too far to overlap. Unmatched detections start tracks and emit a
+    ``new`` event. A matched track emits ``escalation`` when its confidence
+    rises by ``confidence_jump`` or its area grows by ``area_growth`` since
+    it was last reported. Other matches are collected and released together
+    by ``due_updates`` every ``update_interval_sec``. Tracks not seen for
+    ``max_missed_sec`` are dropped.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_centroid_distance: float = 0.05,
+        max_missed_sec: float = 5.0,
+        confidence_jump: float = 0.15,
+        area_growth: float = 2.0,
+        update_interval_sec: float = 30.0,
+    ) -> None:
+        self.iou_threshold = iou_threshold
+        self.max_centroid_distance = max_centroid_distance
+        self.max_missed_sec = max_missed_sec
+        self.confidence_jump = confidence_jump
+        self.area_growth = area_growth
+        self.update_interval_sec = update_interval_sec
+        self.tracks: Dict[int, Track] = {}
+        self._next_id = 1
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._last_flush: Optional[float] = None
+
+    def update(
+        self,
+        detection: DetectionResult,
+        timestamp: float,
+        frame_shape: Sequence[int],
+    ) -> List[TrackEvent]:
+        """Fold one frame's detections into the tracks; returns incident-worthy events."""
+
+        self._expire(timestamp)
+        if self._last_flush is None:
+            self._last_flush = timestamp
+        boxes, confidences, class_ids = detection.boxes, detection.confidences, detection.class_ids
+        track_ids = list(self.tracks)
+        matches = self._associate(track_ids, boxes, class_ids, frame_shape)
+
+        events: List[TrackEvent] = []
+        matched = set()
+        for track_id, index in matches:
+            matched.add(index)
+            track = self.tracks[track_id]
+            track.box = boxes[index].copy()
+            track.confidence = float(confidences[index])
+            track.peak_confidence = max(track.peak_confidence, track.confidence)
+            track.last_seen = timestamp
+            track.hits += 1
+            if (
+                track.confidence >= track.reported_confidence + self.confidence_jump
+                # a degenerate (zero-area) reported box has no growth ratio; it would escalate every frame
+                or (track.reported_area > 0 and track.area >= track.reported_area * self.area_growth)
+            ):
+                self._mark_reported(track)
+                events.append(TrackEvent("escalation", track))
+            else:
+                self._pending[track_id] = track.to_dict()
+
+        for index in range(boxes.shape[0]):
+            if index in matched:
+                continue
+            track = Track(
+                track_id=self._next_id,
+                class_id=int(class_ids[index]),
+                box=boxes[index].copy(),
+                confidence=float(confidences[index]),
+                peak_confidence=float(confidences[index]),
+                first_seen=timestamp,
+                last_seen=timestamp,
+            )
+            self._next_id += 1
+            self._mark_reported(track)
+            self.tracks[track.track_id] = track
+            events.append(TrackEvent("new", track))
+        return events
+
+    def due_updates(self, timestamp: float) -> List[Dict[str, Any]]:
+        """Return the batched track updates once ``update_interval_sec`` has elapsed."""
+
+        if not self._pending or self._last_flush is None:
+            return []
+        if timestamp - self._last_flush < self.update_interval_sec:
+            return []
+        updates = list(self._pending.values())
+        self._pending.clear()
+        self._last_flush = timestamp
+        return updates
+
+    def _mark_reported(self, track: Track) -> None:
+        track.reported_confidence = track.confidence
+        track.reported_area = track.area
+        self._pending.pop(track.track_id, None)
+
+    def _expire(self, timestamp: float) -> None:
+        expired = [key for key, track in self.tracks.items() if timestamp - track.last_seen > self.max_missed_sec]
+        for track_id in expired:
+            del self.tracks[track_id]
+            self._pending.pop(track_id, None)
+
+    def _associate(
+        self,
+        track_ids: List[int],
+        boxes: np.ndarray,
+        class_ids: np.ndarray,
+        frame_shape: Sequence[int],
+    ) -> List[Tuple[int, int]]:
+        if not track_ids or boxes.shape[0] == 0:
+            return []
+        track_boxes = np.stack([self.tracks[track_id].box for track_id in track_ids])
+        track_classes = np.array([self.tracks[track_id].class_id for track_id in track_ids])
+        same_class = track_classes[:, None] == class_ids[None, :]
+
+        overlaps = np.where(same_class, box_iou(track_boxes, boxes), 0.0)
+        pairs = greedy_pairs(overlaps, self.iou_threshold, maximize=True)
+
+        height, width = frame_shape[:2]
+        diagonal = float(np.hypot(width, height))
+        centres_t = (track_boxes[:, :2] + track_boxes[:, 2:]) / 2
+        centres_d = (boxes[:, :2] + boxes[:, 2:]) / 2
+        distances = np.linalg.norm(centres_t[:, None, :] - centres_d[None, :, :], axis=2) / diagonal
+        distances = np.where(same_class, distances, np.inf)
+        for row, column in pairs:
+            distances[row, :] = np.inf
+            distances[:, column] = np.inf
+        pairs += greedy_pairs(distances, self.max_centroid_distance, maximize=False)
+        return [(track_ids[row], column) for row, column in pairs]
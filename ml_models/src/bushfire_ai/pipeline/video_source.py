@@ -3,30 +3,184 @@
 from __future__ import annotations
 
 import contextlib
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Generator, Optional
+from typing import Deque, Generator, Literal, Optional
 
 import cv2
 import numpy as np
 from loguru import logger
 
 
+CaptureMode = Literal["sync", "threaded"]
+DropPolicy = Literal["latest", "drop_oldest", "block"]
+
+
 @dataclass
 class Frame:
     data: np.ndarray
     timestamp: float
+    index: int = 0
+    decoded_frames: int = 0
+    dropped_frames: int = 0
+    pts: Optional[float] = None
+    grabbed_frames: int = 0
+
+    @property
+    def media_time(self) -> float:
+        """Position on the stream's own clock: container PTS for files, capture time otherwise."""
+
+        return self.pts if self.pts is not None else self.timestamp
 
 
 class VideoSourceError(Exception):
     """Raised when the video source encounters an unrecoverable error."""
 
 
+def capture_clock() -> float:
+    """Return the clock used to timestamp captured frames, in seconds."""
+
+    return float(cv2.getTickCount() / cv2.getTickFrequency())
+
+
+class RateSampler:
+    """Selects frames at no more than ``fps`` per second of media time (``None`` keeps every frame)."""
+
+    def __init__(self, fps: Optional[float] = None) -> None:
+        self.interval = 1.0 / fps if fps else 0.0
+        self._next_due: Optional[float] = None
+
+    def due(self, now: float) -> bool:
+        """Whether the frame at media time ``now`` should be kept; call once per frame in order."""
+
+        # the tolerance keeps float drift in ``_next_due`` from skipping frames of a source at exactly ``fps``
+        if self._next_due is not None and now < self._next_due - 1e-6:
+            return False
+        if self._next_due is None or now - self._next_due > self.interval:
+            self._next_due = now + self.interval
+        else:
+            self._next_due += self.interval
+        return True
+
+    def reset(self) -> None:
+        self._next_due = None
+
+
+class FrameQueue:
+    """Bounded hand-off between the capture thread and the consumer.
+
+    ``latest`` keeps only the newest frame, ``drop_oldest`` evicts the oldest
+    queued frame when full and ``block`` stalls the producer until there is room.
+    """
+
+    def __init__(self, maxsize: int, policy: DropPolicy) -> None:
+        self.maxsize = 1 if policy == "latest" else max(1, maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self._frames: Deque[Frame] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, frame: Frame) -> bool:
+        with self._cond:
+            if self.policy == "block":
+                while len(self._frames) >= self.maxsize and not self._closed:
+                    self._cond.wait()
+            else:
+                while len(self._frames) >= self.maxsize:
+                    self._frames.popleft()
+                    self.dropped += 1
+            if self._closed:
+                return False
+            self._frames.append(frame)
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Frame]:
+        """Return the next frame, or ``None`` on timeout or once closed and drained."""
+
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._frames or self._closed, timeout=timeout):
+                return None
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            frame.dropped_frames = self.dropped
+            self._cond.notify_all()
+            return frame
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
 class VideoSource:
-    def __init__(self, source: str, width: Optional[int] = None, height: Optional[int] = None) -> None:
+    """Frames from a camera, file or stream.
+
+    With ``decode_fps`` only that many frames per second of media time are
+    retrieved; the frames in between are only advanced with
+    ``VideoCapture.grab`` (counted in ``grabbed_frames``). With the FFmpeg
+    backend ``grab`` still decodes the bitstream, so the saving is the
+    retrieval and colour conversion, not the decode itself.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        capture_mode: CaptureMode = "sync",
+        queue_size: int = 2,
+        drop_policy: DropPolicy = "latest",
+        decode_fps: Optional[float] = None,
+    ) -> None:
         self.source = source
         self.width = width
         self.height = height
+        self.capture_mode = capture_mode
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.decoded_frames = 0
+        self.grabbed_frames = 0
+        self.position = 0
+        self.decode_sampler = RateSampler(decode_fps) if decode_fps else None
+        self.close_timeout = 5.0
+        self.is_file = not source.isdigit() and "://" not in source
         self._capture: Optional[cv2.VideoCapture] = None
+        self._queue: Optional[FrameQueue] = None
+        self._capture_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._thread_done = threading.Event()
+        self._release_lock = threading.Lock()
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._queue.dropped if self._queue else 0
+
+    @property
+    def exhausted(self) -> bool:
+        """True once a threaded source has stopped capturing and every frame was consumed."""
+
+        return self._queue is not None and self._queue.closed and not len(self._queue)
+
+    def poll(self, timeout: float = 0.0) -> Optional[Frame]:
+        """Return the next captured frame, waiting at most ``timeout`` seconds.
+
+        Only available in threaded mode; returns ``None`` when no frame is ready.
+        """
+
+        if self._queue is None:
+            raise VideoSourceError("poll() requires an open source in threaded capture mode")
+        return self._queue.get(timeout=timeout)
 
     def open(self) -> None:
         logger.info("Opening video source: {}", self.source)
@@ -44,28 +198,123 @@ class VideoSource:
             capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
 
         self._capture = capture
+        self.decoded_frames = 0
+        self.grabbed_frames = 0
+        self.position = 0
+        if self.decode_sampler:
+            self.decode_sampler.reset()
+
+        if self.capture_mode == "threaded":
+            self._start_capture_thread()
 
     def close(self) -> None:
+        if self._capture_thread:
+            self._stop_event.set()
+            if self._queue:
+                self._queue.close()
+            self._capture_thread.join(timeout=self.close_timeout)
+            with self._release_lock:
+                if not self._thread_done.is_set():
+                    # still blocked in grab()/retrieve(): releasing now would free the capture under it
+                    logger.warning("Capture thread did not stop cleanly; it will release the capture when it exits")
+                    self._capture = None
+            self._capture_thread = None
         if self._capture:
             logger.info("Closing video source")
             self._capture.release()
             self._capture = None
 
+    def _advance(self, capture: cv2.VideoCapture) -> bool:
+        if not capture.grab():
+            return False
+        self.position += 1
+        return True
+
+    def _read_frame(self, capture: cv2.VideoCapture) -> Optional[Frame]:
+        while True:
+            if not self._advance(capture):
+                return None
+            pts = capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 if self.is_file else None
+            if self.decode_sampler is None or self.decode_sampler.due(capture_clock() if pts is None else pts):
+                break
+            self.grabbed_frames += 1
+        success, data = capture.retrieve()
+        if not success:
+            return None
+        self.decoded_frames += 1
+        return Frame(
+            data=data,
+            timestamp=capture_clock(),
+            index=self.position - 1,
+            decoded_frames=self.decoded_frames,
+            pts=pts,
+            grabbed_frames=self.grabbed_frames,
+        )
+
+    def _start_capture_thread(self) -> None:
+        assert self._capture is not None
+        # fresh events per thread, so reopening never revives or waits on a thread left behind by close()
+        self._stop_event = threading.Event()
+        self._thread_done = threading.Event()
+        self._queue = FrameQueue(self.queue_size, self.drop_policy)
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(self._capture, self._queue, self._stop_event, self._thread_done),
+            name=f"capture-{self.source}",
+            daemon=True,
+        )
+        self._capture_thread.start()
+
+    def _capture_loop(
+        self,
+        capture: cv2.VideoCapture,
+        queue: FrameQueue,
+        stop: threading.Event,
+        done: threading.Event,
+    ) -> None:
+        try:
+            while not stop.is_set():
+                frame = self._read_frame(capture)
+                if frame is None:
+                    logger.warning("Failed to read frame; ending stream")
+                    break
+                if not queue.put(frame):
+                    break
+        except Exception:  # pragma: no cover - decoder failures are backend specific
+            logger.exception("Capture thread failed")
+        finally:
+            queue.close()
+            with self._release_lock:
+                done.set()
+                handed_over = self._capture is not capture  # close() gave up waiting and left the release to us
+            if handed_over:
+                capture.release()
+
     def _frame_generator(self) -> Generator[Frame, None, None]:
         assert self._capture is not None
         while True:
-            success, frame = self._capture.read()
-            if not success:
+            frame = self._read_frame(self._capture)
+            if frame is None:
                 logger.warning("Failed to read frame; ending stream")
                 break
 
-            yield Frame(data=frame, timestamp=float(cv2.getTickCount() / cv2.getTickFrequency()))
+            yield frame
+
+    def _threaded_frame_generator(self) -> Generator[Frame, None, None]:
+        assert self._queue is not None
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            yield frame
 
     @contextlib.contextmanager
     def stream(self) -> Generator[Generator[Frame, None, None], None, None]:
         self.open()
         try:
-            yield self._frame_generator()
+            if self.capture_mode == "threaded":
+                yield self._threaded_frame_generator()
+            else:
+                yield self._frame_generator()
         finally:
             self.close()
-
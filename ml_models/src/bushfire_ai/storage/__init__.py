@@ -1,6 +1,6 @@
 """Storage utilities."""
 
-from .local_store import LocalStorage
+from .local_store import LocalStorage, StoredIncident
 
-__all__ = ["LocalStorage"]
+__all__ = ["LocalStorage", "StoredIncident"]
 
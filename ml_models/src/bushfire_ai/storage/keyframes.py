@@ -0,0 +1,119 @@
+"""Raw incident keyframes with detection sidecars and lazily rendered annotations.
+
+Incidents store the keyframe exactly as captured next to a small JSON
+sidecar holding the boxes, confidences and labels. The annotated render is
+only drawn when something needs it (an upload, a background render or an
+explicit ``render`` request) and is cached beside the keyframe, so each
+keyframe is annotated at most once however many paths ask for it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import cv2
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult, FireDetectionModel
+
+
+SIDECAR_SUFFIX = ".json"
+ANNOTATED_SUFFIX = "_annotated"
+
+_locks_guard = threading.Lock()
+_render_locks: Dict[Path, threading.Lock] = {}
+
+
+def sidecar_path(keyframe_path: Path) -> Path:
+    return keyframe_path.with_suffix(SIDECAR_SUFFIX)
+
+
+def annotated_path(keyframe_path: Path) -> Path:
+    return keyframe_path.with_name(f"{keyframe_path.stem}{ANNOTATED_SUFFIX}{keyframe_path.suffix}")
+
+
+def write_keyframe(path: Path, frame: np.ndarray, detections: DetectionResult, timestamp: float) -> Path:
+    """Write the unannotated ``frame`` to ``path`` and its detections to the sidecar."""
+
+    if not cv2.imwrite(str(path), frame):
+        raise OSError(f"Could not write keyframe {path}")
+    height, width = frame.shape[:2]
+    payload = {
+        "timestamp": timestamp,
+        "width": width,
+        "height": height,
+        "boxes": [[round(value, 1) for value in box] for box in detections.boxes.tolist()],
+        "confidences": [round(value, 4) for value in detections.confidences.tolist()],
+        "classIds": detections.class_ids.tolist(),
+        "labels": detections.labels,
+    }
+    _replace_atomically(sidecar_path(path), lambda tmp: tmp.write_text(json.dumps(payload, separators=(",", ":"))))
+    return path
+
+
+def read_sidecar(keyframe_path: Path) -> DetectionResult:
+    payload: Dict[str, Any] = json.loads(sidecar_path(keyframe_path).read_text())
+    return DetectionResult(
+        boxes=np.asarray(payload["boxes"], dtype=np.float32),
+        confidences=np.asarray(payload["confidences"], dtype=np.float32),
+        class_ids=np.asarray(payload["classIds"], dtype=np.int32),
+        labels=list(payload["labels"]),
+    )
+
+
+def render_annotated(keyframe_path: Path) -> Path:
+    """Return the annotated render of ``keyframe_path``, drawing and caching it on first use.
+
+    Keyframes without a sidecar (written before sidecars existed, when the
+    keyframe itself was annotated) are returned unchanged. Concurrent callers
+    for the same keyframe wait for one render instead of drawing twice.
+    """
+
+    target = annotated_path(keyframe_path)
+    if target.exists() or not sidecar_path(keyframe_path).exists():
+        return target if target.exists() else keyframe_path
+
+    with _locks_guard:
+        lock = _render_locks.setdefault(keyframe_path, threading.Lock())
+    try:
+        with lock:
+            if not target.exists():
+                frame = cv2.imread(str(keyframe_path))
+                if frame is None:
+                    raise FileNotFoundError(f"Keyframe {keyframe_path} is missing or unreadable")
+                FireDetectionModel.draw_detections(frame, read_sidecar(keyframe_path), copy=False)
+                _replace_atomically(target, lambda tmp: cv2.imwrite(str(tmp), frame))
+    finally:
+        with _locks_guard:
+            _render_locks.pop(keyframe_path, None)
+    return target
+
+
+def find_keyframes(paths: Iterable[Path]) -> List[Path]:
+    """Keyframes with a sidecar among ``paths``, searching directories recursively."""
+
+    found: List[Path] = []
+    for path in paths:
+        candidates = sorted(path.rglob(f"*{SIDECAR_SUFFIX}")) if path.is_dir() else [sidecar_path(path)]
+        for sidecar in candidates:
+            keyframe = keyframe_for_sidecar(sidecar)
+            if keyframe is not None:
+                found.append(keyframe)
+    return found
+
+
+def keyframe_for_sidecar(sidecar: Path) -> Optional[Path]:
+    keyframe = sidecar.with_suffix(".jpg")
+    return keyframe if sidecar.exists() and keyframe.exists() else None
+
+
+def _replace_atomically(path: Path, write: Any) -> None:
+    """Write through a temporary file beside ``path`` so readers never see a partial file."""
+
+    tmp = path.with_name(f".{path.stem}.partial{path.suffix}")  # keep the suffix: cv2 picks the codec from it
+    write(tmp)
+    os.replace(tmp, path)
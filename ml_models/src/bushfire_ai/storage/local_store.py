@@ -1,25 +1,269 @@
-"""Local storage backend for artifacts."""
+"""Local storage backend for artifacts.
+
+Incident files live under ``<base_dir>/<YYYY-MM-DD>/<stream>/`` (UTC dates)
+and are named after their index row, so two incidents in the same second
+never collide. A SQLite index records every file's size, time, stream and
+incident. Running totals kept from it drive quota eviction, and lookups by
+incident or time range never touch the directory tree.
+"""
 
 from __future__ import annotations
 
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, List, Optional
 
 from loguru import logger
 
+from bushfire_ai.storage.keyframes import annotated_path
+
+
+DEFAULT_STREAM = "default"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream TEXT NOT NULL,
+    created REAL NOT NULL,
+    stem TEXT NOT NULL,
+    pending_upload INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS incidents_created ON incidents (created);
+CREATE INDEX IF NOT EXISTS incidents_stream_created ON incidents (stream, created);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    incident_id INTEGER,
+    stream TEXT NOT NULL,
+    created REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_incident ON files (incident_id);
+"""
+
+HAS_FILES = "EXISTS (SELECT 1 FROM files WHERE files.incident_id = incidents.id)"
+
+
+@dataclass
+class StoredIncident:
+    incident_id: int
+    stream: str
+    created: float
+    stem: Path  # file path without suffix; the keyframe is ``<stem>.jpg``, the clip ``<stem>.mp4``
+    pending_upload: bool = False
+
 
 class LocalStorage:
-    def __init__(self, base_dir: Path) -> None:
+    """Indexed artifact store with incremental byte and incident-count quotas.
+
+    ``new_incident`` reserves a unique file stem in the date/stream shard;
+    ``save_paths`` indexes the written files and then evicts whole incidents,
+    oldest first, until the store is back under ``max_bytes`` and
+    ``max_incidents``. Only the evicted incidents' rows and files are
+    touched. Incidents still waiting for their files (a clip being recorded,
+    a persist task queued) are never evicted; ``discard_incident`` releases
+    one whose files will not arrive. Neither are incidents created with
+    ``pending_upload`` until ``mark_uploaded`` is called for one of their
+    files, so a quota never deletes evidence the outbox still has to send.
+    Files outside the index (track updates, the outbox, artifacts from
+    before the index existed) are never counted or removed.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        index_path: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        max_incidents: Optional[int] = None,
+    ) -> None:
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_incidents = max_incidents
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(index_path or base_dir / "artifacts.sqlite3"), check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(incidents)")}
+        if "pending_upload" not in columns:  # index written before uploads were tracked
+            self._db.execute("ALTER TABLE incidents ADD COLUMN pending_upload INTEGER NOT NULL DEFAULT 0")
+        # reservations left behind by a crash before their files were written
+        self._db.execute(f"DELETE FROM incidents WHERE NOT {HAS_FILES}")
+        self.total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+        self.incident_count = self._db.execute("SELECT COUNT(*) FROM incidents").fetchone()[0]
+
+    def new_incident(
+        self, timestamp: float, stream: Optional[str] = None, pending_upload: bool = False
+    ) -> StoredIncident:
+        """Reserve the shard directory and a unique file stem for an incident at ``timestamp``.
+
+        With ``pending_upload`` the incident is kept through quota eviction
+        until ``mark_uploaded`` is called for one of its files.
+        """
 
-    def save_paths(self, *paths: Path) -> None:
+        stream = stream or DEFAULT_STREAM
+        shard = Path(time.strftime("%Y-%m-%d", time.gmtime(timestamp))) / stream
+        (self.base_dir / shard).mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO incidents (stream, created, stem, pending_upload) VALUES (?, ?, '', ?)",
+                (stream, timestamp, int(pending_upload)),
+            )
+            incident_id = cursor.lastrowid
+            stem = shard / f"fire_{int(timestamp)}_{incident_id}"
+            self._db.execute("UPDATE incidents SET stem = ? WHERE id = ?", (str(stem), incident_id))
+            self.incident_count += 1
+        return StoredIncident(incident_id, stream, timestamp, self.base_dir / stem, pending_upload)
+
+    def save_paths(self, *paths: Path, incident: Optional[StoredIncident] = None) -> None:
+        """Index ``paths`` (under ``incident`` when given) and evict down to the quotas."""
+
+        rows = []
         for path in paths:
-            logger.info("Stored artifact: {} ({} bytes)", path, path.stat().st_size)
+            size = path.stat().st_size
+            logger.info("Stored artifact: {} ({} bytes)", path, size)
+            rows.append((path, size))
+        with self._lock:
+            if incident is not None:
+                self._ensure_incident(incident)
+            for path, size in rows:
+                cursor = self._db.execute(
+                    "INSERT OR IGNORE INTO files (path, incident_id, stream, created, size) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        self._relative(path),
+                        incident.incident_id if incident else None,
+                        incident.stream if incident else DEFAULT_STREAM,
+                        incident.created if incident else time.time(),
+                        size,
+                    ),
+                )
+                self.total_bytes += size if cursor.rowcount == 1 else 0
+        self.enforce_quota(keep=incident.incident_id if incident else None)
+
+    def mark_uploaded(self, path: Path) -> None:
+        """Let the incident owning ``path`` be evicted again: its upload was delivered or dropped."""
+
+        with self._lock:
+            self._db.execute(
+                "UPDATE incidents SET pending_upload = 0 WHERE id = (SELECT incident_id FROM files WHERE path = ?)",
+                (self._relative(path),),
+            )
+        self.enforce_quota()
+
+    def discard_incident(self, incident: StoredIncident) -> None:
+        """Release a reservation whose files were never saved (e.g. its persist task was dropped)."""
+
+        with self._lock:
+            cursor = self._db.execute(
+                f"DELETE FROM incidents WHERE id = ? AND NOT {HAS_FILES}", (incident.incident_id,)
+            )
+            self.incident_count -= cursor.rowcount
+
+    def incident_files(self, incident_id: int) -> List[Path]:
+        with self._lock:
+            rows = self._db.execute("SELECT path FROM files WHERE incident_id = ? ORDER BY path", (incident_id,))
+            return [self.base_dir / row[0] for row in rows.fetchall()]
+
+    def incidents_between(self, start: float, end: float, stream: Optional[str] = None) -> List[StoredIncident]:
+        """Incidents created in ``[start, end)``, oldest first, optionally for one stream."""
+
+        query = "SELECT id, stream, created, stem, pending_upload FROM incidents WHERE created >= ? AND created < ?"
+        params: List[object] = [start, end]
+        if stream is not None:
+            query += " AND stream = ?"
+            params.append(stream)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY created, id", params).fetchall()
+        return [StoredIncident(row[0], row[1], row[2], self.base_dir / row[3], bool(row[4])) for row in rows]
+
+    def enforce_quota(self, keep: Optional[int] = None) -> int:
+        """Evict the oldest incidents (never ``keep``) until both quotas hold; returns how many were evicted."""
+
+        evicted = 0
+        with self._lock:
+            while self._over_quota():
+                row = self._db.execute(
+                    f"SELECT id FROM incidents WHERE id != ? AND NOT pending_upload AND {HAS_FILES} "
+                    "ORDER BY created, id LIMIT 1",
+                    (keep or -1,),
+                ).fetchone()
+                if row is None:
+                    held = self._db.execute("SELECT COUNT(*) FROM incidents WHERE pending_upload").fetchone()[0]
+                    if held:
+                        logger.warning(
+                            "Artifact store over quota ({} incidents / {:.1f} MB); {} incidents still await upload",
+                            self.incident_count,
+                            self.total_bytes / 1e6,
+                            held,
+                        )
+                    break
+                self._evict(row[0])
+                evicted += 1
+        if evicted:
+            self.evicted += evicted
+            logger.info(
+                "Evicted {} incidents to stay within quota; {} incidents / {:.1f} MB stored",
+                evicted,
+                self.incident_count,
+                self.total_bytes / 1e6,
+            )
+        return evicted
 
     def cleanup_old(self, max_items: int = 1000) -> None:
-        files = sorted(self.base_dir.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        for stale in files[max_items:]:
-            logger.info("Removing stale artifact {}", stale)
-            stale.unlink(missing_ok=True)
+        """Keep only the newest ``max_items`` incidents."""
+
+        limit, self.max_incidents = self.max_incidents, max_items
+        try:
+            self.enforce_quota()
+        finally:
+            self.max_incidents = limit
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _over_quota(self) -> bool:
+        return (self.max_bytes is not None and self.total_bytes > self.max_bytes) or (
+            self.max_incidents is not None and self.incident_count > self.max_incidents
+        )
+
+    def _ensure_incident(self, incident: StoredIncident) -> None:
+        """Re-create the row of an incident that was discarded or evicted before its files arrived."""
+
+        cursor = self._db.execute(
+            "INSERT OR IGNORE INTO incidents (id, stream, created, stem, pending_upload) VALUES (?, ?, ?, ?, ?)",
+            (
+                incident.incident_id,
+                incident.stream,
+                incident.created,
+                self._relative(incident.stem),
+                int(incident.pending_upload),
+            ),
+        )
+        self.incident_count += cursor.rowcount
+
+    def _evict(self, incident_id: int) -> None:
+        files: Dict[str, int] = dict(
+            self._db.execute("SELECT path, size FROM files WHERE incident_id = ?", (incident_id,)).fetchall()
+        )
+        for relative in files:
+            path = self.base_dir / relative
+            path.unlink(missing_ok=True)
+            if path.suffix == ".jpg":
+                annotated_path(path).unlink(missing_ok=True)  # an upload-time render not indexed yet
+        self._db.execute("DELETE FROM files WHERE incident_id = ?", (incident_id,))
+        self._db.execute("DELETE FROM incidents WHERE id = ?", (incident_id,))
+        self.total_bytes -= sum(files.values())
+        self.incident_count -= 1
 
+    def _relative(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.base_dir))
+        except ValueError:
+            return str(path)
@@ -0,0 +1,118 @@
+"""Timing helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+
+@dataclass
+class TimingStats:
+    name: str
+    calls: int
+    items_per_call: int
+    total_seconds: float
+    p50_ms: float
+    p95_ms: float
+
+    @property
+    def ms_per_item(self) -> float:
+        return 1000.0 * self.total_seconds / max(1, self.calls * self.items_per_call)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.calls * self.items_per_call / self.total_seconds if self.total_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["ms_per_item"] = self.ms_per_item
+        payload["items_per_second"] = self.items_per_second
+        return payload
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    calls: int,
+    warmup: int = 1,
+    items_per_call: int = 1,
+) -> TimingStats:
+    """Time ``calls`` invocations of ``fn`` after ``warmup`` untimed ones."""
+
+    for _ in range(warmup):
+        fn()
+
+    durations: List[float] = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+
+    samples = np.asarray(durations) * 1000.0
+    return TimingStats(
+        name=name,
+        calls=calls,
+        items_per_call=items_per_call,
+        total_seconds=float(sum(durations)),
+        p50_ms=float(np.percentile(samples, 50)),
+        p95_ms=float(np.percentile(samples, 95)),
+    )
+
+
+def synthetic_frames(count: int, width: int, height: int, seed: int = 0) -> List[np.ndarray]:
+    """Generate BGR frames of textured terrain with a few bright fire-coloured blobs."""
+
+    rng = np.random.default_rng(seed)
+    frames: List[np.ndarray] = []
+    for _ in range(count):
+        frame = rng.integers(20, 90, size=(height, width, 3), dtype=np.uint8)
+        for _ in range(3):
+            cx, cy = int(rng.integers(0, width)), int(rng.integers(0, height))
+            radius = max(2, min(width, height) // 40)
+            y0, y1 = max(0, cy - radius), min(height, cy + radius)
+            x0, x1 = max(0, cx - radius), min(width, cx + radius)
+            frame[y0:y1, x0:x1] = (0, 110, 255)
+        frames.append(frame)
+    return frames
+
+
+def environment_info() -> Dict[str, Any]:
+    """Host and library versions recorded alongside benchmark results."""
+
+    import cv2
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def find_regressions(
+    current: Sequence[Mapping[str, Any]],
+    baseline: Sequence[Mapping[str, Any]],
+    tolerance: float = 0.2,
+    metric: str = "p50_ms",
+) -> List[Dict[str, Any]]:
+    """Return entries (matched by ``name``) whose ``metric`` grew by more than ``tolerance`` over ``baseline``."""
+
+    previous = {entry["name"]: entry for entry in baseline}
+    regressions: List[Dict[str, Any]] = []
+    for entry in current:
+        reference = previous.get(entry["name"])
+        if not reference or not reference.get(metric):
+            continue
+        ratio = entry[metric] / reference[metric]
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                {"name": entry["name"], "baseline": reference[metric], "current": entry[metric], "ratio": ratio}
+            )
+    return regressions
@@ -0,0 +1,317 @@
+"""In-process pipeline metrics with Prometheus text and JSON snapshot export.
+
+Stages record their latency into rolling windows of the most recent samples
+and events bump counters. Recording is a lock and a deque append, so it
+stays on for every frame; quantiles are only computed when the metrics are
+read by the HTTP endpoint or the snapshot writer.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+MetricKey = Tuple[str, Optional[str]]
+
+
+class LatencyWindow:
+    """Latency samples of one stage; quantiles cover the last ``window`` samples."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantiles(self) -> Dict[float, float]:
+        with self._lock:
+            samples = np.fromiter(self._samples, dtype=np.float64, count=len(self._samples))
+        if not samples.size:
+            return {quantile: 0.0 for quantile in QUANTILES}
+        values = np.quantile(samples, QUANTILES)
+        return {quantile: float(value) for quantile, value in zip(QUANTILES, values)}
+
+
+class Counter:
+    """Monotonic count; ``set`` mirrors totals kept elsewhere, such as the capture queue's drops."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def set(self, value: int) -> None:
+        with self._lock:
+            self.value = value
+
+
+class Gauge:
+    """Point-in-time value, read through ``fn`` when the metrics are exported."""
+
+    def __init__(self, fn: Callable[[], float]) -> None:
+        self.fn = fn
+
+    @property
+    def value(self) -> float:
+        return float(self.fn())
+
+
+class PipelineMetrics:
+    """Registry of stage latencies and counters, optionally labelled by stream.
+
+    Callers look metrics up once and keep the returned objects, so the per
+    frame cost is only the ``observe``/``inc`` call.
+    """
+
+    def __init__(self, window: int = 1024, prefix: str = "bushfire") -> None:
+        self.window = window
+        self.prefix = prefix
+        self.started = time.time()
+        self._latencies: Dict[MetricKey, LatencyWindow] = {}
+        self._counters: Dict[MetricKey, Counter] = {}
+        self._gauges: Dict[MetricKey, Gauge] = {}
+        self._lock = threading.Lock()
+
+    def latency(self, stage: str, stream: Optional[str] = None) -> LatencyWindow:
+        with self._lock:
+            key = (stage, stream)
+            if key not in self._latencies:
+                self._latencies[key] = LatencyWindow(self.window)
+            return self._latencies[key]
+
+    def counter(self, name: str, stream: Optional[str] = None) -> Counter:
+        with self._lock:
+            key = (name, stream)
+            if key not in self._counters:
+                self._counters[key] = Counter()
+            return self._counters[key]
+
+    def gauge(self, name: str, fn: Callable[[], float], stream: Optional[str] = None) -> Gauge:
+        """Register (or replace) a gauge whose value is computed by ``fn`` at export time."""
+
+        with self._lock:
+            gauge = self._gauges[(name, stream)] = Gauge(fn)
+            return gauge
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values as plain JSON types; counters include their average rate since start."""
+
+        now = time.time()
+        uptime = max(now - self.started, 1e-9)
+        with self._lock:
+            latencies = sorted(self._latencies.items(), key=_sort_key)
+            counters = sorted(self._counters.items(), key=_sort_key)
+            gauges = sorted(self._gauges.items(), key=_sort_key)
+
+        stages: List[Dict[str, Any]] = []
+        for (stage, stream), window in latencies:
+            quantiles = window.quantiles()
+            stages.append(
+                {
+                    "stage": stage,
+                    "stream": stream,
+                    "count": window.count,
+                    "mean_ms": 1000.0 * window.total / window.count if window.count else 0.0,
+                    "p50_ms": 1000.0 * quantiles[0.5],
+                    "p95_ms": 1000.0 * quantiles[0.95],
+                    "p99_ms": 1000.0 * quantiles[0.99],
+                }
+            )
+        totals = [
+            {"name": name, "stream": stream, "value": counter.value, "per_second": counter.value / uptime}
+            for (name, stream), counter in counters
+        ]
+        values = [{"name": name, "stream": stream, "value": gauge.value} for (name, stream), gauge in gauges]
+        return {"timestamp": now, "uptime_sec": uptime, "stages": stages, "counters": totals, "gauges": values}
+
+    def prometheus_text(self) -> str:
+        """Render the metrics in the Prometheus text exposition format (0.0.4)."""
+
+        with self._lock:
+            latencies = sorted(self._latencies.items(), key=_sort_key)
+            counters = sorted(self._counters.items(), key=_sort_key)
+            gauges = sorted(self._gauges.items(), key=_sort_key)
+
+        family = f"{self.prefix}_stage_latency_seconds"
+        lines = [
+            f"# HELP {family} Pipeline stage latency over the most recent {self.window} samples.",
+            f"# TYPE {family} summary",
+        ]
+        for (stage, stream), window in latencies:
+            labels = _labels(stage=stage, stream=stream)
+            for quantile, value in window.quantiles().items():
+                lines.append(f"{family}{_labels(stage=stage, stream=stream, quantile=str(quantile))} {value:.6g}")
+            lines.append(f"{family}_sum{labels} {window.total:.6g}")
+            lines.append(f"{family}_count{labels} {window.count}")
+
+        seen = set()
+        for (name, stream), counter in counters:
+            metric = f"{self.prefix}_{name}_total"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_labels(stream=stream)} {counter.value}")
+        for (name, stream), gauge in gauges:
+            metric = f"{self.prefix}_{name}"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric}{_labels(stream=stream)} {gauge.value:.6g}")
+        return "\n".join(lines) + "\n"
+
+
+class StreamMetrics:
+    """The pipeline's stage latencies and counters for one stream, bound once at construction."""
+
+    def __init__(self, metrics: PipelineMetrics, stream: Optional[str] = None) -> None:
+        self.capture = metrics.latency("capture", stream)
+        self.inference = metrics.latency("inference", stream)
+        self.buffer = metrics.latency("buffer", stream)
+        self.tracking = metrics.latency("tracking", stream)
+        self.artifact = metrics.latency("artifact", stream)
+        self.report = metrics.latency("report", stream)
+        self.end_to_end = metrics.latency("end_to_end", stream)
+        self.frames_captured = metrics.counter("frames_captured", stream)
+        self.frames_inferred = metrics.counter("frames_inferred", stream)
+        self.frames_skipped = metrics.counter("frames_skipped", stream)
+        self.frames_dropped = metrics.counter("frames_dropped", stream)
+        self.frames_not_decoded = metrics.counter("frames_not_decoded", stream)
+        self.incidents = metrics.counter("incidents", stream)
+        self.artifacts_written = metrics.counter("artifacts_written", stream)
+        self.artifacts_dropped = metrics.counter("artifacts_dropped", stream)
+        self.uploads_succeeded = metrics.counter("uploads_succeeded", stream)
+        self.uploads_failed = metrics.counter("uploads_failed", stream)
+
+
+class MetricsExporter:
+    """Serves ``/metrics`` (Prometheus text) and ``/metrics.json`` and rewrites a JSON snapshot file.
+
+    Either side is optional: ``port=None`` skips the HTTP server and
+    ``snapshot_path=None`` skips the snapshot thread. Port 0 binds a free
+    port, available as ``port`` after ``start``.
+    """
+
+    def __init__(
+        self,
+        metrics: PipelineMetrics,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        snapshot_path: Optional[Path] = None,
+        snapshot_interval_sec: float = 30.0,
+    ) -> None:
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval_sec = snapshot_interval_sec
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port), _handler_for(self.metrics))
+            self.port = self._server.server_address[1]
+            self._spawn(self._server.serve_forever, "metrics-http")
+            logger.info("Serving pipeline metrics on http://{}:{}/metrics", self.host, self.port)
+        if self.snapshot_path is not None:
+            self._spawn(self._snapshot_loop, "metrics-snapshot")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+        self._threads.clear()
+        if self.snapshot_path is not None:
+            self.write_snapshot()
+
+    def write_snapshot(self) -> None:
+        """Replace ``snapshot_path`` atomically so readers never see a partial file."""
+
+        assert self.snapshot_path is not None
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        temporary.write_text(json.dumps(self.metrics.snapshot(), indent=2))
+        os.replace(temporary, self.snapshot_path)
+
+    def _snapshot_loop(self) -> None:
+        while not self._stop.wait(self.snapshot_interval_sec):
+            try:
+                self.write_snapshot()
+            except OSError:
+                logger.exception("Failed to write metrics snapshot to {}", self.snapshot_path)
+
+    def _spawn(self, target, name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+
+def _handler_for(metrics: PipelineMetrics) -> type:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path == "/metrics":
+                body, content_type = metrics.prometheus_text(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(metrics.snapshot()), "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.trace("Metrics request: {}", format % args)
+
+    return MetricsHandler
+
+
+def _labels(**values: Optional[str]) -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in values.items() if value is not None]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sort_key(item: Tuple[MetricKey, Any]) -> Tuple[str, str]:
+    (name, stream), _ = item
+    return name, stream or ""
@@ -0,0 +1,36 @@
+import threading
+
+from bushfire_ai.pipeline.artifact_worker import ArtifactWorkerPool
+
+
+def test_pool_rejects_when_backlog_full_and_reports_completion():
+    release = threading.Event()
+    completed = []
+    pool = ArtifactWorkerPool(max_workers=1, max_backlog=1)
+
+    def blocked() -> str:
+        release.wait(timeout=5)
+        return "done"
+
+    assert pool.submit(blocked, on_complete=lambda result, error: completed.append((result, error)))
+    assert pool.submit(blocked)
+    assert not pool.submit(blocked)
+    assert pool.rejected == 1
+
+    release.set()
+    pool.shutdown(wait=True)
+    assert completed == [("done", None)]
+    assert pool.completed == 2 and pool.in_flight == 0
+
+
+def test_pool_passes_errors_to_callback():
+    errors = []
+    pool = ArtifactWorkerPool(max_workers=1, max_backlog=0)
+
+    def failing() -> None:
+        raise OSError("disk full")
+
+    pool.submit(failing, on_complete=lambda result, error: errors.append(error))
+    pool.shutdown(wait=True)
+    assert isinstance(errors[0], OSError)
+    assert pool.failed == 1
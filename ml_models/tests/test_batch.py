@@ -0,0 +1,39 @@
+import math
+
+import cv2
+import numpy as np
+
+from bushfire_ai.pipeline.batch import discover_videos, plan_segments, read_segment
+
+
+def write_video(path, frames: int = 45, fps: float = 15.0):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (64, 48))
+    for index in range(frames):
+        writer.write(np.full((48, 64, 3), index * 5 % 255, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_discover_videos_expands_directories_and_globs(tmp_path):
+    nested = tmp_path / "sweep" / "day1"
+    nested.mkdir(parents=True)
+    first = write_video(nested / "a.avi", frames=2)
+    second = write_video(tmp_path / "b.avi", frames=2)
+    (nested / "notes.txt").write_text("not a video")
+
+    assert discover_videos([str(tmp_path / "sweep")]) == [first.resolve()]
+    assert discover_videos([str(tmp_path / "*.avi"), str(second)]) == [second.resolve()]
+
+
+def test_segments_cover_every_frame_once_by_pts(tmp_path):
+    video = write_video(tmp_path / "sweep.avi", frames=45, fps=15.0)
+    segments = plan_segments([video], segment_sec=1.0)
+    assert [(segment.start_sec, segment.end_sec) for segment in segments] == [(0.0, 1.0), (1.0, 2.0), (2.0, math.inf)]
+
+    seen = []
+    for segment in segments:
+        capture = cv2.VideoCapture(str(video))
+        seen += [(index, pts) for index, pts, _ in read_segment(capture, segment.start_sec, segment.end_sec)]
+        capture.release()
+    assert [index for index, _ in seen] == list(range(45))
+    assert math.isclose(seen[15][1], 1.0, abs_tol=1e-3)
@@ -0,0 +1,22 @@
+from bushfire_ai.utils.benchmark import find_regressions, measure
+
+
+def test_measure_counts_items():
+    stats = measure("noop", lambda: None, calls=4, items_per_call=10)
+
+    assert stats.calls == 4
+    assert stats.to_dict()["items_per_second"] > 0
+
+
+def test_find_regressions_flags_slowdowns_beyond_tolerance():
+    baseline = [{"name": "decode@640x360", "p50_ms": 10.0}, {"name": "draw@640x360", "p50_ms": 4.0}]
+    current = [
+        {"name": "decode@640x360", "p50_ms": 11.5},
+        {"name": "draw@640x360", "p50_ms": 6.0},
+        {"name": "new@640x360", "p50_ms": 1.0},
+    ]
+
+    regressions = find_regressions(current, baseline, tolerance=0.2)
+
+    assert [entry["name"] for entry in regressions] == ["draw@640x360"]
+    assert regressions[0]["ratio"] == 1.5
@@ -0,0 +1,260 @@
+import asyncio
+import json
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from bushfire_ai.config.settings import CamaraConfig, Settings
+from bushfire_ai.integrations.camara_client import CamaraClient, TtlCache, seconds_until
+from bushfire_ai.integrations.camara_reporter import IncidentReporter
+from bushfire_ai.storage.local_store import LocalStorage
+from bushfire_ai.utils.metrics import PipelineMetrics
+
+
+DELAY = 0.3
+
+
+class StandInCamara(BaseHTTPRequestHandler):
+    """Local CAMARA stand-in: location and QoD each take ``DELAY`` seconds."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list = []
+    failing_uploads = 0
+    lifetime_sec = 600
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._record()
+        time.sleep(DELAY)
+        self._reply({"latitude": -33.7, "longitude": 150.3})
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._record()
+        remaining = int(self.headers.get("Content-Length", 0))
+        received = 0
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 65536))
+            received += len(chunk)
+            remaining -= len(chunk)
+        if self.path == "/token":
+            self._reply({"access_token": "stand-in", "expires_in": StandInCamara.lifetime_sec})
+        elif self.path == "/qod":
+            time.sleep(DELAY)
+            valid_until = datetime.now(timezone.utc) + timedelta(seconds=StandInCamara.lifetime_sec)
+            self._reply({"requestId": "qod-1", "status": "accepted", "validUntil": valid_until.isoformat()})
+        elif StandInCamara.failing_uploads:
+            StandInCamara.failing_uploads -= 1
+            self._reply({"error": "uplink down"}, status=503)
+        else:
+            self._reply({"incidentId": "incident-1", "bytes": received})
+
+    def _record(self) -> None:
+        StandInCamara.requests.append((self.command, self.path.split("?")[0], self.client_address[1]))
+
+    def _reply(self, payload: dict, status: int = 200) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def camara_server():
+    StandInCamara.requests = []
+    StandInCamara.failing_uploads = 0
+    StandInCamara.lifetime_sec = 600
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInCamara)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def stand_in_settings(server: str, artifact_dir: Path) -> Settings:
+    config = CamaraConfig(
+        base_url=server,
+        qod_url=f"{server}/qod",
+        upload_url=f"{server}/incidents",
+        token_url=f"{server}/token",
+        client_id="id",
+        client_secret="secret",
+        offline=False,
+    )
+    settings = Settings(camara=config, device_id="drone-1")
+    settings.events.artifact_dir = artifact_dir
+    return settings
+
+
+def test_reporter_runs_location_and_qod_concurrently_and_caches_them(camara_server: str, tmp_path: Path):
+    frame = tmp_path / "frame.jpg"
+    frame.write_bytes(b"\xff\xd8jpeg")
+    metrics = PipelineMetrics()
+    reporter = IncidentReporter(stand_in_settings(camara_server, tmp_path), metrics)
+    try:
+        started = time.perf_counter()
+        first = reporter.report_incident(0.9, ["fire"], frame, None)
+        elapsed = time.perf_counter() - started
+        second = reporter.report_incident(0.8, ["fire"], frame, None)
+    finally:
+        reporter.close()
+
+    assert first["incidentId"] == "incident-1" and second["incidentId"] == "incident-1"
+    assert elapsed < 2 * DELAY  # sequential location + QoD would take at least 2 * DELAY
+    paths = [path for _, path, _ in StandInCamara.requests]
+    # one token for the concurrent location and QoD calls; both are reused by the second report
+    assert paths.count("/token") == 1
+    assert paths.count("/device-location/v1/location") == 1
+    assert paths.count("/qod") == 1
+    assert paths.count("/incidents") == 2
+    # later reports reuse pooled keep-alive connections instead of opening new ones
+    ports = {port for _, _, port in StandInCamara.requests}
+    assert len(ports) < len(StandInCamara.requests)
+    stages = {entry["stage"]: entry["count"] for entry in metrics.snapshot()["stages"]}
+    assert stages == {"camara_location": 2, "camara_qod": 2, "camara_upload": 2}
+    counters = {entry["name"]: entry["value"] for entry in metrics.snapshot()["counters"]}
+    assert counters["camara_location_cache_hits"] == 1
+    assert counters["camara_qod_cache_misses"] == 1
+
+
+def test_failed_upload_stays_in_outbox_until_the_drainer_delivers_it(camara_server: str, tmp_path: Path):
+    frame = tmp_path / "frame.jpg"
+    frame.write_bytes(b"\xff\xd8jpeg")
+    settings = stand_in_settings(camara_server, tmp_path)
+    settings.outbox.base_backoff_sec = 0.1
+    StandInCamara.failing_uploads = 2
+    metrics = PipelineMetrics()
+    reporter = IncidentReporter(settings, metrics)
+    try:
+        assert reporter.report_incident(0.9, ["fire"], frame, None) is None
+        assert reporter.outbox.depth() == 1
+        deadline = time.monotonic() + 10.0
+        while reporter.outbox.depth() and time.monotonic() < deadline:
+            time.sleep(0.1)
+    finally:
+        reporter.close()
+
+    assert reporter.outbox.depth() == 0
+    counters = {entry["name"]: entry["value"] for entry in metrics.snapshot()["counters"]}
+    assert counters["outbox_delivered"] == 1 and counters["outbox_retries"] == 2
+
+
+def test_quota_keeps_evidence_until_the_outbox_delivers_it(camara_server: str, tmp_path: Path):
+    settings = stand_in_settings(camara_server, tmp_path)
+    settings.outbox.base_backoff_sec = 1.0  # the retry comes 0.5-1 s later
+    StandInCamara.failing_uploads = 1
+    storage = LocalStorage(tmp_path / "artifacts", max_incidents=1)
+    reporter = IncidentReporter(settings, PipelineMetrics())
+    reporter.on_uploaded = storage.mark_uploaded
+
+    def store(timestamp: float, pending_upload: bool) -> Path:
+        incident = storage.new_incident(timestamp, pending_upload=pending_upload)
+        frame = incident.stem.with_name(incident.stem.name + ".jpg")
+        frame.write_bytes(b"\xff\xd8jpeg")
+        storage.save_paths(frame, incident=incident)
+        return frame
+
+    try:
+        undelivered = store(1_700_000_000.0, pending_upload=True)
+        assert reporter.report_incident(0.9, ["fire"], undelivered, None) is None
+        newer = store(1_700_000_060.0, pending_upload=False)
+        # over the quota, but the only older incident is still in the outbox
+        assert undelivered.exists() and storage.incident_count == 2 and storage.evicted == 0
+
+        deadline = time.monotonic() + 10.0
+        while reporter.outbox.depth() and time.monotonic() < deadline:
+            time.sleep(0.1)
+    finally:
+        reporter.close()
+        storage.close()
+
+    # once delivered it is evictable again and the quota removes it
+    assert reporter.outbox.depth() == 0
+    assert not undelivered.exists() and newer.exists() and storage.incident_count == 1
+
+
+def test_upload_streams_clip_from_disk_with_progress(camara_server: str, tmp_path: Path):
+    frame = tmp_path / "frame.jpg"
+    frame.write_bytes(b"\xff\xd8" + bytes(1000))
+    clip = tmp_path / "clip.mp4"
+    with clip.open("wb") as handle:
+        for _ in range(8):
+            handle.write(bytes(1024 * 1024))
+    client = CamaraClient(stand_in_settings(camara_server, tmp_path).camara)
+    reports = []
+
+    def progress(sent: int, total: int) -> None:
+        reports.append((sent, total))
+
+    async def upload():
+        try:
+            return await client.upload_incident({"confidence": 0.9}, frame, clip, progress)
+        finally:
+            await client.close()
+
+    tracemalloc.start()
+    try:
+        response = asyncio.run(upload())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    total = frame.stat().st_size + clip.stat().st_size
+    assert response["bytes"] > total
+    assert reports[-1] == (total, total)
+    assert [sent for sent, _ in reports] == sorted(sent for sent, _ in reports)
+    assert peak < 4 * 1024 * 1024  # a buffered upload would hold the whole 8 MB clip
+
+
+def test_short_lived_token_and_qod_session_are_still_cached(camara_server: str, tmp_path: Path):
+    StandInCamara.lifetime_sec = 30  # shorter than the default 60 s refresh margin
+    client = CamaraClient(stand_in_settings(camara_server, tmp_path).camara)
+
+    async def scenario():
+        try:
+            for _ in range(3):
+                await client.request_quality_on_demand("drone-1")
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    paths = [path for _, path, _ in StandInCamara.requests]
+    assert paths.count("/token") == 1 and paths.count("/qod") == 1
+    assert client._refresh_before(30.0) == 15.0 and client._refresh_before(3600.0) == 3540.0
+
+
+def test_ttl_cache_single_flight_and_expiry():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls), 0.05
+
+    async def scenario():
+        cache = TtlCache()
+        first = await asyncio.gather(*(cache.get("token", fetch) for _ in range(5)))
+        cached = await cache.get("token", fetch)
+        await asyncio.sleep(0.06)
+        refreshed = await cache.get("token", fetch)
+        return cache, first, cached, refreshed
+
+    cache, first, cached, refreshed = asyncio.run(scenario())
+    assert first == [1] * 5 and cached == 1 and refreshed == 2
+    assert (cache.hits, cache.misses) == (5, 2)
+
+
+def test_seconds_until_handles_missing_and_past_timestamps():
+    assert seconds_until(None) == 0.0
+    assert seconds_until("not a date") == 0.0
+    assert seconds_until("2025-01-01T00:30:00Z") < 0
+    assert 590 < seconds_until((datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()) <= 600
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.pipeline.clip_encoder import (
+    ClipEncoder,
+    ClipEncoderError,
+    ClipWriter,
+    FfmpegClipEncoder,
+    OpenCvClipEncoder,
+    create_clip_encoder,
+    find_ffmpeg,
+)
+from bushfire_ai.pipeline.event_accumulator import EventAccumulator
+from bushfire_ai.pipeline.video_source import Frame
+
+
+requires_ffmpeg = pytest.mark.skipif(find_ffmpeg() is None, reason="ffmpeg not available")
+
+
+def frames(count: int, width: int = 96, height: int = 64):
+    return [np.full((height, width, 3), index * 8 % 255, dtype=np.uint8) for index in range(count)]
+
+
+@requires_ffmpeg
+def test_ffmpeg_command_downscales_to_even_size():
+    encoder = FfmpegClipEncoder("h265", preset="fast", crf=30, max_width=641)
+    assert encoder.output_size(1920, 1080) == (640, 360)
+    assert encoder.output_size(101, 51) == (100, 50)
+
+    command = encoder.command(Path("clip.mp4"), 1920, 1080, 15.0)
+    assert command[command.index("-s") + 1] == "1920x1080"
+    assert command[command.index("-vf") + 1] == "scale=640:360"
+    assert command[command.index("-c:v") + 1] == "libx265"
+    assert command[command.index("-crf") + 1] == "30"
+    assert command[-1] == "clip.mp4"
+
+
+@requires_ffmpeg
+def test_ffmpeg_encodes_readable_h264_clip(tmp_path):
+    encoder = FfmpegClipEncoder("h264", preset="ultrafast", max_width=64)
+    writer = encoder.open(tmp_path / "clip.mp4", 96, 64, 10.0)
+    for frame in frames(12):
+        writer.write(frame)
+    path = writer.close()
+
+    capture = cv2.VideoCapture(str(path))
+    ok, decoded = capture.read()
+    count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    capture.release()
+    assert ok and decoded.shape == (42, 64, 3)
+    assert count == 12
+
+
+def test_missing_ffmpeg_falls_back_to_opencv(tmp_path):
+    encoder = create_clip_encoder("ffmpeg", ffmpeg_path=str(tmp_path / "no-ffmpeg"))
+    assert isinstance(encoder, OpenCvClipEncoder)
+
+
+class BrokenEncoder(ClipEncoder):
+    name = "broken"
+
+    def open(self, path: Path, width: int, height: int, fps: float) -> ClipWriter:
+        raise ClipEncoderError("encoder crashed")
+
+
+def test_accumulator_retries_failed_clip_with_opencv(tmp_path):
+    accumulator = EventAccumulator(tmp_path, 1.0, 0.0, clip_fps=10.0, clip_encoder=BrokenEncoder())
+    for index, data in enumerate(frames(5)):
+        accumulator.add_frame(Frame(data=data, timestamp=index / 10.0, index=index))
+
+    artifact = accumulator.create_artifact(0.9, DetectionResult.empty(), timestamp=1.0)
+    assert artifact.clip_path is not None and artifact.clip_path.stat().st_size > 0
@@ -0,0 +1,54 @@
+import cv2
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.pipeline.event_accumulator import EventAccumulator
+from bushfire_ai.pipeline.video_source import Frame
+
+
+def frame(index: int, fps: float = 10.0) -> Frame:
+    data = np.full((48, 64, 3), index * 10 % 255, dtype=np.uint8)
+    return Frame(data=data, timestamp=index / fps, index=index)
+
+
+def clip_frames(path) -> int:
+    capture = cv2.VideoCapture(str(path))
+    count = 0
+    while capture.read()[0]:
+        count += 1
+    capture.release()
+    return count
+
+
+def test_clip_covers_pre_and_post_event_frames(tmp_path):
+    accumulator = EventAccumulator(tmp_path, pre_event_seconds=0.5, post_event_seconds=0.5, clip_fps=10.0)
+    for index in range(10):
+        accumulator.add_frame(frame(index))
+
+    session = accumulator.open_clip(timestamp=100.0, trigger_time=0.9)
+    assert session is not None and len(session.pre_event) == 6  # 0.4 .. 0.9 s
+    for index in range(10, 20):
+        accumulator.add_frame(frame(index))
+
+    assert session.finished and not accumulator.sessions  # closed once the clock passed 1.4 s
+    path = session.wait(timeout=10)
+    session.join(timeout=10)
+    assert session.frames_written == 11
+    assert clip_frames(path) == 11
+
+    artifact = accumulator.create_artifact(0.8, DetectionResult.empty(), timestamp=100.0, clip_path=path)
+    assert artifact.clip_path == path
+
+
+def test_open_clips_are_limited_and_finalized_at_end_of_stream(tmp_path):
+    accumulator = EventAccumulator(tmp_path, 1.0, 5.0, clip_fps=10.0, max_clip_sessions=1)
+    for index in range(5):
+        accumulator.add_frame(frame(index))
+
+    session = accumulator.open_clip(timestamp=1.0, trigger_time=0.4)
+    assert accumulator.open_clip(timestamp=2.0, trigger_time=0.4) is None
+    accumulator.add_frame(frame(5))
+
+    assert accumulator.finish_clips() == [session]
+    assert clip_frames(session.wait(timeout=10)) == 6
+    assert not session.append(frame(6))
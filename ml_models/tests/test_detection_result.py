@@ -0,0 +1,32 @@
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult, build_class_mask, extract_detections
+
+NAMES = {0: "fire", 1: "smoke", 2: "person"}
+
+
+def test_extract_detections_filters_by_class_mask():
+    data = np.array(
+        [
+            [0, 0, 10, 10, 0.9, 0],
+            [5, 5, 20, 20, 0.8, 2],
+            [1, 1, 4, 4, 0.7, 1],
+            [2, 2, 3, 3, 0.6, 7],
+        ],
+        dtype=np.float32,
+    )
+
+    result = extract_detections(data, NAMES, build_class_mask(NAMES, ["Fire", "smoke"]))
+
+    assert result.boxes.shape == (2, 4) and result.boxes.flags["C_CONTIGUOUS"]
+    assert result.class_ids.tolist() == [0, 1]
+    assert result.labels == ["fire", "smoke"]
+    assert result.highest_confidence() == np.float32(0.9)
+
+
+def test_detection_result_empty_and_unknown_labels():
+    assert len(DetectionResult.empty(NAMES)) == 0
+    assert not DetectionResult.empty().has_fire(0.0)
+
+    result = extract_detections(np.array([[0, 0, 1, 1, 0.5, 9]], dtype=np.float32), NAMES)
+    assert result.labels == ["class_9"]
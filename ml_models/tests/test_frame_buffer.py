@@ -0,0 +1,54 @@
+import numpy as np
+
+from bushfire_ai.pipeline.frame_buffer import FrameRingBuffer
+from bushfire_ai.pipeline.video_source import Frame
+
+
+def _frame(timestamp: float, value: int = 0, width: int = 400, height: int = 200) -> Frame:
+    return Frame(data=np.full((height, width, 3), value, dtype=np.uint8), timestamp=timestamp)
+
+
+def test_raw_buffer_respects_byte_budget_and_downscales():
+    slot_bytes = 200 * 100 * 3
+    buffer = FrameRingBuffer(max_bytes=slot_bytes * 4, max_width=200)
+
+    for idx in range(10):
+        buffer.push(_frame(float(idx), value=idx))
+
+    assert buffer.capacity == 4 and len(buffer) == 4
+    assert buffer.allocated_bytes == slot_bytes * 4
+    frames = list(buffer.snapshot())
+    assert [frame.timestamp for frame in frames] == [6.0, 7.0, 8.0, 9.0]
+    assert frames[0].data.shape == (100, 200, 3) and int(frames[-1].data[0, 0, 0]) == 9
+    assert buffer.stats()["occupancy"] == 1.0
+
+
+def test_buffer_samples_to_store_fps_and_trims_by_time():
+    buffer = FrameRingBuffer(max_bytes=10_000_000, store_fps=10.0)
+    kept = [buffer.push(_frame(idx / 30.0)) for idx in range(30)]
+
+    assert sum(kept) == 10
+    buffer.trim_before(0.5)
+    assert all(ts >= 0.5 for ts in buffer.snapshot().timestamps)
+
+
+def test_snapshot_is_detached_from_ring_slots():
+    buffer = FrameRingBuffer(max_bytes=400 * 200 * 3 * 2)
+    buffer.push(_frame(0.0, value=1))
+    snapshot = buffer.snapshot()
+    for idx in range(1, 4):
+        buffer.push(_frame(float(idx), value=200))
+
+    assert int(next(iter(snapshot)).data.max()) == 1
+
+
+def test_jpeg_buffer_evicts_oldest_beyond_budget():
+    buffer = FrameRingBuffer(max_bytes=6_000, jpeg_quality=80)
+    rng = np.random.default_rng(0)
+    for idx in range(20):
+        buffer.push(Frame(data=rng.integers(0, 255, (64, 64, 3), dtype=np.uint8), timestamp=float(idx)))
+
+    assert 0 < len(buffer) < 20
+    assert buffer.nbytes <= 6_000
+    decoded = list(buffer.snapshot())
+    assert decoded[-1].timestamp == 19.0 and decoded[-1].data.shape == (64, 64, 3)
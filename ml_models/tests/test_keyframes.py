@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult, FireDetectionModel
+from bushfire_ai.storage.keyframes import (
+    annotated_path,
+    find_keyframes,
+    read_sidecar,
+    render_annotated,
+    sidecar_path,
+    write_keyframe,
+)
+
+
+def detection():
+    return DetectionResult(
+        boxes=np.array([[10.0, 8.0, 40.0, 30.0]]),
+        confidences=np.array([0.875]),
+        class_ids=np.array([0]),
+        names={0: "fire"},
+    )
+
+
+def test_keyframe_is_stored_raw_with_a_sidecar(tmp_path):
+    frame = np.full((48, 64, 3), 60, dtype=np.uint8)
+    path = write_keyframe(tmp_path / "fire_1.jpg", frame, detection(), timestamp=1.5)
+
+    stored = cv2.imread(str(path))
+    assert np.abs(stored.astype(int) - 60).max() <= 2  # no boxes drawn, only JPEG noise
+    restored = read_sidecar(path)
+    assert restored.boxes.tolist() == [[10.0, 8.0, 40.0, 30.0]]
+    assert restored.labels == ["fire"] and restored.confidences.tolist() == [0.875]
+    assert find_keyframes([tmp_path]) == [path] and not annotated_path(path).exists()
+
+
+def test_render_draws_each_keyframe_once(tmp_path, monkeypatch):
+    path = write_keyframe(tmp_path / "fire_2.jpg", np.zeros((48, 64, 3), dtype=np.uint8), detection(), 2.0)
+    draws = []
+    original = FireDetectionModel.draw_detections
+
+    def counting_draw(frame, detections, copy=True):
+        draws.append(len(detections))
+        return original(frame, detections, copy=copy)
+
+    monkeypatch.setattr(FireDetectionModel, "draw_detections", staticmethod(counting_draw))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rendered = set(pool.map(render_annotated, [path] * 8))
+
+    assert rendered == {annotated_path(path)} and draws == [1]
+    assert cv2.imread(str(annotated_path(path))).max() > 0  # the box was drawn
+    assert render_annotated(path) == annotated_path(path) and draws == [1]
+
+
+def test_keyframes_without_sidecar_are_returned_as_is(tmp_path):
+    legacy = tmp_path / "fire_3.jpg"
+    cv2.imwrite(str(legacy), np.zeros((8, 8, 3), dtype=np.uint8))
+    assert render_annotated(legacy) == legacy and not sidecar_path(legacy).exists()
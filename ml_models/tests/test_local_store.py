@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from bushfire_ai.storage.keyframes import annotated_path
+from bushfire_ai.storage.local_store import LocalStorage
+
+DAY = 1_700_000_000.0  # 2023-11-14 UTC
+
+
+def store_incident(storage: LocalStorage, timestamp: float, stream=None, size: int = 100):
+    incident = storage.new_incident(timestamp, stream)
+    paths = []
+    for suffix in (".jpg", ".mp4"):
+        path = incident.stem.with_name(incident.stem.name + suffix)
+        path.write_bytes(b"x" * size)
+        paths.append(path)
+    storage.save_paths(*paths, incident=incident)
+    return incident, paths
+
+
+def test_incidents_are_sharded_unique_and_indexed(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+    first, first_paths = store_incident(storage, DAY + 0.2, "north")
+    second, _ = store_incident(storage, DAY + 0.7, "north")
+    other, _ = store_incident(storage, DAY + 86_400, "south")
+
+    assert first.stem.parent == tmp_path / "2023-11-14" / "north"
+    assert first.stem != second.stem  # same second, distinct files
+    assert other.stem.parent == tmp_path / "2023-11-15" / "south"
+    assert storage.incident_files(first.incident_id) == sorted(first_paths)
+    assert [i.incident_id for i in storage.incidents_between(DAY, DAY + 1)] == [first.incident_id, second.incident_id]
+    assert [i.incident_id for i in storage.incidents_between(0, 2 * DAY, stream="south")] == [other.incident_id]
+    storage.close()
+
+    reopened = LocalStorage(tmp_path)
+    assert (reopened.total_bytes, reopened.incident_count) == (600, 3)
+    reopened.close()
+
+
+def test_quotas_evict_whole_incidents_oldest_first(tmp_path: Path):
+    unindexed = tmp_path / "track_updates.jsonl"
+    unindexed.write_text("{}\n")
+    storage = LocalStorage(tmp_path, max_bytes=500, max_incidents=3)
+    oldest, oldest_paths = store_incident(storage, DAY)
+    annotated_path(oldest_paths[0]).write_bytes(b"render")
+    kept = [store_incident(storage, DAY + offset)[0] for offset in (1, 2)]
+
+    assert storage.evicted == 1 and storage.total_bytes == 400
+    assert not any(path.exists() for path in oldest_paths) and not annotated_path(oldest_paths[0]).exists()
+    assert storage.incident_files(oldest.incident_id) == []
+    assert [i.incident_id for i in storage.incidents_between(0, 2 * DAY)] == [i.incident_id for i in kept]
+
+    # an incident larger than the byte quota evicts the others but never itself
+    huge, huge_paths = store_incident(storage, DAY + 3, size=1000)
+    assert [i.incident_id for i in storage.incidents_between(0, 2 * DAY)] == [huge.incident_id]
+    assert all(path.exists() for path in huge_paths) and unindexed.exists()
+
+    storage.cleanup_old(max_items=0)
+    assert storage.incident_count == 0 and not huge_paths[0].exists() and storage.max_incidents == 3
+    storage.close()
+
+
+def test_pending_incidents_are_not_evicted_before_their_files_arrive(tmp_path: Path):
+    storage = LocalStorage(tmp_path, max_incidents=1)
+    pending = storage.new_incident(DAY)  # fire detected, clip still recording
+    newer, newer_paths = store_incident(storage, DAY + 1)
+    assert storage.evicted == 0 and storage.incident_count == 2
+
+    # once the pending incident's files land it is the one kept; the older-saved one makes room
+    clip = pending.stem.with_name(pending.stem.name + ".mp4")
+    clip.write_bytes(b"x" * 100)
+    storage.save_paths(clip, incident=pending)
+    assert [i.incident_id for i in storage.incidents_between(0, 2 * DAY)] == [pending.incident_id]
+    assert not any(path.exists() for path in newer_paths) and storage.total_bytes == 100
+
+    # a dropped persist task releases its reservation; files saved after a discard re-create the row
+    dropped = storage.new_incident(DAY + 2)
+    storage.discard_incident(dropped)
+    late = storage.new_incident(DAY + 3)
+    storage.discard_incident(late)
+    late_clip = late.stem.with_name(late.stem.name + ".mp4")
+    late_clip.write_bytes(b"x" * 50)
+    storage.save_paths(late_clip, incident=late)
+    assert storage.incident_files(late.incident_id) == [late_clip]
+    assert [i.incident_id for i in storage.incidents_between(0, 2 * DAY)] == [late.incident_id]
+    assert (storage.incident_count, storage.total_bytes) == (1, 50) and not clip.exists()
+    storage.close()
@@ -0,0 +1,51 @@
+import json
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from bushfire_ai.utils.metrics import MetricsExporter, PipelineMetrics
+
+
+def test_latency_quantiles_cover_the_rolling_window():
+    metrics = PipelineMetrics(window=100)
+    stage = metrics.latency("inference", "drone-a")
+    for value in range(1000):
+        stage.observe(value / 1000.0)
+
+    quantiles = stage.quantiles()
+    assert stage.count == 1000
+    assert quantiles[0.5] == pytest.approx(0.9495)
+    assert quantiles[0.99] == pytest.approx(0.99801)
+
+
+def test_prometheus_text_and_snapshot():
+    metrics = PipelineMetrics()
+    metrics.latency("buffer").observe(0.002)
+    metrics.counter("frames_captured", 'cam"1').inc(3)
+
+    text = metrics.prometheus_text()
+    assert '# TYPE bushfire_stage_latency_seconds summary' in text
+    assert 'bushfire_stage_latency_seconds{stage="buffer",quantile="0.95"} 0.002' in text
+    assert 'bushfire_stage_latency_seconds_count{stage="buffer"} 1' in text
+    assert 'bushfire_frames_captured_total{stream="cam\\"1"} 3' in text
+
+    snapshot = metrics.snapshot()
+    assert snapshot["stages"][0]["p50_ms"] == pytest.approx(2.0)
+    assert snapshot["counters"][0]["value"] == 3
+
+
+def test_exporter_serves_http_and_writes_snapshot(tmp_path: Path):
+    metrics = PipelineMetrics()
+    metrics.counter("incidents").inc()
+    snapshot_path = tmp_path / "metrics.json"
+    exporter = MetricsExporter(metrics, port=0, snapshot_path=snapshot_path, snapshot_interval_sec=60.0)
+    exporter.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert "bushfire_incidents_total 1" in body
+    finally:
+        exporter.stop()
+
+    assert json.loads(snapshot_path.read_text())["counters"][0]["name"] == "incidents"
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from bushfire_ai.pipeline.motion_gate import MotionGate
+
+
+@pytest.mark.parametrize("method", ["diff", "histogram"])
+def test_gate_skips_static_frames_until_stale(method: str):
+    gate = MotionGate(method=method, threshold=0.05, max_stale_frames=3)
+    static = np.full((120, 160, 3), 80, dtype=np.uint8)
+
+    decisions = [gate.should_infer(static) for _ in range(9)]
+
+    assert decisions == [True, False, False, False, True, False, False, False, True]
+    assert gate.saved_fraction == pytest.approx(6 / 9)
+
+
+def test_gate_infers_on_scene_change():
+    gate = MotionGate(method="diff", threshold=0.05)
+    dark = np.zeros((120, 160, 3), dtype=np.uint8)
+    bright = np.full((120, 160, 3), 200, dtype=np.uint8)
+
+    assert gate.should_infer(dark)
+    assert not gate.should_infer(dark)
+    assert gate.should_infer(bright)
+    assert gate.last_score > 0.5
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from bushfire_ai.integrations.outbox import IncidentOutbox
+
+
+def test_outbox_orders_by_confidence_and_survives_reopen(tmp_path: Path):
+    path = tmp_path / "outbox.sqlite3"
+    outbox = IncidentOutbox(path)
+    low = outbox.add(0.4, {"classes": ["fire"]}, tmp_path / "a.jpg")
+    high = outbox.add(0.9, {"classes": ["fire"]}, tmp_path / "b.jpg", tmp_path / "b.mp4")
+    outbox.add(0.7, {"classes": ["smoke"]}, tmp_path / "c.jpg")
+
+    assert [entry.confidence for entry in outbox.due(2)] == [0.9, 0.7]
+    assert [entry.entry_id for entry in outbox.due(5, exclude={high.entry_id})][-1] == low.entry_id
+    outbox.remove(low.entry_id)
+    outbox.close()
+    assert outbox.depth() == 2
+
+    reopened = IncidentOutbox(path)
+    entries = reopened.due(5)
+    assert [entry.metadata["classes"] for entry in entries] == [["fire"], ["smoke"]]
+    assert entries[0].clip_path == tmp_path / "b.mp4"
+    reopened.close()
+
+
+def test_outbox_backs_off_failed_entries(tmp_path: Path):
+    outbox = IncidentOutbox(tmp_path / "outbox.sqlite3", base_backoff_sec=10.0, max_backoff_sec=25.0)
+    entry = outbox.add(0.8, {}, tmp_path / "a.jpg")
+
+    first = outbox.retry_later(entry.entry_id, "ConnectError()")
+    assert 5.0 <= first <= 10.0
+    assert outbox.due(5) == []
+    assert 0 < outbox.next_due_in() <= 10.0
+    assert 12.5 <= outbox.backoff(3) <= 25.0
+    outbox.close()
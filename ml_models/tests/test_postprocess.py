@@ -0,0 +1,72 @@
+import numpy as np
+
+from bushfire_ai.detector.evaluation import match_detections
+from bushfire_ai.detector.postprocess import (
+    LetterboxBuffers,
+    greedy_pairs,
+    letterbox,
+    non_max_suppression,
+    scale_boxes,
+    to_blob,
+)
+
+
+def test_letterbox_round_trips_boxes():
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    square, meta = letterbox(frame, 640)
+    rect, rect_meta = letterbox(frame, 640, stride=32)
+
+    assert square.shape == (640, 640, 3)
+    assert rect.shape == (384, 640, 3)
+    model_box = np.array([[100.0, 140.0 + meta.pad_y, 300.0, 240.0 + meta.pad_y]], dtype=np.float32)
+    np.testing.assert_allclose(scale_boxes(model_box, meta), [[200.0, 280.0, 600.0, 480.0]], atol=1e-3)
+    assert rect_meta.pad_y == 12
+
+
+def test_letterbox_buffers_match_letterbox_and_reuse_memory():
+    rng = np.random.default_rng(0)
+    wide = rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    small = rng.integers(0, 255, (400, 700, 3), dtype=np.uint8)
+    buffers = LetterboxBuffers(640, stride=32)
+
+    blob, metas = buffers([wide, wide])
+    expected = to_blob(np.stack([letterbox(wide, 640, stride=32)[0]] * 2))
+    np.testing.assert_allclose(blob, expected, atol=1e-6)
+    assert metas[0].pad_y == 12
+
+    # a different layout in the same canvas repaints the old frame's border
+    again, metas = buffers([small])
+    np.testing.assert_allclose(again, to_blob(letterbox(small, 640, stride=32)[0][None]), atol=1e-6)
+    assert np.shares_memory(again, blob) and buffers.allocations == 1
+
+    # mixed shapes fall back to the square canvas, allocated once
+    mixed, metas = buffers([wide, small])
+    assert mixed.shape == (2, 3, 640, 640) and [meta.frame_width for meta in metas] == [1280, 700]
+    buffers([small, wide])
+    assert buffers.allocations == 2
+
+
+def test_nms_is_class_aware_and_capped():
+    boxes = np.array(
+        [[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10], [50, 50, 60, 60]],
+        dtype=np.float32,
+    )
+    scores = np.array([0.9, 0.8, 0.7, 0.6], dtype=np.float32)
+    class_ids = np.array([0, 0, 1, 0])
+
+    assert non_max_suppression(boxes, scores, 0.5, class_ids).tolist() == [0, 2, 3]
+    assert non_max_suppression(boxes, scores, 0.5).tolist() == [0, 3]
+    assert non_max_suppression(boxes, scores, 0.5, class_ids, max_detections=2).tolist() == [0, 2]
+
+
+def test_greedy_pairs_take_the_best_cells_first():
+    overlaps = np.array([[0.9, 0.6], [0.8, 0.1]])
+    assert greedy_pairs(overlaps, 0.5) == [(0, 0)]  # row 1 only overlaps the column row 0 already took
+    distances = np.array([[0.01, np.inf], [0.02, 0.03]])
+    assert greedy_pairs(distances, 0.05, maximize=False) == [(0, 0), (1, 1)]
+
+    reference = np.array([[0, 0, 10, 10, 0.9, 0], [20, 20, 30, 30, 0.8, 0]])
+    candidate = np.array([[0, 0, 10, 11, 0.7, 0], [20, 20, 30, 30, 0.8, 1]])  # second box has the wrong class
+    matched, deltas = match_detections(reference, candidate, 0.5)
+    assert matched == 1 and np.allclose(deltas, [0.2])
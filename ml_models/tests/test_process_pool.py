@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+import pytest
+
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.detector.process_pool import ProcessDetectorPool
+
+
+class BrightnessDetector:
+    """Reports one box whose confidence encodes the frame's first pixel, slower for dark frames."""
+
+    names = {0: "fire"}
+
+    def predict(self, frame: np.ndarray) -> DetectionResult:
+        value = int(frame[0, 0, 0])
+        if value == 255:
+            raise ValueError("overexposed")
+        time.sleep(0.02 if value % 2 else 0.0)  # odd frames finish after their successors
+        return DetectionResult(
+            boxes=np.array([[0, 0, frame.shape[1], frame.shape[0]]]),
+            confidences=np.array([value / 255.0]),
+            class_ids=np.array([0]),
+        )
+
+
+class CountingTiler:
+    def __init__(self):
+        self.tiles_total = 0
+        self.tiles_run = 0
+
+
+class TilingDetector(BrightnessDetector):
+    """Claims to infer four tiles per frame and skip one of them."""
+
+    def __init__(self):
+        self.tiler = CountingTiler()
+
+    def predict(self, frame: np.ndarray) -> DetectionResult:
+        self.tiler.tiles_total += 4
+        self.tiler.tiles_run += 3
+        return super().predict(frame)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ProcessDetectorPool(BrightnessDetector, workers=2, slots=3, threads_per_worker=1, start_timeout=60)
+    yield pool
+    pool.close()
+
+
+def frames(values, shape=(24, 32, 3)):
+    return [np.full(shape, value, dtype=np.uint8) for value in values]
+
+
+def test_results_come_back_in_submission_order(pool):
+    values = list(range(1, 12))
+    detections = pool.predict_batch(frames(values))
+    assert [round(float(d.confidences[0]) * 255) for d in detections] == values
+    assert detections[0].labels == ["fire"] and pool.in_flight == 0
+
+    # a new frame size reallocates the shared ring
+    [large] = pool.predict_batch(frames([7], shape=(48, 64, 3)))
+    assert large.boxes[0].tolist() == [0, 0, 64, 48]
+
+
+def test_submit_and_next_result_pipeline(pool):
+    sequences = [pool.submit(frame) for frame in frames([3, 4])]
+    assert [pool.next_result(timeout=10)[0] for _ in sequences] == sequences
+
+
+def test_worker_errors_surface_for_their_frame(pool):
+    with pytest.raises(RuntimeError, match="overexposed"):
+        pool.predict_batch(frames([1, 255, 3]))
+    assert pool.predict(frames([9])[0]).confidences.size == 1
+
+
+def test_inference_workers_raise_the_batch_size():
+    from bushfire_ai.config.settings import DetectionConfig, Settings
+    from bushfire_ai.pipeline.orchestrator import inference_batch_size
+
+    def batch(workers, size):
+        detection = DetectionConfig(inference_workers=workers, batch_size=size)
+        return inference_batch_size(Settings.model_construct(detection=detection))
+
+    assert (batch(0, 1), batch(4, 1), batch(4, 8)) == (1, 4, 8)
+
+
+def test_tiling_stats_are_summed_over_the_workers(pool):
+    assert pool.tiler is None  # the workers do not tile
+    tiling = ProcessDetectorPool(TilingDetector, workers=2, threads_per_worker=1, start_timeout=60)
+    try:
+        tiling.predict_batch(frames([2, 4, 6, 8, 10]))
+    finally:
+        tiling.close()
+    assert (tiling.tiler.tiles_run, tiling.tiler.tiles_total) == (15, 20)
+    assert tiling.tiler.tiles_skipped_fraction == 0.25
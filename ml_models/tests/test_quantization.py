@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from bushfire_ai.detector.quantization import _head_decode_nodes, label_path, load_frames
+
+
+def test_head_decode_nodes_keep_convolutions_quantizable():
+    names = [
+        "/model.0/conv/Conv",
+        "/model.22/cv2.0/cv2.0.0/conv/Conv",
+        "/model.22/cv3.2/cv3.2.2/Conv",
+        "/model.22/dfl/Softmax",
+        "/model.22/Concat_25",
+        "/model.22/Sigmoid",
+    ]
+
+    assert _head_decode_nodes(names) == ["/model.22/dfl/Softmax", "/model.22/Concat_25", "/model.22/Sigmoid"]
+
+
+def test_load_frames_samples_images_and_videos(tmp_path: Path):
+    for index in range(4):
+        cv2.imwrite(str(tmp_path / f"img{index}.jpg"), np.full((32, 48, 3), index * 40, dtype=np.uint8))
+    writer = cv2.VideoWriter(str(tmp_path / "clip.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 10, (48, 32))
+    for _ in range(20):
+        writer.write(np.zeros((32, 48, 3), dtype=np.uint8))
+    writer.release()
+
+    frames = load_frames(tmp_path, 6)
+
+    assert len(frames) == 6
+    assert all(frame.shape == (32, 48, 3) for frame in frames)
+    assert label_path(Path("data/images/val/a.jpg")) == Path("data/labels/val/a.txt")
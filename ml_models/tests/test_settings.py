@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from bushfire_ai.config.settings import Settings
+from bushfire_ai.config.settings import Settings, load_stream_configs
 
 
 def test_settings_requires_camara_vars(monkeypatch, tmp_path: Path):
@@ -26,7 +26,7 @@ def test_settings_requires_camara_vars(monkeypatch, tmp_path: Path):
     assert str(settings.camara.base_url) == "https://example.com/"
     assert settings.camara.client_id == "abc"
     assert settings.detection.target_classes == ["fire"]
-    assert settings.events.skip_frames_after_detection == 30
+    assert settings.tracking.update_interval_sec == 30.0
     assert settings.events.detection_mode == "store"
 
 
@@ -52,7 +52,7 @@ def test_settings_event_flags(monkeypatch, tmp_path: Path):
         "CAMARA_CLIENT_ID=abc\n"
         "CAMARA_CLIENT_SECRET=def\n"
         "DETECTION_MODE=view\n"
-        "SKIP_FRAMES_AFTER_DETECTION=45\n"
+        "TRACK_UPDATE_INTERVAL_SEC=45\n"
     )
 
     for key in [
@@ -61,11 +61,27 @@ def test_settings_event_flags(monkeypatch, tmp_path: Path):
         "CAMARA_CLIENT_ID",
         "CAMARA_CLIENT_SECRET",
         "DETECTION_MODE",
-        "SKIP_FRAMES_AFTER_DETECTION",
+        "TRACK_UPDATE_INTERVAL_SEC",
     ]:
         monkeypatch.delenv(key, raising=False)
 
     settings = Settings.from_env(env_path)
     assert settings.events.detection_mode == "view"
-    assert settings.events.skip_frames_after_detection == 45
+    assert settings.tracking.update_interval_sec == 45.0
 
+
+
+def test_load_stream_configs(tmp_path: Path):
+    sources = tmp_path / "sources.txt"
+    sources.write_text(
+        "# ground station A\n"
+        "rtsp://10.0.0.5/live drone-a\n"
+        "\n"
+        "videos/sweep.mp4 drone-b sweep\n"
+        "videos/sweep.mp4\n"
+    )
+
+    streams = load_stream_configs(sources)
+    assert [stream.name for stream in streams] == ["live", "sweep", "sweep-1"]
+    assert [stream.device_id for stream in streams] == ["drone-a", "drone-b", None]
+    assert streams[0].source == "rtsp://10.0.0.5/live"
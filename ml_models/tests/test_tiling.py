@@ -0,0 +1,60 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from bushfire_ai.detector.backends import InferenceBackend
+from bushfire_ai.detector.tiling import TiledInference, tile_grid
+
+
+class BrightSpotBackend(InferenceBackend):
+    """Reports the bounding box of pixels above 200 as one class-0 detection."""
+
+    names = {0: "fire"}
+
+    def __init__(self) -> None:
+        self.calls: List[int] = []
+
+    def infer(self, frames: Sequence[np.ndarray], confidence_threshold, iou_threshold, max_detections):
+        self.calls.append(len(frames))
+        rows = []
+        for frame in frames:
+            ys, xs = np.nonzero(frame[..., 0] > 200)
+            if xs.size == 0:
+                rows.append(np.empty((0, 6), dtype=np.float32))
+                continue
+            rows.append(np.array([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, 0.9, 0]], dtype=np.float32))
+        return rows
+
+
+def test_tile_grid_covers_frame_with_full_size_tiles():
+    tiles = tile_grid(1500, 700, 640, 0.2)
+
+    assert tiles[:, 0].tolist() == [0, 512, 860] * 2
+    assert tiles[:, 1].tolist() == [0, 0, 0, 60, 60, 60]
+    assert ((tiles[:, 2] - tiles[:, 0]) == 640).all()
+    assert tiles[:, 2].max() == 1500 and tiles[:, 3].max() == 700
+
+
+def test_tiled_inference_merges_duplicates_in_one_batch():
+    frame = np.zeros((700, 1500, 3), dtype=np.uint8)
+    frame[300:310, 600:610] = 255
+    backend = BrightSpotBackend()
+    tiler = TiledInference(tile_size=640, overlap=0.2, full_frame=False)
+
+    (rows,) = tiler.infer(backend, [frame], 0.5, 0.5, 10)
+
+    assert backend.calls == [6]
+    np.testing.assert_allclose(rows, [[600, 300, 610, 310, 0.9, 0]], rtol=1e-6)
+
+
+def test_prefilter_only_runs_tiles_near_candidates():
+    frame = np.zeros((700, 1500, 3), dtype=np.uint8)
+    frame[100:110, 100:110] = 255
+    backend = BrightSpotBackend()
+    tiler = TiledInference(tile_size=640, overlap=0.2, full_frame=True, prefilter_confidence=0.1)
+
+    (rows,) = tiler.infer(backend, [frame], 0.5, 0.5, 10)
+
+    assert backend.calls == [1, 2]
+    assert tiler.tiles_run == 2 and tiler.tiles_total == 6
+    assert rows.shape == (1, 6)
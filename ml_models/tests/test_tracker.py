@@ -0,0 +1,57 @@
+import numpy as np
+
+from bushfire_ai.detector.fire_detector import DetectionResult
+from bushfire_ai.pipeline.tracker import FireTracker
+
+FRAME = (720, 1280, 3)
+
+
+def detection(*rows):
+    data = np.array(rows, dtype=np.float32).reshape(-1, 6)
+    return DetectionResult(boxes=data[:, :4], confidences=data[:, 4], class_ids=data[:, 5], names={0: "fire"})
+
+
+def test_continuing_fire_raises_one_incident_and_batches_updates():
+    tracker = FireTracker(update_interval_sec=10.0)
+
+    kinds = []
+    for step in range(20):
+        shift = step * 2.0  # drifts slowly, always overlapping
+        events = tracker.update(detection([100 + shift, 100, 200 + shift, 180, 0.7, 0]), step * 1.0, FRAME)
+        kinds.extend(event.kind for event in events)
+
+    assert kinds == ["new"]
+    assert len(tracker.tracks) == 1
+    updates = tracker.due_updates(19.0)
+    assert [update["trackId"] for update in updates] == [1]
+    assert tracker.due_updates(19.5) == []
+
+
+def test_escalation_and_new_tracks():
+    tracker = FireTracker(confidence_jump=0.15, area_growth=2.0, max_missed_sec=2.0)
+    tracker.update(detection([100, 100, 200, 200, 0.6, 0]), 0.0, FRAME)
+
+    assert [e.kind for e in tracker.update(detection([100, 100, 200, 200, 0.8, 0]), 1.0, FRAME)] == ["escalation"]
+    assert [e.kind for e in tracker.update(detection([90, 90, 250, 250, 0.8, 0]), 2.0, FRAME)] == ["escalation"]
+    # a second, distant fire is a new track; the first keeps its id
+    events = tracker.update(detection([90, 90, 250, 250, 0.8, 0], [900, 500, 950, 550, 0.7, 0]), 3.0, FRAME)
+    assert [(e.kind, e.track.track_id) for e in events] == [("new", 2)]
+    # after the tracks expire the same fire is reported again
+    assert [e.kind for e in tracker.update(detection([100, 100, 200, 200, 0.6, 0]), 10.0, FRAME)] == ["new"]
+
+
+def test_zero_area_box_does_not_escalate_every_frame():
+    tracker = FireTracker(area_growth=2.0)
+    kinds = []
+    for step in range(4):
+        kinds.extend(event.kind for event in tracker.update(detection([100, 100, 100, 140, 0.7, 0]), step, FRAME))
+    assert kinds == ["new"]
+
+
+def test_expired_tracks_are_not_published_as_updates():
+    tracker = FireTracker(max_missed_sec=2.0, update_interval_sec=5.0)
+    tracker.update(detection([100, 100, 200, 180, 0.7, 0]), 0.0, FRAME)
+    tracker.update(detection([100, 100, 200, 180, 0.7, 0]), 1.0, FRAME)  # queued as a routine update
+    tracker.update(detection([900, 500, 950, 550, 0.7, 0]), 6.0, FRAME)  # the first track has expired
+
+    assert 1 not in tracker.tracks and tracker.due_updates(6.0) == []
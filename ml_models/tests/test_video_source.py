@@ -0,0 +1,106 @@
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from bushfire_ai.pipeline.video_source import Frame, FrameQueue, VideoSource
+
+
+def _write_video(path: Path, frames: int = 12) -> Path:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48))
+    for idx in range(frames):
+        writer.write(np.full((48, 64, 3), idx * 10, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _frame(index: int) -> Frame:
+    return Frame(data=np.zeros((1, 1, 3), dtype=np.uint8), timestamp=float(index), index=index)
+
+
+def test_frame_queue_latest_keeps_newest():
+    queue = FrameQueue(maxsize=4, policy="latest")
+    for idx in range(3):
+        queue.put(_frame(idx))
+    frame = queue.get(timeout=0)
+    assert frame is not None and frame.index == 2
+    assert frame.dropped_frames == 2
+
+
+def test_frame_queue_drop_oldest():
+    queue = FrameQueue(maxsize=2, policy="drop_oldest")
+    for idx in range(4):
+        queue.put(_frame(idx))
+    queue.close()
+    assert [queue.get().index, queue.get().index] == [2, 3]
+    assert queue.get() is None
+
+
+@pytest.mark.parametrize("mode", ["sync", "threaded"])
+def test_video_source_block_policy_yields_every_frame(tmp_path: Path, mode: str):
+    video = _write_video(tmp_path / "clip.avi")
+    source = VideoSource(str(video), capture_mode=mode, queue_size=2, drop_policy="block")
+
+    with source.stream() as frames:
+        collected = []
+        for frame in frames:
+            time.sleep(0.001)
+            collected.append(frame)
+
+    assert [frame.index for frame in collected] == list(range(12))
+    assert collected[-1].decoded_frames == 12
+    assert all(frame.dropped_frames == 0 for frame in collected)
+
+
+@pytest.mark.parametrize("capture_mode", ["sync", "threaded"])
+def test_decode_fps_grabs_frames_between_decodes(tmp_path, capture_mode):
+    video = _write_video(tmp_path / "clip.avi", frames=12)
+    source = VideoSource(str(video), capture_mode=capture_mode, queue_size=16, drop_policy="block", decode_fps=5.0)
+    with source.stream() as frames:
+        decoded = [(frame.index, round(frame.media_time, 3), int(frame.data[0, 0, 0])) for frame in frames]
+
+    assert [(index, pts) for index, pts, _ in decoded] == [(index, index / 10.0) for index in range(0, 12, 2)]
+    assert all(abs(value - index * 10) <= 4 for index, _, value in decoded)  # MJPG is lossy
+    assert source.grabbed_frames == 6 and source.decoded_frames == 6
+
+
+class _BlockingCapture:
+    """Stands in for an RTSP capture whose read is stuck on a network timeout."""
+
+    def __init__(self, *args):
+        self.unblock = threading.Event()
+        self.grabbing = threading.Event()
+        self.released = threading.Event()
+        self.released_while_grabbing = False
+
+    def isOpened(self):
+        return True
+
+    def grab(self):
+        self.grabbing.set()
+        self.unblock.wait()
+        self.grabbing.clear()
+        return False
+
+    def release(self):
+        self.released_while_grabbing = self.grabbing.is_set()
+        self.released.set()
+
+
+def test_close_leaves_release_to_a_stuck_capture_thread(monkeypatch):
+    captures = []
+    monkeypatch.setattr(cv2, "VideoCapture", lambda *args: captures.append(_BlockingCapture()) or captures[-1])
+    source = VideoSource("rtsp://camera/stream", capture_mode="threaded")
+    source.close_timeout = 0.05
+    source.open()
+    capture = captures[0]
+    assert capture.grabbing.wait(1.0)
+
+    source.close()
+    assert not capture.released.is_set()  # the thread is still inside grab()
+
+    capture.unblock.set()
+    assert capture.released.wait(1.0) and not capture.released_while_grabbing